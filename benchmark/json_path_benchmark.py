@@ -0,0 +1,58 @@
+"""
+Micro-benchmark of JSONPath lookups used by Extractor and body conditions.
+
+Run: python -m benchmark.json_path_benchmark
+"""
+
+import timeit
+
+from jsonpath_ng.ext import parse
+
+from src.util.api.json_path_util import JsonPath, matches_by_json_path
+
+_NUMBER = 20_000
+
+_BODY = {
+    "responseCode": 200,
+    "message": "User exists!",
+    "user": {"id": 1, "name": "John", "email": "john@example.com"},
+    "products": [
+        {
+            "id": i,
+            "name": f"Product {i}",
+            "price": f"Rs. {i * 100}",
+            "brand": {"brand": f"Brand {i % 8}"},
+            "category": {"usertype": {"usertype": "Women"}, "category": "Dress"},
+        }
+        for i in range(40)
+    ],
+}
+
+_PATHS = [
+    "responseCode",
+    "message",
+    "user.name",
+    JsonPath.PRODUCTS_RESPONSE_PRODUCTS,
+    JsonPath.PRODUCTS_RESPONSE_BRAND_TITLES,
+]
+
+
+def _uncached(data: dict, path: str) -> list:
+    return [match.value for match in parse(path).find(data)]
+
+
+def main() -> None:
+    print(f"{'path':<28}{'parse each call, us':>22}{'cached, us':>14}{'speed-up':>10}")
+    for path in _PATHS:
+        assert _uncached(_BODY, path) == matches_by_json_path(_BODY, path)
+
+        before = timeit.timeit(lambda: _uncached(_BODY, path), number=_NUMBER)
+        after = timeit.timeit(lambda: matches_by_json_path(_BODY, path), number=_NUMBER)
+
+        before_us = before / _NUMBER * 1e6
+        after_us = after / _NUMBER * 1e6
+        print(f"{path:<28}{before_us:>22.2f}{after_us:>14.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
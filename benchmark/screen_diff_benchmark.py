@@ -0,0 +1,77 @@
+"""
+Benchmark of screenshot comparison: previous PIL pipeline vs single-pass NumPy diff engine.
+
+Frames: 1920x1080 and the same page on DPR 2 (3840x2160), equal sizes and actual
+screenshot taller than the baseline (page grew by 10%).
+
+Run: python -m benchmark.screen_diff_benchmark
+"""
+
+import timeit
+
+import numpy as np
+from PIL import Image, ImageChops, ImageOps
+
+from src.util.screenshot.diff_engine import diff_images
+
+_NUMBER = 5
+_SIZES = {"1920x1080": (1920, 1080), "DPR 2, 3840x2160": (3840, 2160)}
+
+
+def _legacy_diff(expected: Image.Image, actual: Image.Image) -> tuple[int, Image.Image]:
+    """Previous implementation: normalize, difference, grayscale, eval, composite, count"""
+    expected, actual = expected.convert("RGB"), actual.convert("RGB")
+    if expected.size != actual.size:
+        size = (max(expected.width, actual.width), max(expected.height, actual.height))
+        canvas1 = Image.new("RGB", size, "white")
+        canvas2 = Image.new("RGB", size, "white")
+        canvas1.paste(expected, (0, 0))
+        canvas2.paste(actual, (0, 0))
+        expected, actual = canvas1, canvas2
+
+    diff = ImageOps.grayscale(ImageChops.difference(expected, actual)).convert("RGB")
+    mask = Image.eval(ImageOps.grayscale(diff), lambda x: 255 if x > 0 else 0)
+    colored = Image.composite(Image.new("RGB", expected.size, "red"), expected, mask)
+    diff_array = np.array(diff)
+    return int(np.count_nonzero(np.any(diff_array != 0, axis=-1))), colored
+
+
+def _frames(width: int, height: int, grow: float) -> tuple[Image.Image, Image.Image]:
+    rng = np.random.default_rng(42)
+    expected = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    actual = expected.copy()
+    # Changed blocks and 1-level noise (part of it is below grayscale rounding)
+    actual[height // 4 : height // 3, width // 5 : width // 2] //= 2
+    actual[::9, ::7] ^= 1
+    if grow:
+        extra = rng.integers(0, 256, (int(height * grow), width, 3), dtype=np.uint8)
+        actual = np.concatenate([actual, extra])
+    return Image.fromarray(expected), Image.fromarray(actual)
+
+
+def main() -> None:
+    print(f"{'frames':<40}{'legacy, ms':>12}{'numpy, ms':>12}{'speedup':>10}")
+    for title, (width, height) in _SIZES.items():
+        for case, grow in (("equal", 0.0), ("actual +10% height", 0.1)):
+            expected, actual = _frames(width, height, grow)
+
+            legacy_count, legacy_colored = _legacy_diff(expected, actual)
+            image_diff = diff_images(expected, actual)
+            assert image_diff.mismatch_count == legacy_count, (
+                image_diff.mismatch_count,
+                legacy_count,
+            )
+            assert np.array_equal(
+                np.asarray(image_diff.colored_diff), np.asarray(legacy_colored)
+            )
+
+            legacy = timeit.timeit(lambda: _legacy_diff(expected, actual), number=_NUMBER)
+            engine = timeit.timeit(lambda: diff_images(expected, actual), number=_NUMBER)
+            print(
+                f"{f'{title}, {case}':<40}{legacy / _NUMBER * 1000:>12.1f}"
+                f"{engine / _NUMBER * 1000:>12.1f}{legacy / engine:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
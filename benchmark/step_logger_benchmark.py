@@ -0,0 +1,90 @@
+"""
+Micro-benchmark of the per-call overhead of `step_log.log` decorated methods.
+
+Run: python -m benchmark.step_logger_benchmark
+"""
+
+import inspect
+import timeit
+from functools import wraps
+
+from src.model.enum.meta.log_level import LogLvl
+from src.util.allure import allure_scope
+from src.util.decorator.step_logger import SafeDict, StepLogger, step_log
+
+_NUMBER = 50_000
+
+URL = "https://automationexercise.com"
+
+
+def _legacy_log(message: str):
+    """Previous implementation: signature, instance vars and module constants on every call"""
+
+    def _decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound_args = inspect.signature(func).bind_partial(*args, **kwargs)
+            bound_args.apply_defaults()
+            context = SafeDict(bound_args.arguments)
+            self_obj = context.get("self")
+            if self_obj is not None:
+                context.update({f"self.{k}": v for k, v in vars(self_obj).items()})
+            module = inspect.getmodule(func)
+            context.update(
+                {
+                    name: value
+                    for name, value in module.__dict__.items()
+                    if name.isupper() and not callable(value)
+                }
+            )
+            with allure_scope.step(message.format_map(context)):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return _decorator
+
+
+class _Element:
+
+    def __init__(self):
+        self._element_title = "Login button"
+        self._locator = "#login"
+        self._timeout = 4.0
+
+    def bare(self, value: str, timeout: float = 1.0) -> str:
+        return value
+
+    @_legacy_log("Set [{self._element_title}] value [{value}] on {URL}")
+    def legacy(self, value: str, timeout: float = 1.0) -> str:
+        return value
+
+    @step_log.log("Set [{self._element_title}] value [{value}] on {URL}")
+    def compiled(self, value: str, timeout: float = 1.0) -> str:
+        return value
+
+    @step_log.log("Set [{self._element_title}] value [{value}]", log_level=LogLvl.DEBUG)
+    def debug(self, value: str, timeout: float = 1.0) -> str:
+        return value
+
+
+def main() -> None:
+    element = _Element()
+    calls = {
+        "undecorated": element.bare,
+        "legacy per-call formatting": element.legacy,
+        "compiled formatter": element.compiled,
+        f"DEBUG step (enabled={StepLogger.is_enabled(LogLvl.DEBUG)})": element.debug,
+    }
+
+    baseline = timeit.timeit(lambda: element.bare("text"), number=_NUMBER)
+    print(f"{'call':<36}{'us/call':>10}{'overhead, us':>14}")
+    for title, method in calls.items():
+        elapsed = timeit.timeit(lambda: method("text"), number=_NUMBER)
+        per_call = elapsed / _NUMBER * 1e6
+        overhead = (elapsed - baseline) / _NUMBER * 1e6
+        print(f"{title:<36}{per_call:>10.2f}{overhead:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
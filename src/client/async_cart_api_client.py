@@ -0,0 +1,39 @@
+from src.client.core.assertion import AssertableResponse
+from src.client.core.async_base_api_client import AsyncRestClient
+from src.config.config import CFG
+from src.model.enum.meta.content_type import ContentType
+from src.util.api.routes import ApiRoutes
+
+
+class AsyncCartApiClient(AsyncRestClient):
+
+    def __init__(self):
+        super().__init__(
+            base_url=CFG.base_url,
+            follow_redirects=True,
+            content_type=ContentType.URL_ENCODED,
+            api_log_lvl=CFG.api_log_lvl,
+        )
+
+    async def add_product_to_cart(
+        self, product_id: int, quantity: int
+    ) -> AssertableResponse:
+        params = {
+            "quantity": quantity,
+        }
+        return await self.get(
+            url=ApiRoutes.ADD_PRODUCT_TO_CART_PATTERN.path().format(
+                product_id=product_id
+            ),
+            params=params,
+        )
+
+    async def remove_product_from_cart(self, product_id: int) -> AssertableResponse:
+        return await self.get(
+            url=ApiRoutes.DELETE_PRODUCT_FROM_CART_PATTERN.path().format(
+                product_id=product_id
+            )
+        )
+
+    async def view_cart(self) -> AssertableResponse:
+        return await self.get(url=ApiRoutes.VIEW_CART.path())
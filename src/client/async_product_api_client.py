@@ -0,0 +1,27 @@
+from src.client.core.assertion import AssertableResponse
+from src.client.core.async_base_api_client import AsyncRestClient
+from src.config.config import CFG
+from src.model.enum.meta.content_type import ContentType
+from src.util.api.routes import ApiRoutes
+
+
+class AsyncProductApiClient(AsyncRestClient):
+
+    def __init__(self):
+        super().__init__(
+            base_url=CFG.base_api_url,
+            content_type=ContentType.URL_ENCODED
+        )
+
+    async def send_search_products_by_query_request(
+        self, query: str
+    ) -> AssertableResponse:
+        return await self.post(
+            url=ApiRoutes.SEARCH_PRODUCTS.path(),
+            data={
+                "search_product": query,
+            },
+        )
+
+    async def send_get_all_products_request(self) -> AssertableResponse:
+        return await self.get(ApiRoutes.PRODUCTS_LIST.path())
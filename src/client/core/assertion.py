@@ -2,19 +2,21 @@ from httpx import Response
 
 from src.client.core.condition.base import Condition
 from src.client.core.extractor import Extractor
+from src.client.core.response_document import ResponseDocument
 
 
 class AssertableResponse:
 
     def __init__(self, response: Response):
         self.response = response
+        self.document = ResponseDocument(response)
 
     def check(self, condition: Condition, *conditions: Condition) -> "AssertableResponse":
 
         invalid_checks = []
         all_conditions = [condition, *conditions]
         for c in all_conditions:
-            c_status, c_msg = c.check(self.response)
+            c_status, c_msg = c.check(self.document)
             if not c_status:
                 invalid_checks.append(f"\n{len(invalid_checks) + 1}. {c_msg}")
 
@@ -23,4 +25,4 @@ class AssertableResponse:
         return self
 
     def extract(self) -> Extractor:
-        return Extractor(self.response)
+        return Extractor(self.document)
@@ -0,0 +1,164 @@
+import logging
+import typing
+from abc import ABC
+from http import HTTPMethod
+from http.cookiejar import CookieJar
+
+import httpx
+from httpx import URL
+from httpx._client import UseClientDefault
+from httpx._types import (
+    QueryParamTypes,
+    HeaderTypes,
+    CookieTypes,
+    AuthTypes,
+    TimeoutTypes,
+    RequestExtensions,
+    RequestContent,
+    RequestData,
+    RequestFiles,
+)
+
+from src.client.core.assertion import AssertableResponse
+from src.client.core.exchange_logger import (
+    log_and_attach_request,
+    log_and_attach_response,
+)
+from src.client.core.transport_registry import HttpTransportRegistry
+from src.config.config import CFG
+from src.model.enum.meta.content_type import ContentType
+from src.model.enum.meta.log_level import ApiLogLvl, LogLvl
+from src.util.decorator.step_logger import step_log
+from src.util.profiler.step_profiler import StepProfiler
+from src.util.store.cookie_store import ThreadSafeCookieStore
+
+_MAX_TEST_SESSIONS = 8
+
+
+class AsyncRestClient(ABC):
+    """
+    Asynchronous counterpart of RestClient.
+
+    Async transports are bound to the event loop they were opened in, so the pool is owned
+    by the client instance. Close it with `aclose()` or use the client as `async with`.
+    """
+
+    USE_CLIENT_DEFAULT = UseClientDefault()
+
+    def __init__(
+        self,
+        base_url: str,
+        content_type: ContentType = ContentType.JSON,
+        user_agent: str = CFG.default_user_agent,
+        http2: bool = False,
+        follow_redirects: bool = True,
+        api_log_lvl: ApiLogLvl = CFG.api_log_lvl,
+        log_lvl: LogLvl = CFG.log_lvl,
+        timeout: float = CFG.http_timeout,
+    ):
+        self._base_url = base_url
+        self._follow_redirects = follow_redirects
+        self._content_type = content_type
+        self._api_log_lvl = api_log_lvl
+        self._log_lvl = log_lvl
+
+        headers = {"Content-Type": content_type.mime_type}
+        if user_agent is not None:
+            headers["User-Agent"] = user_agent
+
+        self._transport = httpx.AsyncHTTPTransport(
+            http2=http2, limits=HttpTransportRegistry.limits()
+        )
+        self._client_kwargs = dict(
+            base_url=base_url,
+            follow_redirects=follow_redirects,
+            headers=headers,
+            timeout=timeout,
+            transport=self._transport,
+        )
+        self._sessions: dict[CookieJar, httpx.AsyncClient] = {}
+
+    async def __aenter__(self) -> typing.Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._sessions.clear()
+        await self._transport.aclose()
+
+    def _session(self) -> httpx.AsyncClient:
+        """httpx client bound to the cookie jar of the current test"""
+        jar = ThreadSafeCookieStore().get_jar()
+        client = self._sessions.get(jar)
+        if client is None:
+            if len(self._sessions) >= _MAX_TEST_SESSIONS:
+                # Not closed: transport is shared
+                del self._sessions[next(iter(self._sessions))]
+            client = httpx.AsyncClient(cookies=jar, **self._client_kwargs)
+            self._sessions[jar] = client
+        return client
+
+    async def get(self, url: URL | str, **kwargs) -> AssertableResponse:
+        return await self.__send(HTTPMethod.GET, url, **kwargs)
+
+    async def post(self, url: URL | str, **kwargs) -> AssertableResponse:
+        return await self.__send(HTTPMethod.POST, url, **kwargs)
+
+    async def put(self, url: URL | str, **kwargs) -> AssertableResponse:
+        return await self.__send(HTTPMethod.PUT, url, **kwargs)
+
+    async def patch(self, url: URL | str, **kwargs) -> AssertableResponse:
+        return await self.__send(HTTPMethod.PATCH, url, **kwargs)
+
+    async def delete(self, url: URL | str, **kwargs) -> AssertableResponse:
+        return await self.__send(HTTPMethod.DELETE, url, **kwargs)
+
+    async def __send(
+        self,
+        method: HTTPMethod,
+        url: URL,
+        *,
+        content: RequestContent | None = None,
+        data: RequestData | None = None,
+        files: RequestFiles | None = None,
+        json: typing.Any | None = None,
+        params: QueryParamTypes | None = None,
+        headers: HeaderTypes | None = None,
+        cookies: CookieTypes | None = None,
+        auth: AuthTypes | UseClientDefault | None = USE_CLIENT_DEFAULT,
+        follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+        timeout: TimeoutTypes | UseClientDefault = USE_CLIENT_DEFAULT,
+        extensions: RequestExtensions | None = None,
+    ):
+        async with step_log.log(f"Send request [{method.name}]: {url}"):
+            try:
+                if cookies is not None:
+                    ThreadSafeCookieStore().update_cookies(cookies)
+
+                # Sending request. Response cookies are saved to the test cookie jar by httpx
+                with StepProfiler().span(f"{method.name} {url}", category="http"):
+                    response = await self._session().request(
+                        method=method.name,
+                        url=url,
+                        content=content,
+                        data=data,
+                        files=files,
+                        json=json,
+                        params=params,
+                        headers=headers,
+                        auth=auth,
+                        follow_redirects=follow_redirects,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+
+                log_and_attach_request(response.request, self._api_log_lvl)
+                log_and_attach_response(response, self._api_log_lvl)
+
+                return AssertableResponse(response)
+
+            except httpx.HTTPError as e:
+                logging.exception(f"HTTP request failed: {e}")
+                raise
@@ -1,12 +1,12 @@
 import logging
+import threading
 import typing
 from abc import ABC
 from http import HTTPMethod
+from http.cookiejar import CookieJar
 
-import allure
 import httpx
-from allure_commons.types import AttachmentType
-from httpx import Response, Request, URL
+from httpx import URL
 from httpx._client import UseClientDefault
 from httpx._types import (
     QueryParamTypes,
@@ -21,13 +21,20 @@ from httpx._types import (
 )
 
 from src.client.core.assertion import AssertableResponse
+from src.client.core.exchange_logger import (
+    log_and_attach_request,
+    log_and_attach_response,
+)
+from src.client.core.transport_registry import HttpTransportRegistry
 from src.config.config import CFG
 from src.model.enum.meta.content_type import ContentType
 from src.model.enum.meta.log_level import ApiLogLvl, LogLvl
 from src.util.decorator.step_logger import step_log
-from src.util.api.httpx_log_formatter_util import format_request, format_response
+from src.util.profiler.step_profiler import StepProfiler
 from src.util.store.cookie_store import ThreadSafeCookieStore
 
+_MAX_TEST_SESSIONS = 8
+
 
 class RestClient(ABC):
     USE_CLIENT_DEFAULT = UseClientDefault()
@@ -53,13 +60,31 @@ class RestClient(ABC):
         if user_agent is not None:
             headers["User-Agent"] = user_agent
 
-        self._client = httpx.Client(
+        # Connection pool is shared between all clients with the same base url
+        self._client_kwargs = dict(
             base_url=base_url,
             follow_redirects=follow_redirects,
-            http2=http2,
             headers=headers,
             timeout=timeout,
+            transport=HttpTransportRegistry().get_transport(base_url, http2),
         )
+        self._sessions: dict[CookieJar, httpx.Client] = {}
+        self._sessions_lock = threading.Lock()
+
+    def _session(self) -> httpx.Client:
+        """httpx client bound to the cookie jar of the current test"""
+        jar = ThreadSafeCookieStore().get_jar()
+        client = self._sessions.get(jar)
+        if client is None:
+            with self._sessions_lock:
+                client = self._sessions.get(jar)
+                if client is None:
+                    if len(self._sessions) >= _MAX_TEST_SESSIONS:
+                        # Not closed: transport is shared
+                        del self._sessions[next(iter(self._sessions))]
+                    client = httpx.Client(cookies=jar, **self._client_kwargs)
+                    self._sessions[jar] = client
+        return client
 
     def get(self, url: URL | str, **kwargs):
         return self.__send(HTTPMethod.GET, url, **kwargs)
@@ -76,6 +101,26 @@ class RestClient(ABC):
     def delete(self, url: URL | str, **kwargs):
         return self.__send(HTTPMethod.DELETE, url, **kwargs)
 
+    def get_streamed(self, url: URL | str, **kwargs) -> httpx.Response:
+        """
+        GET with the body not read: iterate `iter_bytes()` and `close()` the response.
+        Only the request is logged, the body is never held in memory.
+        """
+        with step_log.log(f"Send streamed request [GET]: {url}"):
+            try:
+                with StepProfiler().span(f"GET {url}", category="http"):
+                    session = self._session()
+                    response = session.send(
+                        session.build_request(method=HTTPMethod.GET.name, url=url, **kwargs),
+                        stream=True,
+                    )
+                log_and_attach_request(response.request, self._api_log_lvl)
+                return response
+
+            except httpx.HTTPError as e:
+                logging.exception(f"HTTP request failed: {e}")
+                raise
+
     def __send(
         self,
         method: HTTPMethod,
@@ -97,56 +142,29 @@ class RestClient(ABC):
             try:
                 if cookies is not None:
                     ThreadSafeCookieStore().update_cookies(cookies)
-                test_cookies = ThreadSafeCookieStore().export_as_httpx_cookies()
-
-                # Sending request
-                response = self._client.request(
-                    method=method.name,
-                    url=url,
-                    content=content,
-                    data=data,
-                    files=files,
-                    json=json,
-                    params=params,
-                    headers=headers,
-                    cookies=test_cookies,
-                    auth=auth,
-                    follow_redirects=follow_redirects,
-                    timeout=timeout,
-                    extensions=extensions,
-                )
-
-                ThreadSafeCookieStore().update_from_response(response)
-
-                self.__log_and_attach_request(response.request)
-                self.__log_and_attach_response(response)
+
+                # Sending request. Response cookies are saved to the test cookie jar by httpx
+                with StepProfiler().span(f"{method.name} {url}", category="http"):
+                    response = self._session().request(
+                        method=method.name,
+                        url=url,
+                        content=content,
+                        data=data,
+                        files=files,
+                        json=json,
+                        params=params,
+                        headers=headers,
+                        auth=auth,
+                        follow_redirects=follow_redirects,
+                        timeout=timeout,
+                        extensions=extensions,
+                    )
+
+                log_and_attach_request(response.request, self._api_log_lvl)
+                log_and_attach_response(response, self._api_log_lvl)
 
                 return AssertableResponse(response)
 
             except httpx.HTTPError as e:
                 logging.exception(f"HTTP request failed: {e}")
                 raise
-
-    def __log_and_attach_request(self, request: Request):
-        try:
-            log = format_request(request, self._api_log_lvl)
-            logging.info(f"Request\n\n{log}\n")
-            allure.attach(body=log, name="Request", attachment_type=AttachmentType.TEXT)
-        except Exception as ex:
-            logging.warn(
-                "!!! FAILED TO ADD REQUEST ATTACHMENT TO ALLURE. "
-                f"IF EXCEPTION IS NONE - ALLURE LIFECYCLE IS NOT ACTIVE. EXCEPTION: {ex}"
-            )
-
-    def __log_and_attach_response(self, response: Response):
-        try:
-            log = format_response(response, self._api_log_lvl)
-            logging.info(f"Response\n\n{log}\n")
-            allure.attach(
-                body=log, name="Response", attachment_type=AttachmentType.TEXT
-            )
-        except Exception as ex:
-            logging.warn(
-                "!!! FAILED TO ADD RESPONSE ATTACHMENT TO ALLURE. "
-                f"IF EXCEPTION IS NONE - ALLURE LIFECYCLE IS NOT ACTIVE. EXCEPTION: {ex}"
-            )
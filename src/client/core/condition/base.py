@@ -3,11 +3,13 @@ from typing import Tuple
 
 from httpx import Response
 
+from src.client.core.response_document import ResponseDocument
+
 
 class Condition(ABC):
 
     @abstractmethod
-    def check(self, response: Response) -> Tuple[bool, str]:
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
         pass
 
     @abstractmethod
@@ -5,7 +5,7 @@ from httpx import Response
 
 from src.client.core.condition.base import Condition
 from src.client.core.extractor import Extractor
-from src.util.api.json_path_util import matches_by_json_path
+from src.client.core.response_document import ResponseDocument
 
 
 class BodyFieldExistsCondition(Condition):
@@ -13,9 +13,9 @@ class BodyFieldExistsCondition(Condition):
     def __init__(self, path: str):
         self.path = path
 
-    def check(self, response: Response) -> Tuple[bool, str]:
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
         try:
-            response.json().get(self.path)
+            ResponseDocument.of(response).json().get(self.path)
             return True, ""
         except Exception:
             return (
@@ -33,7 +33,7 @@ class BodyFieldEqualsCondition(Condition):
         self.path = path
         self.expected = expected_value
 
-    def check(self, response: Response) -> Tuple[bool, str]:
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
         actual = Extractor(response).as_value(self.path)
         if actual == self.expected:
             return True, ""
@@ -61,7 +61,7 @@ class BodyFieldNotEqualsCondition(Condition):
         else:
             self.text = f"in: {str(self.expected)}"
 
-    def check(self, response: Response) -> Tuple[bool, str]:
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
         actual = Extractor(response).as_value(self.path)
         if actual in self.expected:
             return (
@@ -87,9 +87,8 @@ class BodyArrayHasSizeCondition(Condition):
         self.path = path
         self.expected = count
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        body = response.json()
-        actual = len(matches_by_json_path(body, self.path))
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = len(ResponseDocument.of(response).matches(self.path))
 
         if self.expected != actual:
             return (
@@ -116,9 +115,8 @@ class BodyArrayIsEmptyCondition(Condition):
 
         self.path = path
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        body = response.json()
-        actual = matches_by_json_path(body, self.path)
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = ResponseDocument.of(response).matches(self.path)
 
         if not actual:
             return True, ""
@@ -138,9 +136,8 @@ class BodyArrayContainsCondition(Condition):
         self.path = path
         self.expected = [expected_value, *expected_values]
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        body = response.json()
-        actual = matches_by_json_path(body, self.path)
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = ResponseDocument.of(response).matches(self.path)
 
         missing = [v for v in self.expected if v not in actual]
 
@@ -164,9 +161,8 @@ class BodyArrayNotContainsCondition(Condition):
         self.path = path
         self.expected = [expected_value, *expected_values]
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        body = response.json()
-        actual = matches_by_json_path(body, self.path)
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = ResponseDocument.of(response).matches(self.path)
 
         exist = [v for v in self.expected if v in actual]
 
@@ -190,8 +186,8 @@ class BodyArrayHasCondition(Condition):
         self.path = path
         self.expected = [expected_value, *expected_values]
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        actual = matches_by_json_path(response.json(), self.path)
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = ResponseDocument.of(response).matches(self.path)
 
         if len(self.expected) != len(actual):
             return (
@@ -226,8 +222,8 @@ class BodyArrayHasOrderedCondition(Condition):
         self.path = path
         self.expected = [expected_value, *expected_values]
 
-    def check(self, response: Response) -> Tuple[bool, str]:
-        actual = matches_by_json_path(response.json(), self.path)
+    def check(self, response: Response | ResponseDocument) -> Tuple[bool, str]:
+        actual = ResponseDocument.of(response).matches(self.path)
 
         if len(self.expected) != len(actual):
             return (
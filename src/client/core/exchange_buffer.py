@@ -0,0 +1,145 @@
+import json
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+
+from httpx import Headers, Request, RequestNotRead, Response
+
+from src.config.config import CFG
+from src.util.allure.allure_scope import is_allure_suppressed
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+
+_HAR_CREATOR = {"name": "automation-exercise-py", "version": "1.0"}
+
+
+class ExchangeBuffer:
+    """
+    Last API_EXCHANGE_BUFFER_SIZE raw HTTP exchanges of every test,
+    used with API_ALLURE_ATTACH_MODE=on_failure instead of per-request attachments.
+
+    Nothing is formatted while the test runs: `pop()` returns exchanges of the finished test,
+    and they are attached to Allure as a single HAR file only if needed (see tests/conftest.py).
+    """
+
+    _instance: Optional["ExchangeBuffer"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._exchanges = {}
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return CFG.api_allure_attach_mode == "on_failure"
+
+    def add(self, response: Response) -> None:
+        if is_allure_suppressed():
+            return
+
+        test_name = ThreadSafeTestThreadsStore().current_thread_test_name()
+        exchanges = self._exchanges.get(test_name)
+        if exchanges is None:
+            with self._lock:
+                exchanges = self._exchanges.setdefault(
+                    test_name, deque(maxlen=CFG.api_exchange_buffer_size)
+                )
+        # deque.append is thread-safe, the oldest exchange is dropped when the buffer is full
+        exchanges.append((datetime.now(timezone.utc), response))
+
+    def pop(self, test_name: str) -> list[tuple[datetime, Response]]:
+        with self._lock:
+            exchanges = self._exchanges.pop(test_name, None)
+        return list(exchanges) if exchanges else []
+
+
+def to_har(exchanges: list[tuple[datetime, Response]], max_body_size: int) -> str:
+    """HAR 1.2 log. Redirects are separate entries, bodies are cut to `max_body_size` chars"""
+    entries = []
+    for finished_at, response in exchanges:
+        for hop in [*response.history, response]:
+            entries.append(_to_har_entry(finished_at, hop, max_body_size))
+    return json.dumps(
+        {"log": {"version": "1.2", "creator": _HAR_CREATOR, "entries": entries}},
+        ensure_ascii=False,
+        indent=2,
+    )
+
+
+def _to_har_entry(finished_at: datetime, response: Response, max_body_size: int) -> dict:
+    request = response.request
+    elapsed_ms = response.elapsed.total_seconds() * 1000 if _has_elapsed(response) else 0
+    started_at = finished_at.timestamp() - elapsed_ms / 1000
+
+    return {
+        "startedDateTime": datetime.fromtimestamp(started_at, timezone.utc).isoformat(),
+        "time": elapsed_ms,
+        "request": _to_har_request(request, max_body_size),
+        "response": {
+            "status": response.status_code,
+            "statusText": response.reason_phrase,
+            "httpVersion": response.http_version,
+            "headers": _to_har_headers(response.headers),
+            "cookies": [],
+            "content": {
+                "size": len(response.content),
+                "mimeType": response.headers.get("Content-Type", ""),
+                "text": _cut(response.text, max_body_size),
+            },
+            "redirectURL": response.headers.get("Location", ""),
+            "headersSize": -1,
+            "bodySize": len(response.content),
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": elapsed_ms, "receive": 0},
+    }
+
+
+def _to_har_request(request: Request, max_body_size: int) -> dict:
+    try:
+        body = request.content
+    except RequestNotRead:
+        # Streamed (e.g. multipart) body is not kept by httpx
+        body = b""
+
+    har_request = {
+        "method": request.method,
+        "url": str(request.url),
+        "httpVersion": "HTTP/1.1",
+        "headers": _to_har_headers(request.headers),
+        "queryString": [
+            {"name": name, "value": value}
+            for name, value in request.url.params.multi_items()
+        ],
+        "cookies": [],
+        "headersSize": -1,
+        "bodySize": len(body),
+    }
+    if body:
+        har_request["postData"] = {
+            "mimeType": request.headers.get("Content-Type", ""),
+            "text": _cut(body.decode("utf-8", errors="replace"), max_body_size),
+        }
+    return har_request
+
+
+def _to_har_headers(headers: Headers) -> list[dict]:
+    return [{"name": name, "value": value} for name, value in headers.multi_items()]
+
+
+def _has_elapsed(response: Response) -> bool:
+    try:
+        response.elapsed
+        return True
+    except RuntimeError:
+        return False
+
+
+def _cut(text: str, max_size: int) -> str:
+    if max_size <= 0 or len(text) <= max_size:
+        return text
+    return f"{text[:max_size]}\n... [truncated: {len(text) - max_size} more chars]"
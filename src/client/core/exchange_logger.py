@@ -0,0 +1,88 @@
+import logging
+import time
+from typing import Callable
+
+from allure_commons.types import AttachmentType
+from httpx import Request, Response
+
+from src.client.core.exchange_buffer import ExchangeBuffer
+from src.config.config import CFG
+from src.model.enum.meta.log_level import ApiLogLvl
+from src.util.allure.allure_scope import is_allure_reporting
+from src.util.allure.attachment_writer import AttachmentWriter
+from src.util.api.httpx_log_formatter_util import format_request, format_response
+
+
+class _LazyLog:
+    """Formats the exchange on first `str()` and caches the result."""
+
+    def __init__(self, title: str, formatter: Callable[[], str]):
+        self._title = title
+        self._formatter = formatter
+        self._text = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            started_at = time.perf_counter()
+            self._text = self._formatter()
+            logging.debug(
+                "%s formatted in %.2f ms",
+                self._title,
+                (time.perf_counter() - started_at) * 1000,
+            )
+        return self._text
+
+
+def log_and_attach_request(request: Request, api_log_lvl: ApiLogLvl) -> None:
+    __log_and_attach(
+        "Request",
+        lambda: format_request(
+            request,
+            api_log_lvl,
+            CFG.api_log_max_body_size,
+            CFG.api_log_html_pretty_max_size,
+        ),
+        api_log_lvl,
+    )
+
+
+def log_and_attach_response(response: Response, api_log_lvl: ApiLogLvl) -> None:
+    if api_log_lvl != ApiLogLvl.NONE and ExchangeBuffer.is_enabled():
+        ExchangeBuffer().add(response)
+    __log_and_attach(
+        "Response",
+        lambda: format_response(
+            response,
+            api_log_lvl,
+            CFG.api_log_max_body_size,
+            CFG.api_log_html_pretty_max_size,
+        ),
+        api_log_lvl,
+    )
+
+
+def __log_and_attach(
+    title: str, formatter: Callable[[], str], api_log_lvl: ApiLogLvl
+) -> None:
+    if api_log_lvl == ApiLogLvl.NONE:
+        return
+
+    log_enabled = logging.getLogger().isEnabledFor(logging.INFO)
+    # on_failure: exchanges are attached from ExchangeBuffer after the test
+    allure_active = CFG.api_allure_attach_mode == "each" and is_allure_reporting()
+    if not log_enabled and not allure_active:
+        return
+
+    log = _LazyLog(title, formatter)
+    try:
+        # Formatting is deferred until some handler emits the record
+        logging.info("%s\n\n%s\n", title, log)
+        if allure_active:
+            AttachmentWriter().attach(
+                body=log.__str__, name=title, attachment_type=AttachmentType.TEXT
+            )
+    except Exception as ex:
+        logging.warn(
+            f"!!! FAILED TO ADD {title.upper()} ATTACHMENT TO ALLURE. "
+            f"IF EXCEPTION IS NONE - ALLURE LIFECYCLE IS NOT ACTIVE. EXCEPTION: {ex}"
+        )
@@ -3,19 +3,22 @@ from typing import Type, TypeVar, List, Any
 
 import six
 from httpx import Response
+from pydantic import ValidationError
 
 from src.ex.exception import (
     DeserializationError,
 )
-from src.util.api.json_path_util import matches_by_json_path
+from src.client.core.response_document import ResponseDocument
+from src.util.api.type_adapter_util import validate_json_by_path
 
 T = TypeVar("T")
 
 
 class Extractor:
 
-    def __init__(self, response: Response):
-        self.response = response
+    def __init__(self, response: Response | ResponseDocument):
+        self.document = ResponseDocument.of(response)
+        self.response = self.document.response
 
     def status_code(self) -> int:
         return self.response.status_code
@@ -37,7 +40,7 @@ class Extractor:
         .as_value("responseStatus") - extract response status
         .as_value("users[0].first_name") - extract first user first name
         """
-        matches = matches_by_json_path(self.response.json(), json_path)
+        matches = self.document.matches(json_path)
         if not matches:
             raise KeyError(f"Not found in json key by json path: {json_path}")
         if len(matches) > 1:
@@ -52,7 +55,12 @@ class Extractor:
         self.__validate_path_not_contains_array_symbol(path)
         self.__validate_cls_not_collection(cls)
 
-        matches = matches_by_json_path(self.response.json(), path)
+        try:
+            return validate_json_by_path(self.response.content, cls, path, many=False)
+        except (LookupError, ValidationError):
+            pass
+
+        matches = self.document.matches(path)
         if not matches:
             raise KeyError(f"Not found in json key by path: {path}")
         if len(matches) > 1:
@@ -75,10 +83,15 @@ class Extractor:
         self.__validate_path_contains_array_symbol(path)
         self.__validate_cls_not_collection(cls)
 
+        try:
+            return validate_json_by_path(self.response.content, cls, path, many=True)
+        except (LookupError, ValidationError):
+            pass
+
         data = (
-            self.response.json()
+            self.document.json()
             if path is None
-            else matches_by_json_path(self.response.json(), path)
+            else self.document.matches(path)
         )
         if not isinstance(data, Iterable) or isinstance(data, six.string_types):
             raise TypeError(
@@ -95,7 +108,7 @@ class Extractor:
             )
 
     def as_json(self) -> dict:
-        return self.response.json()
+        return self.document.json()
 
     def content_as_bytes(self) -> bytes:
         return self.response.content
@@ -0,0 +1,44 @@
+from typing import Any
+
+from httpx import Response
+
+from src.util.api.json_path_util import matches_by_json_path
+
+_NOT_PARSED = object()
+
+
+class ResponseDocument:
+    """
+    httpx.Response wrapper with a lazily decoded, memoised JSON body.
+
+    The body is decoded once and JSONPath matches are memoised per path, so all conditions
+    and extractors of one AssertableResponse share a single parse. Other attributes
+    (status_code, headers, cookies, ...) are delegated to the wrapped response.
+    Values returned from `json()` and `matches()` are shared - don't mutate them.
+    """
+
+    def __init__(self, response: Response):
+        self.response = response
+        self._json = _NOT_PARSED
+        self._matches: dict[str, list] = {}
+
+    @staticmethod
+    def of(response: "Response | ResponseDocument") -> "ResponseDocument":
+        if isinstance(response, ResponseDocument):
+            return response
+        return ResponseDocument(response)
+
+    def json(self) -> Any:
+        if self._json is _NOT_PARSED:
+            self._json = self.response.json()
+        return self._json
+
+    def matches(self, path: str) -> list:
+        matches = self._matches.get(path)
+        if matches is None:
+            matches = matches_by_json_path(self.json(), path)
+            self._matches[path] = matches
+        return list(matches)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.response, item)
@@ -0,0 +1,58 @@
+import atexit
+import threading
+from typing import Optional
+
+import httpx
+
+from src.config.config import CFG
+
+
+class HttpTransportRegistry:
+    """
+    Process-wide, thread-safe registry of pooled httpx transports.
+
+    Every RestClient with the same base url (and http2 flag) shares one transport,
+    so TCP/TLS connections opened by one service instance are reused by all others.
+    """
+
+    _instance: Optional["HttpTransportRegistry"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._transports = {}
+                    atexit.register(cls._instance.close_all)
+        return cls._instance
+
+    @staticmethod
+    def limits() -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=CFG.http_max_connections,
+            max_keepalive_connections=CFG.http_max_keepalive_connections,
+            keepalive_expiry=CFG.http_keepalive_expiry,
+        )
+
+    def get_transport(self, base_url: str, http2: bool = False) -> httpx.HTTPTransport:
+        key = (base_url.rstrip("/"), http2)
+        transport = self._transports.get(key)
+        if transport is not None:
+            return transport
+
+        with self._lock:
+            if key not in self._transports:
+                self._transports[key] = httpx.HTTPTransport(
+                    http2=http2,
+                    limits=self.limits(),
+                )
+            return self._transports[key]
+
+    def close_all(self) -> None:
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+
+        for transport in transports:
+            transport.close()
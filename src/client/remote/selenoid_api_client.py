@@ -1,5 +1,7 @@
 from urllib.parse import urlparse
 
+import httpx
+
 from src.client.core.assertion import AssertableResponse
 from src.client.core.base_api_client import RestClient
 from src.config.config import CFG
@@ -36,11 +38,11 @@ class SelenoidApiClient(RestClient):
     ) -> AssertableResponse:
         return self.delete(url=f"/download/{session_id}/{file_name}")
 
-    def send_get_video_by_title_request(
+    def send_get_video_stream_by_title_request(
         self,
         video_title: str,
-    ) -> AssertableResponse:
-        return self.get(url=f"/video/{video_title}.mp4")
+    ) -> httpx.Response:
+        return self.get_streamed(url=f"/video/{video_title}.mp4")
 
     def send_status_request(
         self,
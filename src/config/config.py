@@ -18,6 +18,8 @@ from src.model.enum.remote_type import RemoteType
 from src.util import system_util
 
 _AVAILABLE_ENV = Literal["local", "docker", "ci"]
+_ELEMENT_SCREENSHOT_MODE = Literal["element", "cdp", "crop"]
+_API_ALLURE_ATTACH_MODE = Literal["each", "on_failure"]
 
 
 class NonEmptySettingsSourceMixin(EnvSettingsSource):
@@ -153,6 +155,46 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("HTTP_TIMEOUT"),
         default=15.0,
     )
+    http_max_connections: int = Field(
+        validation_alias=AliasChoices("HTTP_MAX_CONNECTIONS"),
+        default=20,
+    )
+    http_max_keepalive_connections: int = Field(
+        validation_alias=AliasChoices("HTTP_MAX_KEEPALIVE_CONNECTIONS"),
+        default=10,
+    )
+    http_keepalive_expiry: float = Field(
+        validation_alias=AliasChoices("HTTP_KEEPALIVE_EXPIRY"),
+        default=30.0,
+    )
+    bulk_api_workers: int = Field(
+        validation_alias=AliasChoices("BULK_API_WORKERS"),
+        default=10,
+    )
+    user_pool_size: int = Field(
+        validation_alias=AliasChoices("USER_POOL_SIZE"),
+        default=2,
+    )
+    user_cleanup_async: bool = Field(
+        validation_alias=AliasChoices("USER_CLEANUP_ASYNC"),
+        default=True,
+    )
+    user_cleanup_retries: int = Field(
+        validation_alias=AliasChoices("USER_CLEANUP_RETRIES"),
+        default=3,
+    )
+    user_cleanup_flush_timeout: float = Field(
+        validation_alias=AliasChoices("USER_CLEANUP_FLUSH_TIMEOUT"),
+        default=120.0,
+    )
+    auth_session_ttl: int = Field(
+        validation_alias=AliasChoices("AUTH_SESSION_TTL"),
+        default=600,
+    )
+    auth_session_cache_shared: bool = Field(
+        validation_alias=AliasChoices("AUTH_SESSION_CACHE_SHARED"),
+        default=True,
+    )
 
     # COOKIES
     csrf_cookie_title: str = Field(default="csrftoken")
@@ -177,6 +219,18 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("DEFAULT_SCREENSHOT_TIMEOUT"),
         default=0.1,
     )
+    element_screenshot_mode: _ELEMENT_SCREENSHOT_MODE = Field(
+        validation_alias=AliasChoices("ELEMENT_SCREENSHOT_MODE"),
+        default="crop",
+    )
+    screenshot_baseline_cache_size: int = Field(
+        validation_alias=AliasChoices("SCREENSHOT_BASELINE_CACHE_SIZE"),
+        default=256 * 1024 * 1024,
+    )
+    screenshot_diff_workers: int = Field(
+        validation_alias=AliasChoices("SCREENSHOT_DIFF_WORKERS"),
+        default=0,
+    )
     allure_attach_test_artifacts: str = Field(
         validation_alias=AliasChoices("ALLURE_ATTACH_TEST_ARTIFACTS"),
         default="failed",
@@ -185,6 +239,22 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("ALLURE_ATTACH_TEST_VIDEO"),
         default="failed",
     )
+    allure_attachment_workers: int = Field(
+        validation_alias=AliasChoices("ALLURE_ATTACHMENT_WORKERS"),
+        default=2,
+    )
+    allure_max_text_attachment_size: int = Field(
+        validation_alias=AliasChoices("ALLURE_MAX_TEXT_ATTACHMENT_SIZE"),
+        default=1024 * 1024,
+    )
+    allure_max_image_attachment_size: int = Field(
+        validation_alias=AliasChoices("ALLURE_MAX_IMAGE_ATTACHMENT_SIZE"),
+        default=20 * 1024 * 1024,
+    )
+    allure_max_video_attachment_size: int = Field(
+        validation_alias=AliasChoices("ALLURE_MAX_VIDEO_ATTACHMENT_SIZE"),
+        default=200 * 1024 * 1024,
+    )
     expected_product_id: int = Field(
         validation_alias=AliasChoices("EXPECTED_PRODUCT_ID"),
         default=3,
@@ -197,6 +267,10 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("RECOMMENDED_PRODUCT_IDS"),
         default={1, 2, 3, 5, 8},
     )
+    catalog_snapshot_ttl: int = Field(
+        validation_alias=AliasChoices("CATALOG_SNAPSHOT_TTL"),
+        default=3600,
+    )
     expected_credit_card: CardInfo = Field(
         validation_alias=AliasChoices("EXPECTED_CREDIT_CARD")
     )
@@ -217,6 +291,30 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("API_LOG_LVL"),
         default=ApiLogLvl.HEADERS,
     )
+    api_log_max_body_size: int = Field(
+        validation_alias=AliasChoices("API_LOG_MAX_BODY_SIZE"),
+        default=64 * 1024,
+    )
+    api_log_html_pretty_max_size: int = Field(
+        validation_alias=AliasChoices("API_LOG_HTML_PRETTY_MAX_SIZE"),
+        default=16 * 1024,
+    )
+    api_allure_attach_mode: _API_ALLURE_ATTACH_MODE = Field(
+        validation_alias=AliasChoices("API_ALLURE_ATTACH_MODE"),
+        default="each",
+    )
+    api_exchange_buffer_size: int = Field(
+        validation_alias=AliasChoices("API_EXCHANGE_BUFFER_SIZE"),
+        default=50,
+    )
+    step_profiler: bool = Field(
+        validation_alias=AliasChoices("STEP_PROFILER"),
+        default=False,
+    )
+    step_profiler_top: int = Field(
+        validation_alias=AliasChoices("STEP_PROFILER_TOP"),
+        default=20,
+    )
 
     # GITHUB
     github_api_url: str = Field(
@@ -267,6 +365,8 @@ class Settings(BaseSettings):
         "browser_page_load_strategy",
         "default_email",
         "allure_attach_test_artifacts",
+        "api_allure_attach_mode",
+        "element_screenshot_mode",
         "email_domain",
         mode="before",
     )
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from src.model.category import Category
 from src.model.dto.product.product_response import ProductResponseDTO
 from src.model.price import Price
@@ -19,5 +21,5 @@ class ProductMapper:
         )
 
     @staticmethod
-    def to_products(dtos: list[ProductResponseDTO]) -> list[Product]:
+    def to_products(dtos: Iterable[ProductResponseDTO]) -> list[Product]:
         return [ProductMapper.to_product(product) for product in dtos]
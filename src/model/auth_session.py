@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AuthSession:
+    email: str
+    csrf: str
+    session_id: str
+    expires_at: float
+    # "<pid>:<test name>" of the test using the session, empty - the session is free
+    owner: str = ""
+
+    def is_valid(self, now: float) -> bool:
+        return bool(self.csrf and self.session_id) and self.expires_at > now
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"email={self.email!r}, "
+            f"expires_at={self.expires_at!r}, "
+            f"owner={self.owner!r}"
+            ")"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
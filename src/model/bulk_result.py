@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class BulkItemResult[T, R]:
+    item: T
+    value: Optional[R] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def is_success(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkResult[T, R]:
+    """Per-item results of a bulk operation, in the same order as the input items"""
+
+    results: list[BulkItemResult[T, R]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult[T, R]]:
+        return [result for result in self.results if result.is_success]
+
+    @property
+    def failed(self) -> list[BulkItemResult[T, R]]:
+        return [result for result in self.results if not result.is_success]
+
+    @property
+    def is_success(self) -> bool:
+        return all(result.is_success for result in self.results)
+
+    def values(self) -> list[R]:
+        """Values of successful items. Raises AssertionError if any item failed."""
+        self.raise_on_failure()
+        return [result.value for result in self.results]
+
+    def raise_on_failure(self) -> None:
+        failed = self.failed
+        if failed:
+            errors = "\n".join(
+                f"{i}. {result.item}: {result.error!r}"
+                for i, result in enumerate(failed, start=1)
+            )
+            raise AssertionError(
+                f"Bulk operation failed for [{len(failed)}] of [{len(self.results)}] item(s):\n"
+                f"{errors}"
+            )
+
+    def summary(self, describe: Callable[[T], object] = str) -> str:
+        """One line per item: OK or error"""
+        return "\n".join(
+            f"{i}. {describe(result.item)}: "
+            + ("OK" if result.is_success else f"FAILED {result.error!r}")
+            for i, result in enumerate(self.results, start=1)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"total={len(self.results)}, "
+            f"failed={len(self.failed)}"
+            ")"
+        )
+
+    def __str__(self) -> str:
+        return self.__repr__()
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from selene import Element
+
+from src.config.config import CFG
+
+
+@dataclass(frozen=True)
+class ScreenshotCheck:
+    """One region of a batch screenshot assertion: element, its baseline and tolerance"""
+
+    element: Element
+    title: str
+    path_to_screenshot: str
+    percent_of_tolerance: float = CFG.default_percent_of_tolerance
+    rewrite_screenshot: bool = False
@@ -0,0 +1,211 @@
+import logging
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+from typing import Self
+
+from bs4 import BeautifulSoup
+
+from src.client.async_cart_api_client import AsyncCartApiClient
+from src.client.core.condition.conditions import Conditions
+from src.config.config import CFG
+from src.model.bulk_result import BulkItemResult, BulkResult
+from src.model.product_items_info import ProductItemsInfo
+from src.util.allure.allure_scope import suppress_allure
+from src.util.allure.allure_util import AllureUtil
+from src.util.async_util import gather_bounded
+from src.util.decorator.step_logger import step_log
+from src.util.store.cookie_store import ThreadSafeCookieStore
+
+# Backend sessions which lost concurrent cart updates, process-wide
+_SEQUENTIAL_SESSIONS: set[str] = set()
+
+
+class AsyncCartApiService:
+
+    def __init__(self):
+        self.cart_api_client = AsyncCartApiClient()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.cart_api_client.aclose()
+
+    @step_log.log("Add [{quantity}] product(s) by id = [{product_id}] to cart")
+    async def add_product_to_cart(self, product_id: int, quantity: int = 1) -> None:
+        (await self.cart_api_client.add_product_to_cart(product_id, quantity)).check(
+            Conditions.status_code(HTTPStatus.OK)
+        )
+
+    @step_log.log("Add products to cart")
+    async def add_products_to_cart(
+        self,
+        product_items_info: ProductItemsInfo,
+        max_concurrency: int = CFG.bulk_api_workers,
+    ) -> BulkResult[int, int]:
+        """
+        Add products concurrently. Quantities of the same product are summed into one request.
+        Result contains product id and added quantity per request. Quantities are verified
+        by reading the cart once: a product with other quantity in the cart is a failed item.
+        """
+        quantities: dict[int, int] = {}
+        for product in product_items_info.products_info:
+            quantities[product.id] = quantities.get(product.id, 0) + product.quantity
+
+        before = await self.__cart_quantities_of_existing_session()
+
+        async def add(product_id: int) -> int:
+            await self.add_product_to_cart(product_id, quantities[product_id])
+            return quantities[product_id]
+
+        async def add_missing(product_id: int, in_cart: int) -> None:
+            missing = before.get(product_id, 0) + quantities[product_id] - in_cart
+            if missing > 0:
+                await self.add_product_to_cart(product_id, missing)
+
+        result = await self.__run_in_session(list(quantities), add, max_concurrency)
+        result = await self.__verify_cart(
+            result,
+            {pid: before.get(pid, 0) + quantity for pid, quantity in quantities.items()},
+            add_missing,
+        )
+        AllureUtil.attach_bulk_result("Add products to cart", result)
+        return result
+
+    @step_log.log("Remove product by id [{product_id}] from cart")
+    async def remove_product_from_cart(self, product_id: int) -> None:
+        (await self.cart_api_client.remove_product_from_cart(product_id)).check(
+            Conditions.status_code(HTTPStatus.OK)
+        )
+
+    @step_log.log("Remove products from cart")
+    async def remove_products_from_cart(
+        self, product_id: int, *product_ids: int
+    ) -> BulkResult[int, None]:
+        all_product_ids = list(dict.fromkeys((product_id, *product_ids)))
+
+        async def remove_again(product_id: int, in_cart: int) -> None:
+            if in_cart:
+                await self.remove_product_from_cart(product_id)
+
+        result = await self.__run_in_session(
+            all_product_ids, self.remove_product_from_cart, CFG.bulk_api_workers
+        )
+        result = await self.__verify_cart(
+            result, dict.fromkeys(all_product_ids, 0), remove_again
+        )
+        AllureUtil.attach_bulk_result("Remove products from cart", result)
+        return result
+
+    async def get_cart_quantities(self) -> dict[int, int]:
+        """Quantity per product id, read from the cart page of the current session"""
+        response = (await self.cart_api_client.view_cart()).check(
+            Conditions.status_code(HTTPStatus.OK)
+        )
+        return _parse_cart_quantities(response.extract().content_as_bytes())
+
+    async def __cart_quantities_of_existing_session(self) -> dict[int, int]:
+        if not ThreadSafeCookieStore().get_cookie(CFG.session_id_cookie_title):
+            # No session - the cart is empty
+            return {}
+        with suppress_allure():
+            return await self.get_cart_quantities()
+
+    async def __verify_cart[R](
+        self,
+        result: BulkResult[int, R],
+        expected: dict[int, int],
+        repair: Callable[[int, int], Awaitable[None]],
+    ) -> BulkResult[int, R]:
+        """
+        Concurrent updates of the cart, which is kept in the backend session, may be lost.
+        Products with unexpected quantity are repaired one by one and the session is switched
+        to sequential bulk updates. Products still differing after that are failed items.
+        """
+        with suppress_allure():
+            in_cart = await self.get_cart_quantities()
+            mismatched = [
+                item.item
+                for item in result.succeeded
+                if in_cart.get(item.item, 0) != expected[item.item]
+            ]
+            if mismatched:
+                session_id = ThreadSafeCookieStore().get_cookie(CFG.session_id_cookie_title)
+                _SEQUENTIAL_SESSIONS.add(session_id)
+                logging.warning(
+                    f"Cart updates of products {mismatched} are lost in concurrent requests, "
+                    f"they are repeated sequentially. Session [{session_id}] is updated "
+                    "sequentially from now on"
+                )
+                for product_id in mismatched:
+                    try:
+                        await repair(product_id, in_cart.get(product_id, 0))
+                    except Exception as ex:
+                        logging.warning(f"Unable to repair cart product [{product_id}]: {ex!r}")
+                in_cart = await self.get_cart_quantities()
+
+        return BulkResult(
+            results=[
+                (
+                    BulkItemResult(
+                        item=item.item,
+                        error=AssertionError(
+                            f"Cart contains [{in_cart.get(item.item, 0)}] of product "
+                            f"[{item.item}], expected [{expected[item.item]}]"
+                        ),
+                    )
+                    if item.is_success and in_cart.get(item.item, 0) != expected[item.item]
+                    else item
+                )
+                for item in result.results
+            ]
+        )
+
+    @staticmethod
+    async def __run_in_session[R](
+        product_ids: list[int],
+        action: Callable[[int], Awaitable[R]],
+        max_concurrency: int,
+    ) -> BulkResult[int, R]:
+        """
+        Cart is kept in the backend session. Without a session cookie every concurrent request
+        would start its own session, so the first request is sent alone to obtain it.
+        The rest share one snapshot of the test cookie jar. Sessions with lost concurrent
+        updates are updated sequentially.
+
+        Interleaved per-item steps would be misnested in Allure, so the items run without
+        Allure steps, callers attach one summary.
+        """
+        cookie_store = ThreadSafeCookieStore()
+        results = []
+        with suppress_allure():
+            if product_ids and not cookie_store.get_cookie(CFG.session_id_cookie_title):
+                first = await gather_bounded(product_ids[:1], action, 1)
+                results, product_ids = first.results, product_ids[1:]
+                if not first.is_success:
+                    results += [
+                        BulkItemResult(item=product_id, error=first.results[0].error)
+                        for product_id in product_ids
+                    ]
+                    product_ids = []
+
+            if cookie_store.get_cookie(CFG.session_id_cookie_title) in _SEQUENTIAL_SESSIONS:
+                max_concurrency = 1
+            if product_ids:
+                with cookie_store.use_jar_snapshot():
+                    results += (await gather_bounded(product_ids, action, max_concurrency)).results
+
+        return BulkResult(results=results)
+
+
+def _parse_cart_quantities(html: bytes) -> dict[int, int]:
+    """Cart table rows: <tr id="product-{id}"> ... <td class="cart_quantity"><button>{n}"""
+    quantities = {}
+    for row in BeautifulSoup(html, "html.parser").select("tr[id^=product-]"):
+        quantity = row.select_one(".cart_quantity button")
+        product_id = int(row["id"].removeprefix("product-"))
+        quantities[product_id] = int(quantity.get_text(strip=True)) if quantity else 0
+    return quantities
@@ -0,0 +1,82 @@
+import asyncio
+from http import HTTPStatus
+from typing import List, Optional, Self
+
+from src.client.async_product_api_client import AsyncProductApiClient
+from src.client.core.condition.conditions import Conditions
+from src.mapper.product_mapper import ProductMapper
+from src.model.dto.product.product_response import ProductResponseDTO
+from src.model.enum.user_type import UserType
+from src.model.product import Product
+from src.util.allure.allure_scope import suppress_allure
+from src.util.api.json_path_util import JsonPath
+from src.util.decorator.step_logger import step_log
+from src.util.store.catalog_snapshot_store import ThreadSafeCatalogSnapshotStore
+from src.util.store.product_catalog_store import (
+    ProductCatalog,
+    ThreadSafeProductCatalogStore,
+)
+
+
+class AsyncProductApiService:
+
+    def __init__(self):
+        self.product_api_client = AsyncProductApiClient()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.product_api_client.aclose()
+
+    @step_log.log("Get all products")
+    async def get_all_products(self) -> List[Product]:
+        return ProductMapper.to_products((await self.__catalog()).all())
+
+    @step_log.log("Get all products by group = [user_type] and category = [category]")
+    async def get_all_products_by_category(
+        self, user_type: UserType, category: str
+    ) -> List[Product]:
+        return ProductMapper.to_products(
+            (await self.__catalog()).by_category(user_type, category)
+        )
+
+    async def get_all_products_by_ids(
+        self, product_id: int, *product_ids: int
+    ) -> List[Product]:
+        all_product_ids = [product_id, *product_ids]
+        async with step_log.log(f"Get all products by ids: {all_product_ids}"):
+            return ProductMapper.to_products((await self.__catalog()).by_ids(all_product_ids))
+
+    @step_log.log("Search products by query: {query}")
+    async def search_products(self, query: str) -> List[Product]:
+        products = (
+            (await self.product_api_client.send_search_products_by_query_request(query))
+            .check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_list(ProductResponseDTO, JsonPath.PRODUCTS_RESPONSE_PRODUCTS)
+        )
+        return ProductMapper.to_products(products)
+
+    @step_log.log("Get product by title: {title}")
+    async def get_product_by_title(self, title: str) -> Optional[Product]:
+        product = (await self.__catalog()).by_title(title)
+        return None if product is None else ProductMapper.to_product(product)
+
+    @staticmethod
+    async def __catalog() -> ProductCatalog:
+        """
+        Same catalog as ProductApiService. The first load (snapshot file or API) is blocking,
+        so it runs off the event loop, without Allure steps of the worker thread.
+        """
+        with suppress_allure():
+            return await asyncio.to_thread(
+                ThreadSafeProductCatalogStore().get_catalog,
+                ThreadSafeCatalogSnapshotStore().get_products,
+            )
@@ -0,0 +1,158 @@
+import logging
+from http import HTTPStatus
+from typing import Iterable, Optional, Self
+
+from src.client.async_user_api_client import AsyncUserApiClient
+from src.client.core.condition.conditions import Conditions
+from src.config.config import CFG
+from src.ex.exception import UserNotFoundError
+from src.mapper.user_mapper import UserMapper
+from src.model.bulk_result import BulkResult
+from src.model.dto.user.user_response import UserResponseDTO
+from src.model.test_data import TestData
+from src.model.user import User
+from src.util.allure.allure_scope import suppress_allure
+from src.util.allure.allure_util import AllureUtil
+from src.util.async_util import gather_bounded
+from src.util.decorator.step_logger import step_log
+from src.util.store.auth_session_store import ThreadSafeAuthSessionStore
+
+_USER_EXIST_MESSAGE = "User exists!"
+_USER_NOT_EXIST_MESSAGE = "User not found!"
+
+
+class AsyncUserApiService:
+
+    def __init__(self):
+        self.user_api_client = AsyncUserApiClient()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.user_api_client.aclose()
+
+    @step_log.log("Create user: {user.email}")
+    async def create_user(self, user: User) -> User:
+        (await self.user_api_client.send_create_new_user_request(user)).check(
+            Conditions.status_code(HTTPStatus.OK),
+            Conditions.body_status_code(HTTPStatus.CREATED),
+        )
+        user_response = (
+            (await self.user_api_client.send_get_user_by_email_request(user.email))
+            .check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_pojo(cls=UserResponseDTO, path="user")
+        )
+        user_response = user_response.model_copy(
+            update={
+                "email": user.email,
+                "mobile_phone": user.phone_number,
+                "test_data": user.test_data,
+            }
+        )
+        return UserMapper.to_user(user_response, user.test_data)
+
+    async def create_users(
+        self, users: Iterable[User], max_concurrency: int = CFG.bulk_api_workers
+    ) -> BulkResult[User, User]:
+        users = list(users)
+        async with step_log.log(f"Create [{len(users)}] user(s)"):
+            with suppress_allure():
+                result = await gather_bounded(users, self.create_user, max_concurrency)
+            AllureUtil.attach_bulk_result("Create users", result, _user_email)
+            return result
+
+    @step_log.log("Get user by email: {email}")
+    async def get_user_by_email(self, email: str) -> Optional[User]:
+        return await self.__get_user(email)
+
+    @step_log.log("Update user with email: {email}")
+    async def update_user(self, user: User) -> User:
+        if not await self.__get_user(user.email):
+            raise UserNotFoundError(f"User with email = [{user.email}] not found")
+        return (
+            (await self.user_api_client.send_update_user_request(user))
+            .check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_pojo(User, "user")
+        )
+
+    @step_log.log("Delete user with email: {email}")
+    async def delete_user(self, email: str, password: str) -> None:
+        ThreadSafeAuthSessionStore().invalidate_by_email(email)
+        (await self.user_api_client.send_delete_user_request(email, password)).check(
+            Conditions.status_code(HTTPStatus.OK),
+            Conditions.body_status_code(HTTPStatus.OK),
+        )
+
+    async def delete_users(
+        self, users: Iterable[User], max_concurrency: int = CFG.bulk_api_workers
+    ) -> BulkResult[User, None]:
+        users = list(users)
+        async with step_log.log(f"Delete [{len(users)}] user(s)"):
+            with suppress_allure():
+                result = await gather_bounded(
+                    users,
+                    lambda user: self.delete_user(user.email, user.test_data.password),
+                    max_concurrency,
+                )
+            AllureUtil.attach_bulk_result("Delete users", result, _user_email)
+            return result
+
+    async def safe_delete_user(self, email: str, password: str) -> None:
+        try:
+            await self.delete_user(email, password)
+        except Exception as ex:
+            logging.info(
+                f"Unable to delete user. Email = [{email}], password = [{password}].\n"
+                f"Exception: {ex}"
+            )
+
+    @step_log.log("Verify login with email = [{email}] and password = [{password}]")
+    async def verify_login(self, email: str, password: str) -> bool:
+
+        response = await self.user_api_client.send_verify_login_request(
+            email, password
+        )
+        response.check(
+            Conditions.status_code(HTTPStatus.OK),
+            Conditions.body_status_code(HTTPStatus.OK),
+        )
+        message = response.extract().as_value("message")
+
+        if message == _USER_EXIST_MESSAGE:
+            return True
+        elif message == _USER_NOT_EXIST_MESSAGE:
+            return False
+        else:
+            raise ValueError(f"Unexpected response message: {message}")
+
+    async def __get_user(self, email: str) -> Optional[User]:
+
+        response = await self.user_api_client.send_get_user_by_email_request(email)
+        if response.extract().body_status_code() == HTTPStatus.NOT_FOUND:
+            return None
+
+        user_response = (
+            response.check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_pojo(UserResponseDTO, "user")
+        )
+        return UserMapper.to_user(user_response, TestData.empty())
+
+
+def _user_email(user: User) -> str:
+    return user.email
@@ -1,11 +1,16 @@
+import time
 from http import HTTPStatus
 
 from src.client.auth_api_client import AuthApiClient
 from src.client.core.condition.conditions import Conditions
 from src.config.config import CFG
+from src.model.auth_session import AuthSession
 from src.util.decorator.step_logger import step_log
+from src.util.store.auth_session_store import ThreadSafeAuthSessionStore
 from src.util.store.cookie_store import ThreadSafeCookieStore
 
+_LOGGED_IN_MARKER = "Logged in as"
+
 
 class AuthApiService:
 
@@ -14,21 +19,54 @@ class AuthApiService:
 
     @step_log.log("Sign in by email = [{email}] and password = [{password}]")
     def sign_in(self, email: str, password: str) -> dict[str, str]:
-        self.auth_api_client.send_get_csrf_token_request().check(
-            Conditions.status_code(HTTPStatus.OK)
-        )
+        session = ThreadSafeAuthSessionStore().get_session(email, password)
+        if session is not None:
+            ThreadSafeCookieStore().add_or_update_cookies(
+                {
+                    CFG.csrf_cookie_title: session.csrf,
+                    CFG.session_id_cookie_title: session.session_id,
+                }
+            )
+            # One authenticated GET: the session may be closed by logout/delete elsewhere
+            if self.__is_logged_in():
+                return ThreadSafeCookieStore().get_cookies(
+                    CFG.csrf_cookie_title, CFG.session_id_cookie_title
+                )
+            ThreadSafeAuthSessionStore().invalidate_by_session_id(session.session_id)
+            ThreadSafeCookieStore().remove_cookies([CFG.session_id_cookie_title])
+        else:
+            self.auth_api_client.send_get_csrf_token_request().check(
+                Conditions.status_code(HTTPStatus.OK)
+            )
 
         self.auth_api_client.send_login_request(
             email=email,
             password=password,
             csrf=ThreadSafeCookieStore().get_cookie(CFG.csrf_cookie_title),
         ).check(Conditions.status_code(HTTPStatus.OK))
-        return ThreadSafeCookieStore().get_cookies(
+        cookies = ThreadSafeCookieStore().get_cookies(
             CFG.csrf_cookie_title, CFG.session_id_cookie_title
         )
+        ThreadSafeAuthSessionStore().add_session(
+            password,
+            AuthSession(
+                email=email,
+                csrf=cookies.get(CFG.csrf_cookie_title),
+                session_id=cookies.get(CFG.session_id_cookie_title),
+                expires_at=time.time() + CFG.auth_session_ttl,
+            ),
+        )
+        return cookies
 
     @step_log.log("Sign in by email = [{email}] and password = [{password}]")
     def logout(self) -> None:
+        ThreadSafeAuthSessionStore().invalidate_by_session_id(
+            ThreadSafeCookieStore().get_cookie(CFG.session_id_cookie_title)
+        )
         self.auth_api_client.send_logout_request().check(
             Conditions.status_code(HTTPStatus.OK)
         )
+
+    def __is_logged_in(self) -> bool:
+        response = self.auth_api_client.send_get_csrf_token_request().response
+        return response.status_code == HTTPStatus.OK and _LOGGED_IN_MARKER in response.text
@@ -2,7 +2,11 @@ from http import HTTPStatus
 
 from src.client.cart_api_client import CartApiClient
 from src.client.core.condition.conditions import Conditions
+from src.config.config import CFG
+from src.model.bulk_result import BulkResult
 from src.model.product_items_info import ProductItemsInfo
+from src.service.async_cart_api_service import AsyncCartApiService
+from src.util.async_util import run_sync
 from src.util.decorator.step_logger import step_log
 
 
@@ -17,10 +21,18 @@ class CartApiService:
             Conditions.status_code(HTTPStatus.OK)
         )
 
-    @step_log.log("Add products to cart")
-    def add_products_to_cart(self, product_items_info: ProductItemsInfo) -> None:
-        for product in product_items_info.products_info:
-            self.add_product_to_cart(product.id, product.quantity)
+    def add_products_to_cart(
+        self,
+        product_items_info: ProductItemsInfo,
+        max_concurrency: int = CFG.bulk_api_workers,
+    ) -> BulkResult[int, int]:
+        """
+        Add products concurrently in the current test session.
+        Raises AssertionError if any product wasn't added.
+        """
+        result = run_sync(self.__add_products_to_cart(product_items_info, max_concurrency))
+        result.raise_on_failure()
+        return result
 
     @step_log.log("Remove product by id [{product_id}] from cart")
     def remove_product_from_cart(self, product_id: int) -> None:
@@ -28,8 +40,23 @@ class CartApiService:
             Conditions.status_code(HTTPStatus.OK)
         )
 
-    @step_log.log("Remove products from cart")
-    def remove_products_from_cart(self, product_id: int, *product_ids: int) -> None:
-        all_product_ids = {product_id, *product_ids}
-        for product_id in all_product_ids:
-            self.remove_product_from_cart(product_id)
+    def remove_products_from_cart(
+        self, product_id: int, *product_ids: int
+    ) -> BulkResult[int, None]:
+        result = run_sync(self.__remove_products_from_cart(product_id, *product_ids))
+        result.raise_on_failure()
+        return result
+
+    @staticmethod
+    async def __add_products_to_cart(
+        product_items_info: ProductItemsInfo, max_concurrency: int
+    ) -> BulkResult[int, int]:
+        async with AsyncCartApiService() as service:
+            return await service.add_products_to_cart(product_items_info, max_concurrency)
+
+    @staticmethod
+    async def __remove_products_from_cart(
+        product_id: int, *product_ids: int
+    ) -> BulkResult[int, None]:
+        async with AsyncCartApiService() as service:
+            return await service.remove_products_from_cart(product_id, *product_ids)
@@ -9,6 +9,11 @@ from src.model.enum.user_type import UserType
 from src.model.product import Product
 from src.util.decorator.step_logger import step_log
 from src.util.api.json_path_util import JsonPath
+from src.util.store.catalog_snapshot_store import ThreadSafeCatalogSnapshotStore
+from src.util.store.product_catalog_store import (
+    ProductCatalog,
+    ThreadSafeProductCatalogStore,
+)
 
 
 class ProductApiService:
@@ -18,37 +23,24 @@ class ProductApiService:
 
     @step_log.log("Get all products")
     def get_all_products(self) -> List[Product]:
-        return [
-            ProductMapper.to_product(product) for product in self.__get_all_products()
-        ]
+        return ProductMapper.to_products(self.__catalog().all())
 
     @step_log.log("Get all products")
     def get_all_product_titles(self) -> List[str]:
-        return [product.name for product in self.__get_all_products()]
+        return [product.name for product in self.__catalog().all()]
 
     @step_log.log("Get all products by group = [user_type] and category = [category]")
     def get_all_products_by_category(
         self, user_type: UserType, category: str
     ) -> List[Product]:
         return ProductMapper.to_products(
-            [
-                product
-                for product in self.__get_all_products()
-                if product.category.usertype.usertype == user_type
-                and product.category.category == category
-            ]
+            self.__catalog().by_category(user_type, category)
         )
 
     def get_all_products_by_ids(self, product_id: int, *product_ids: int):
         all_product_ids = [product_id, *product_ids]
         with step_log.log(f"Get all products by ids: {all_product_ids}"):
-            return ProductMapper.to_products(
-                [
-                    product
-                    for product in self.__get_all_products()
-                    if product.id in all_product_ids
-                ]
-            )
+            return ProductMapper.to_products(self.__catalog().by_ids(all_product_ids))
 
     @step_log.log("Get all products by group and category")
     def get_all_product_titles_by_category(
@@ -56,28 +48,27 @@ class ProductApiService:
     ) -> List[str]:
         return [
             product.name
-            for product in self.__get_all_products()
-            if product.category.usertype.usertype == user_type
-            and product.category.category == category
+            for product in self.__catalog().by_category(user_type, category)
         ]
 
     @step_log.log("Get all brand products")
     def get_all_brand_product_titles(self, brand: str) -> List[str]:
-        return [
-            product.name
-            for product in self.__get_all_products()
-            if product.brand == brand
-        ]
+        return [product.name for product in self.__catalog().by_brand(brand)]
 
-    def __get_all_products(self) -> List[ProductResponseDTO]:
-        return (
-            self.product_api_client.send_get_all_products_request()
-            .check(
-                Conditions.status_code(HTTPStatus.OK),
-                Conditions.body_status_code(HTTPStatus.OK),
-            )
-            .extract()
-            .as_list(ProductResponseDTO, JsonPath.PRODUCTS_RESPONSE_PRODUCTS)
+    @step_log.log("Reload products catalog")
+    def refresh_catalog(self) -> ProductCatalog:
+        ThreadSafeCatalogSnapshotStore().invalidate()
+        return ThreadSafeProductCatalogStore().refresh(
+            ThreadSafeCatalogSnapshotStore().get_products
+        )
+
+    def invalidate_catalog(self) -> None:
+        ThreadSafeCatalogSnapshotStore().invalidate()
+        ThreadSafeProductCatalogStore().invalidate()
+
+    def __catalog(self) -> ProductCatalog:
+        return ThreadSafeProductCatalogStore().get_catalog(
+            ThreadSafeCatalogSnapshotStore().get_products
         )
 
     @step_log.log("Search products by query: {query}")
@@ -108,12 +99,5 @@ class ProductApiService:
 
     @step_log.log("Get product by title: {title}")
     def get_product_by_title(self, title) -> Optional[Product]:
-        products = (
-            self.product_api_client.send_get_all_products_request()
-            .extract()
-            .as_list(ProductResponseDTO, JsonPath.PRODUCTS_RESPONSE_PRODUCTS)
-        )
-        for product in products:
-            if product.title == title:
-                return ProductMapper.to_product(product)
-        return None
+        product = self.__catalog().by_title(title)
+        return None if product is None else ProductMapper.to_product(product)
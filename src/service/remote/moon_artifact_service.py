@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import override
 
 from src.client.remote.selenoid_api_client import SelenoidApiClient
@@ -48,7 +49,7 @@ class MoonArtifactApiService(RemoteArtifactsService):
         video_id: str,
         retries: int = 5,
         delay: float = 2.0,
-    ) -> bytes:
+    ) -> Iterator[bytes]:
         """
         Download a video from Moon
         Args:
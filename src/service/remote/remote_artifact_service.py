@@ -1,4 +1,5 @@
 from abc import ABCMeta, abstractmethod
+from collections.abc import Iterator
 
 
 class RemoteArtifactsService(metaclass=ABCMeta):
@@ -35,9 +36,9 @@ class RemoteArtifactsService(metaclass=ABCMeta):
         video_id: str,
         retries: int = 5,
         delay: float = 2.0,
-    ) -> bytes:
+    ) -> Iterator[bytes]:
         """
-        Download a video from remote host
+        Download a video from remote host, streamed by chunks
         Args:
             video_id (str): video id - test_title or session_id
             retries (int): number of retries to get video
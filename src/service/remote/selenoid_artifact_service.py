@@ -1,7 +1,10 @@
 import time
+from collections.abc import Iterator
 from http import HTTPStatus
 from typing import override
 
+import httpx
+
 from src.client.core.condition.conditions import Conditions
 from src.client.remote.selenoid_api_client import SelenoidApiClient
 from src.config.config import CFG
@@ -14,6 +17,8 @@ from src.service.remote.remote_artifact_service import RemoteArtifactsService
 from src.util import retry_util
 from src.util.decorator.step_logger import step_log
 
+_VIDEO_CHUNK_SIZE = 1024 * 1024
+
 
 class SelenoidArtifactApiService(RemoteArtifactsService):
 
@@ -88,9 +93,9 @@ class SelenoidArtifactApiService(RemoteArtifactsService):
         video_id: str,
         retries: int = 5,
         delay: float = 2.0,
-    ) -> bytes:
+    ) -> Iterator[bytes]:
         """
-        Download a video from Selenoid
+        Download a video from Selenoid. The video is streamed: chunks are read while iterating
         Args:
             video_id (str): video id - test_title or session_id
             retries (int): number of retries to get video
@@ -98,20 +103,20 @@ class SelenoidArtifactApiService(RemoteArtifactsService):
         """
 
         def action():
-            response = self.selenoid_api_client.send_get_video_by_title_request(
+            response = self.selenoid_api_client.send_get_video_stream_by_title_request(
                 video_id
             )
-            status_code = response.extract().status_code()
-            if status_code == HTTPStatus.OK:
-                return response.extract().content_as_bytes()
+            if response.status_code == HTTPStatus.OK:
+                return response
+            response.close()
             time.sleep(delay)
 
             raise SelenoidError(
                 f"Not found video by video_id = {video_id}. "
-                f"Response code: {status_code}"
+                f"Response code: {response.status_code}"
             )
 
-        return retry_util.retry(
+        response = retry_util.retry(
             action=action,
             retries=retries,
             delay=delay,
@@ -119,6 +124,7 @@ class SelenoidArtifactApiService(RemoteArtifactsService):
                 f"Unable to download selenoid video by id = [{video_id}] after {retries} retries"
             ),
         )
+        return _iter_and_close(response)
 
     def get_container_id(self, session_id: str) -> str:
         platform_title = "unknown"
@@ -142,3 +148,10 @@ class SelenoidArtifactApiService(RemoteArtifactsService):
                 return session.get("container")
 
         raise SelenoidError(f"Not found container id by session id: {session_id}")
+
+
+def _iter_and_close(response: httpx.Response) -> Iterator[bytes]:
+    try:
+        yield from response.iter_bytes(_VIDEO_CHUNK_SIZE)
+    finally:
+        response.close()
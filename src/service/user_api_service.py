@@ -1,16 +1,21 @@
 import logging
 from http import HTTPStatus
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.client.core.condition.conditions import Conditions
+from src.config.config import CFG
 from src.client.user_api_client import UserApiClient
 from src.client.verify_login_api_client import VerifyLoginApiClient
 from src.ex.exception import UserNotFoundError
 from src.mapper.user_mapper import UserMapper
+from src.model.bulk_result import BulkResult
 from src.model.dto.user.user_response import UserResponseDTO
 from src.model.test_data import TestData
 from src.model.user import User
+from src.service.async_user_api_service import AsyncUserApiService
+from src.util.async_util import run_sync
 from src.util.decorator.step_logger import step_log
+from src.util.store.auth_session_store import ThreadSafeAuthSessionStore
 
 _USER_EXIST_MESSAGE = "User exists!"
 _USER_NOT_EXIST_MESSAGE = "User not found!"
@@ -46,6 +51,12 @@ class UserApiService:
         )
         return UserMapper.to_user(user_response, user.test_data)
 
+    def create_users(
+        self, users: Iterable[User], max_concurrency: int = CFG.bulk_api_workers
+    ) -> BulkResult[User, User]:
+        """Create users concurrently. Result contains created user or error per input user."""
+        return run_sync(self.__create_users(list(users), max_concurrency))
+
     @step_log.log("Get user by email: {email}")
     def get_user_by_email(self, email: str) -> Optional[User]:
         return self.__get_user(email)
@@ -66,11 +77,18 @@ class UserApiService:
 
     @step_log.log("Delete user with email: {email}")
     def delete_user(self, email: str, password: str) -> None:
+        ThreadSafeAuthSessionStore().invalidate_by_email(email)
         self.user_api_client.send_delete_user_request(email, password).check(
             Conditions.status_code(HTTPStatus.OK),
             Conditions.body_status_code(HTTPStatus.OK),
         )
 
+    def delete_users(
+        self, users: Iterable[User], max_concurrency: int = CFG.bulk_api_workers
+    ) -> BulkResult[User, None]:
+        """Delete users concurrently. Failed deletions are returned, not raised."""
+        return run_sync(self.__delete_users(list(users), max_concurrency))
+
     def safe_delete_user(self, email: str, password: str) -> None:
         try:
             self.delete_user(email, password)
@@ -115,3 +133,17 @@ class UserApiService:
             .as_pojo(UserResponseDTO, "user")
         )
         return UserMapper.to_user(user_response, TestData.empty())
+
+    @staticmethod
+    async def __create_users(
+        users: list[User], max_concurrency: int
+    ) -> BulkResult[User, User]:
+        async with AsyncUserApiService() as service:
+            return await service.create_users(users, max_concurrency)
+
+    @staticmethod
+    async def __delete_users(
+        users: list[User], max_concurrency: int
+    ) -> BulkResult[User, None]:
+        async with AsyncUserApiService() as service:
+            return await service.delete_users(users, max_concurrency)
@@ -5,6 +5,7 @@ from selene import Element, command, be
 from selene.support.conditions import not_
 
 from src.config.config import CFG
+from src.model.screenshot_check import ScreenshotCheck
 from src.ui.element.base_element import UiElement
 from src.util.decorator.step_logger import step_log
 from src.util.screenshot import screenshot_util
@@ -72,6 +73,34 @@ class BaseComponent(ABC):
             component_name=self._component_title,
         )
 
+    @step_log.log("Check [{self._component_title}] regions have expected screenshots")
+    def check_component_regions_have_screenshots(
+        self,
+        checks: list[ScreenshotCheck],
+        timeout: float = CFG.default_screenshot_timeout,
+    ) -> None:
+        """
+        Checks screenshots of nested components/elements from one page capture.
+        All mismatching regions are reported in one assertion error.
+        """
+        self._root.should(be.visible)
+        screenshot_util.compare_and_save_screenshots(checks, timeout, self._component_title)
+
+    def screenshot_check(
+        self,
+        path_to_screenshot: str,
+        percent_of_tolerance: float = CFG.default_percent_of_tolerance,
+        rewrite_screenshot: bool = False,
+    ) -> ScreenshotCheck:
+        """Component region for batch screenshot assertions"""
+        return ScreenshotCheck(
+            element=self._root,
+            title=self._component_title,
+            path_to_screenshot=path_to_screenshot,
+            percent_of_tolerance=percent_of_tolerance,
+            rewrite_screenshot=rewrite_screenshot,
+        )
+
     @property
     def component_title(self) -> str:
         return self._component_title
@@ -1,8 +1,11 @@
 from selene import Element, by, be
 
+from src.config.config import CFG
 from src.ui.component.base_component import BaseComponent
 from src.ui.element.base_element import UiElement, TextLink, Text, Button
 from src.util.decorator.step_logger import step_log
+from src.util.selene.cookie_util import CookieUtil
+from src.util.store.auth_session_store import ThreadSafeAuthSessionStore
 
 
 class HeaderComponent(BaseComponent):
@@ -34,10 +37,12 @@ class HeaderComponent(BaseComponent):
 
     @step_log.log("Logout")
     def logout(self) -> None:
+        self.__invalidate_auth_session()
         self.__locator.logout().click()
 
     @step_log.log("Delete account")
     def delete_account(self) -> None:
+        self.__invalidate_auth_session()
         self.__locator.delete_account().click()
 
     @step_log.log("Navigate to the [Contact us] page by header")
@@ -72,6 +77,13 @@ class HeaderComponent(BaseComponent):
         self.__locator.home().should_not_exists()
         self.__locator.products().should_not_exists()
 
+    @staticmethod
+    def __invalidate_auth_session() -> None:
+        # The browser session is dropped on the server, so API sessions cached with it are stale
+        ThreadSafeAuthSessionStore().invalidate_by_session_id(
+            CookieUtil.get_app_cookie(CFG.session_id_cookie_title)
+        )
+
 
 class _HeaderComponentLocator:
 
@@ -23,6 +23,7 @@ from selene.support.conditions.have import text, css_class
 
 from src.config.config import CFG
 from src.model.enum.remote_type import RemoteType
+from src.model.screenshot_check import ScreenshotCheck
 from src.service.remote.moon_artifact_service import MoonArtifactApiService
 from src.service.remote.selenoid_artifact_service import SelenoidArtifactApiService
 from src.util import system_util, retry_util
@@ -219,6 +220,21 @@ class BaseElement(ABC):
             component_name=self.element_title,
         )
 
+    def screenshot_check(
+        self,
+        path_to_screenshot: str,
+        percent_of_tolerance: float = CFG.default_percent_of_tolerance,
+        rewrite_screenshot: bool = False,
+    ) -> ScreenshotCheck:
+        """Element region for batch screenshot assertions"""
+        return ScreenshotCheck(
+            element=self._root,
+            title=self._element_title,
+            path_to_screenshot=path_to_screenshot,
+            percent_of_tolerance=percent_of_tolerance,
+            rewrite_screenshot=rewrite_screenshot,
+        )
+
     @property
     def element_title(self) -> str:
         return self._element_title
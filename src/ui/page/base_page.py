@@ -10,6 +10,7 @@ from src.ui.component.common.header_component import HeaderComponent
 from src.ui.component.common.notification_component import NotificationComponent
 from src.ui.component.common.page_scroller_component import PageScrollerComponent
 from src.ui.component.common.subscription_component import SubscriptionComponent
+from src.model.screenshot_check import ScreenshotCheck
 from src.util.decorator.step_logger import step_log
 from src.util.screenshot import screenshot_util
 from src.util.string_util import StringUtil
@@ -79,6 +80,19 @@ class BasePage(ABC):
             component_name=self._page_name,
         )
 
+    @step_log.log("Check [{self._page_name}] page regions have expected screenshots")
+    def check_page_has_screenshots(
+        self,
+        checks: list[ScreenshotCheck],
+        timeout: float = CFG.default_screenshot_timeout,
+    ) -> None:
+        """
+        Checks page regions (components, elements) screenshots from one page capture.
+        All mismatching regions are reported in one assertion error.
+        """
+        self.check_page_is_visible()
+        screenshot_util.compare_and_save_screenshots(checks, timeout, self._page_name)
+
     @abstractmethod
     def check_page_is_visible(self):
         pass
@@ -0,0 +1,36 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import ContextManager, Generator
+
+import allure
+from allure_commons import plugin_manager
+
+_ALLURE_SUPPRESSED: ContextVar[bool] = ContextVar("allure_suppressed", default=False)
+
+
+@contextmanager
+def suppress_allure() -> Generator[None, None, None]:
+    """
+    Disable Allure steps and attachments in the current context.
+    Used by background workers, whose steps don't belong to any running test.
+    """
+    token = _ALLURE_SUPPRESSED.set(True)
+    try:
+        yield
+    finally:
+        _ALLURE_SUPPRESSED.reset(token)
+
+
+def is_allure_suppressed() -> bool:
+    return _ALLURE_SUPPRESSED.get()
+
+
+def is_allure_reporting() -> bool:
+    """True if steps are reported: not suppressed and allure reporter is registered (--alluredir)"""
+    return not is_allure_suppressed() and bool(
+        plugin_manager.hook.start_step.get_hookimpls()
+    )
+
+
+def step(title: str) -> ContextManager:
+    return allure.step(title) if is_allure_reporting() else nullcontext()
@@ -1,17 +1,18 @@
 import json
 import logging
-from typing import Optional
+from typing import Any, Callable, Optional
 
-import allure
 from PIL import Image
 from allure_commons.types import AttachmentType
 from httpx import Request, Response
 from selene import browser
 
 from src.config.config import CFG, CFG_TEXT
+from src.model.bulk_result import BulkResult
 from src.model.enum.meta.content_type import ContentType
 from src.model.enum.meta.log_level import ApiLogLvl
 from src.service.remote import remote_artifact_factory
+from src.util.allure.attachment_writer import AttachmentWriter, BodySupplier
 from src.util.api.httpx_log_formatter_util import format_response, format_request
 from src.util.screenshot import image_util
 
@@ -30,8 +31,13 @@ class AllureUtil:
         attachment_type = attachment_type or ContentType.from_mime(
             request.headers.get("Content-Type")
         )
-        allure.attach(
-            format_request(request, api_log_lvl),
+        AttachmentWriter().attach(
+            lambda: format_request(
+                request,
+                api_log_lvl,
+                CFG.api_log_max_body_size,
+                CFG.api_log_html_pretty_max_size,
+            ),
             "Request",
             attachment_type,
         )
@@ -45,8 +51,13 @@ class AllureUtil:
         attachment_type = attachment_type or ContentType.from_mime(
             response.headers.get("Content-Type")
         )
-        allure.attach(
-            format_response(response, api_log_lvl),
+        AttachmentWriter().attach(
+            lambda: format_response(
+                response,
+                api_log_lvl,
+                CFG.api_log_max_body_size,
+                CFG.api_log_html_pretty_max_size,
+            ),
             "Response",
             attachment_type,
         )
@@ -57,7 +68,28 @@ class AllureUtil:
         actual_screenshot: Image.Image,
         diff_image: Image.Image,
     ) -> None:
-        content = json.dumps(
+        # PNG encoding is done by the attachment writer pool
+        AllureUtil.attach_screen_diff_content(
+            lambda: AllureUtil.screen_diff_content(
+                expected_screenshot, actual_screenshot, diff_image
+            )
+        )
+
+    @staticmethod
+    def attach_screen_diff_content(content: BodySupplier) -> None:
+        AttachmentWriter().attach(
+            content,
+            name="Screenshot diff",
+            attachment_type="application/vnd.allure.image.diff",
+        )
+
+    @staticmethod
+    def screen_diff_content(
+        expected_screenshot: Image.Image,
+        actual_screenshot: Image.Image,
+        diff_image: Image.Image,
+    ) -> bytes:
+        return json.dumps(
             {
                 "expected": (
                     f"{_BASE64_PNG_INCEPTION}"
@@ -68,25 +100,29 @@ class AllureUtil:
             }
         ).encode()
 
-        allure.attach(
-            content,
-            name="Screenshot diff",
-            attachment_type="application/vnd.allure.image.diff",
-        )
-
     @staticmethod
     def attach_screen_diff_table(diff_table: str) -> None:
-        allure.attach(
+        AttachmentWriter().attach(
             name="Screenshot diff data table",
             body=diff_table,
             attachment_type=AttachmentType.TEXT,
         )
 
+    @staticmethod
+    def attach_bulk_result(
+        title: str, result: BulkResult, describe: Callable[[Any], object] = str
+    ) -> None:
+        AttachmentWriter().attach(
+            name=f"{title}: {len(result.succeeded)} of {len(result.results)} succeeded",
+            body=lambda: result.summary(describe),
+            attachment_type=AttachmentType.TEXT,
+        )
+
     @staticmethod
     def attach_screenshot() -> None:
         try:
             screenshot = browser.driver.get_screenshot_as_png()
-            allure.attach(
+            AttachmentWriter().attach(
                 screenshot,
                 name="Screenshot",
                 attachment_type=AttachmentType.PNG,
@@ -98,7 +134,7 @@ class AllureUtil:
     def attach_page_source() -> None:
         try:
             page_source = browser.driver.page_source
-            allure.attach(
+            AttachmentWriter().attach(
                 page_source,
                 name="Page Source",
                 attachment_type=AttachmentType.HTML,
@@ -121,10 +157,9 @@ class AllureUtil:
                 if CFG.browser_remote_video_id_type == "test_name"
                 else session_id
             )
-            content = remote_artifact_factory.instance().get_video(test_id)
-
-            allure.attach(
-                content,
+            # Video is streamed to allure results by the attachment writer pool, chunk by chunk
+            AttachmentWriter().attach(
+                lambda: remote_artifact_factory.instance().get_video(test_id),
                 name="Test video",
                 attachment_type=AttachmentType.MP4,
             )
@@ -133,7 +168,7 @@ class AllureUtil:
 
     @staticmethod
     def attach_config_data():
-        allure.attach(
+        AttachmentWriter().attach(
             CFG_TEXT,
             name="Configuration",
             attachment_type=AttachmentType.TEXT,
@@ -0,0 +1,259 @@
+import atexit
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from uuid import uuid4
+
+import allure
+from allure_commons import plugin_manager
+from allure_commons.model2 import ATTACHMENT_PATTERN, Attachment
+from allure_commons.types import AttachmentType
+
+from src.config.config import CFG
+from src.util.allure.allure_scope import is_allure_reporting, suppress_allure
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+
+_TRUNCATION_MARKER = "\n\n... [attachment truncated: {limit} of {size} bytes shown]"
+_STREAM_TRUNCATION_MARKER = "\n\n... [attachment truncated: first {limit} bytes shown]"
+_TEXT_MIME_TYPES = {"application/json", "application/xml", "application/vnd.github+json"}
+_IMAGE_DIFF_MIME_TYPE = "application/vnd.allure.image.diff"
+
+# Iterable of chunks is streamed to the results file, the whole body is never kept in memory
+Body = str | bytes | Iterable[bytes]
+BodySupplier = Body | Callable[[], Body]
+
+
+class AttachmentWriter:
+    """
+    Allure attachments, written by a background pool (ALLURE_ATTACHMENT_WORKERS threads).
+
+    The attachment is registered in the current step/test immediately, so the report structure
+    is the same as with `allure.attach`. Building the body (a supplier may be passed instead of
+    the body), size caps and disk I/O happen in the pool. `flush()` is called at the end of
+    every test and at exit. Oversized text is truncated, oversized images/videos are replaced
+    with a text note. A body given as an iterable of byte chunks (e.g. a streamed video) is
+    written straight to the allure results file chunk by chunk, the cap is applied while
+    streaming.
+    Uses AllureReporter internals (allure-pytest 2.14), falls back to `allure.attach`
+    if the reporter is not found.
+    """
+
+    _instance: Optional["AttachmentWriter"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._executor = None
+                    instance._pending = set()
+                    instance._pending_lock = threading.Lock()
+                    cls._instance = instance
+                    atexit.register(instance.flush)
+        return cls._instance
+
+    def attach(
+        self,
+        body: BodySupplier,
+        name: str,
+        attachment_type: AttachmentType | str = AttachmentType.TEXT,
+        extension: Optional[str] = None,
+    ) -> None:
+        if not is_allure_reporting():
+            return
+
+        reporter = _find_reporter()
+        if reporter is None or CFG.allure_attachment_workers <= 0:
+            allure.attach(
+                _join(_resolve(body)),
+                name=name,
+                attachment_type=attachment_type,
+                extension=extension,
+            )
+            return
+
+        attachment = _register(reporter, name, attachment_type, extension)
+        if attachment is None:
+            return
+        self.__submit(self.__write, attachment, body)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait until all submitted attachments are written"""
+        with self._pending_lock:
+            pending = list(self._pending)
+        if not pending:
+            return
+
+        _, not_done = wait(pending, timeout=timeout)
+        if not_done:
+            logging.warning(f"[{len(not_done)}] allure attachment(s) are not written in time")
+
+    def __submit(self, action: Callable, *args) -> None:
+        with self._pending_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=CFG.allure_attachment_workers,
+                    thread_name_prefix="allure-attachment",
+                )
+            # Body suppliers run in the pool, but in the context of the attaching test
+            future = self._executor.submit(ThreadSafeTestThreadsStore.bind_context(action), *args)
+            self._pending.add(future)
+        future.add_done_callback(self.__done)
+
+    def __done(self, future: Future) -> None:
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    @staticmethod
+    def __write(attachment: Attachment, body: BodySupplier) -> None:
+        # Suppliers may send requests: their steps don't belong to the test thread
+        with suppress_allure():
+            try:
+                content = _resolve(body)
+                if not isinstance(content, (str, bytes)):
+                    content = _spill(attachment, content)
+                if content is not None:
+                    content = _apply_size_cap(attachment, content)
+            except Exception as ex:
+                logging.error(f"Unable to build allure attachment [{attachment.name}]: {ex}")
+                content = _replace_with_note(attachment, f"Unable to build attachment: {ex!r}")
+
+            if content is None:
+                # Already streamed to the results directory
+                return
+            try:
+                plugin_manager.hook.report_attached_data(
+                    body=content, file_name=attachment.source
+                )
+            except Exception as ex:
+                logging.error(f"Unable to write allure attachment [{attachment.name}]: {ex}")
+
+
+def _find_reporter():
+    for plugin in plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None and hasattr(reporter, "_last_executable"):
+            return reporter
+    return None
+
+
+def _register(
+    reporter, name: str, attachment_type, extension: Optional[str]
+) -> Optional[Attachment]:
+    """
+    Same as AllureReporter._attach, but returns the attachment itself:
+    its type is updated if the body is replaced with a note.
+    """
+    mime_type = attachment_type
+    extension = extension or "attach"
+    if isinstance(attachment_type, AttachmentType):
+        extension = attachment_type.extension
+        mime_type = attachment_type.mime_type
+
+    parent_uuid = reporter._last_executable()
+    if parent_uuid is None:
+        return None
+
+    attachment = Attachment(
+        source=ATTACHMENT_PATTERN.format(prefix=uuid4(), ext=extension),
+        name=name,
+        type=mime_type,
+    )
+    reporter.get_item(parent_uuid).attachments.append(attachment)
+    return attachment
+
+
+def _resolve(body: BodySupplier) -> Body:
+    return body() if callable(body) else body
+
+
+def _join(content: Body) -> str | bytes:
+    return content if isinstance(content, (str, bytes)) else b"".join(content)
+
+
+def _is_text(mime_type: str) -> bool:
+    return mime_type.startswith("text/") or mime_type in _TEXT_MIME_TYPES
+
+
+def _size_limit(mime_type: str) -> int:
+    """0 - no limit"""
+    if _is_text(mime_type):
+        return CFG.allure_max_text_attachment_size
+    if mime_type.startswith("image/") or mime_type == _IMAGE_DIFF_MIME_TYPE:
+        return CFG.allure_max_image_attachment_size
+    if mime_type.startswith("video/"):
+        return CFG.allure_max_video_attachment_size
+    return 0
+
+
+def _apply_size_cap(attachment: Attachment, content: Body) -> bytes:
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    mime_type = attachment.type or ""
+    limit = _size_limit(mime_type)
+    if not limit or len(data) <= limit:
+        return data
+
+    if _is_text(mime_type):
+        marker = _TRUNCATION_MARKER.format(limit=limit, size=len(data))
+        return data[:limit].decode("utf-8", errors="ignore").encode("utf-8") + marker.encode()
+
+    return _replace_with_note(
+        attachment, f"Attachment is not saved: size [{len(data)}] bytes exceeds [{limit}] bytes"
+    )
+
+
+def _find_results_dir() -> Optional[Path]:
+    """Directory of AllureFileLogger (--alluredir)"""
+    for plugin in plugin_manager.get_plugins():
+        report_dir = getattr(plugin, "_report_dir", None)
+        if isinstance(report_dir, Path):
+            return report_dir
+    return None
+
+
+def _spill(attachment: Attachment, chunks: Iterable[bytes]) -> Optional[bytes]:
+    """
+    Streams chunks straight to the attachment file in allure results, the size cap is applied
+    while streaming. Returns None if the file is written, otherwise the body to report:
+    a note if binary content exceeds the limit, or joined chunks if no results directory.
+    """
+    results_dir = _find_results_dir()
+    if results_dir is None:
+        return b"".join(chunks)
+
+    mime_type = attachment.type or ""
+    limit = _size_limit(mime_type)
+    path = results_dir / attachment.source
+    written = 0
+    oversized = False
+    try:
+        with open(path, "wb") as file:
+            for chunk in chunks:
+                if limit and written + len(chunk) > limit:
+                    oversized = True
+                    if _is_text(mime_type):
+                        head = chunk[: limit - written]
+                        file.write(head.decode("utf-8", errors="ignore").encode("utf-8"))
+                        file.write(_STREAM_TRUNCATION_MARKER.format(limit=limit).encode())
+                    break
+                file.write(chunk)
+                written += len(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    if oversized and not _is_text(mime_type):
+        path.unlink(missing_ok=True)
+        note = f"Attachment is not saved: size exceeds [{limit}] bytes"
+        return _replace_with_note(attachment, note)
+    return None
+
+
+def _replace_with_note(attachment: Attachment, note: str) -> bytes:
+    """Binary content can't be truncated, the attachment becomes a text note"""
+    attachment.type = AttachmentType.TEXT.mime_type
+    attachment.source = attachment.source.rsplit(".", 1)[0] + f".{AttachmentType.TEXT.extension}"
+    return note.encode("utf-8")
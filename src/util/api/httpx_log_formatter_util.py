@@ -8,36 +8,68 @@ from src.model.enum.meta.content_type import ContentType
 from src.model.enum.meta.log_level import ApiLogLvl
 
 
-def format_request(request: Request, api_log_lvl: ApiLogLvl) -> str:
+_TRUNCATED_MARKER = "\n... [TRUNCATED: {shown} of {total} bytes]"
+
+
+def format_request(
+    request: Request,
+    api_log_lvl: ApiLogLvl,
+    max_body_size: Optional[int] = None,
+    html_pretty_max_size: Optional[int] = None,
+) -> str:
     if api_log_lvl == ApiLogLvl.NONE:
         return ""
 
-    body = None if __body_not_exists(request) else __pretty_body(request)
     base = f"Method: {request.method}\nEndpoint: {request.url}"
 
     if api_log_lvl == ApiLogLvl.HEADERS:
         return f"{base}\nHeaders: {dict(request.headers)}"
-    elif api_log_lvl == ApiLogLvl.BODY:
+
+    body = __format_body(request, max_body_size, html_pretty_max_size)
+    if api_log_lvl == ApiLogLvl.BODY:
         return f"{base}\nBody: {body}"
     else:
         return f"{base}\nHeaders: {dict(request.headers)}\nBody: {body}"
 
 
-def format_response(response: Response, api_log_lvl: ApiLogLvl) -> str:
+def format_response(
+    response: Response,
+    api_log_lvl: ApiLogLvl,
+    max_body_size: Optional[int] = None,
+    html_pretty_max_size: Optional[int] = None,
+) -> str:
     if api_log_lvl == ApiLogLvl.NONE:
         return ""
 
-    body = None if __body_not_exists(response) else __pretty_body(response)
     base = f"Status code: {response.status_code}\nEndpoint: {response.url}"
 
     if api_log_lvl == ApiLogLvl.HEADERS:
         return f"{base}\nHeaders: {dict(response.headers)}"
-    elif api_log_lvl == ApiLogLvl.BODY:
+
+    body = __format_body(response, max_body_size, html_pretty_max_size)
+    if api_log_lvl == ApiLogLvl.BODY:
         return f"{base}\nBody: {body}"
     else:
         return f"{base}\nHeaders: {dict(response.headers)}\nBody: {body}"
 
 
+def __format_body(
+    req_res: Request | Response,
+    max_body_size: Optional[int],
+    html_pretty_max_size: Optional[int],
+) -> Optional[str]:
+    if __body_not_exists(req_res):
+        return None
+
+    content = req_res.content
+    if max_body_size is not None and len(content) > max_body_size:
+        # Truncated JSON/HTML can't be parsed, so body is logged as is
+        body = content[:max_body_size].decode("utf-8", errors="replace")
+        return body + _TRUNCATED_MARKER.format(shown=max_body_size, total=len(content))
+
+    return __pretty_body(req_res, html_pretty_max_size)
+
+
 def __body_not_exists(req_res: Request | Response) -> bool:
     try:
         content = req_res.content
@@ -47,7 +79,9 @@ def __body_not_exists(req_res: Request | Response) -> bool:
     return not content
 
 
-def __pretty_body(req_res: Union[Request, Response]) -> Optional[str]:
+def __pretty_body(
+    req_res: Union[Request, Response], html_pretty_max_size: Optional[int] = None
+) -> Optional[str]:
     content = req_res.content or b""
     if not content:
         return None
@@ -58,6 +92,8 @@ def __pretty_body(req_res: Union[Request, Response]) -> Optional[str]:
     if content_type in [ContentType.JSON.mime_type, ContentType.GITHUB_JSON.mime_type]:
         return __pretty_json(body)
     elif content_type == ContentType.HTML.mime_type:
+        if html_pretty_max_size is not None and len(content) > html_pretty_max_size:
+            return body
         return __pretty_html(body)
     elif content_type in ContentType.URL_ENCODED.mime_type:
         return __pretty_form_urlencoded(body)
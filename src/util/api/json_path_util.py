@@ -1,12 +1,37 @@
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from jsonpath_ng import JSONPath
 from jsonpath_ng.ext import parse
 
 from src.ex.exception import ParseByJsonPathError
 
+_COMPILED_CACHE_SIZE = 256
+_WILDCARD = object()
+
+_SIMPLE_PATH_SEGMENT = re.compile(
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)(?P<indexes>(?:\[(?:\d+|\*)\])*)"
+)
+_SIMPLE_PATH_INDEX = re.compile(r"\[(\d+|\*)\]")
+# Words with a special meaning in the jsonpath-ng grammar are left to the parser
+_RESERVED_WORDS = frozenset({"where", "wherenot", "and", "or", "in", "true", "false", "null"})
+
+
+class _NotSimple(Exception):
+    """Data shape is ambiguous for the fast path, the jsonpath-ng parser decides."""
+
 
 def matches_by_json_path(data: dict, path: str):
     try:
-        expr = parse(path)
-        matches = expr.find(data)
+        steps = _compile_simple_path(path)
+        if steps is not None:
+            try:
+                return _find_by_steps(data, steps)
+            except _NotSimple:
+                pass
+
+        matches = _compile_json_path(path).find(data)
         return [match.value for match in matches]
     except Exception as ex:
         raise ParseByJsonPathError(
@@ -14,6 +39,52 @@ def matches_by_json_path(data: dict, path: str):
         )
 
 
+@lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compile_json_path(path: str) -> JSONPath:
+    return parse(path)
+
+
+@lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compile_simple_path(path: str) -> Optional[tuple]:
+    """
+    Compile plain dotted/indexed paths (e.g. `responseCode`, `user.name`,
+    `products[*].brand.brand`, `brands[0]`) into lookup steps.
+    Returns None if the path needs the full jsonpath-ng grammar.
+    """
+    steps = []
+    for segment in path.split("."):
+        match = _SIMPLE_PATH_SEGMENT.fullmatch(segment)
+        if match is None or match.group("name") in _RESERVED_WORDS:
+            return None
+
+        steps.append(match.group("name"))
+        for index in _SIMPLE_PATH_INDEX.findall(match.group("indexes")):
+            steps.append(_WILDCARD if index == "*" else int(index))
+
+    return tuple(steps)
+
+
+def _find_by_steps(data: Any, steps: tuple) -> list:
+    values = [data]
+    for step in steps:
+        found = []
+        for value in values:
+            if isinstance(step, str):
+                if not isinstance(value, dict):
+                    raise _NotSimple()
+                if step in value:
+                    found.append(value[step])
+            elif not isinstance(value, list):
+                raise _NotSimple()
+            elif step is _WILDCARD:
+                found.extend(value)
+            elif step < len(value):
+                found.append(value[step])
+        values = found
+
+    return values
+
+
 class JsonPath:
 
     # ----- BRANDS RESPONSE
@@ -27,3 +98,11 @@ class JsonPath:
 
     # ----- USERS RESPONSE
     USERS_RESPONSE_USERS = "users[*]"
+
+
+# Warm up caches with known paths
+for _path in (v for k, v in vars(JsonPath).items() if k.isupper()):
+    _compile_simple_path(_path)
+    _compile_json_path(_path)
+
+del _path
@@ -14,6 +14,7 @@ class ApiRoutes(Enum):
     DELETE_USER_ACCOUNT = "/deleteAccount"
     ADD_PRODUCT_TO_CART_PATTERN = "/add_to_cart/{product_id}"
     DELETE_PRODUCT_FROM_CART_PATTERN = "/delete_cart/{product_id}"
+    VIEW_CART = "/view_cart"
 
     def path(self):
         return self.value
@@ -0,0 +1,49 @@
+import re
+from functools import lru_cache
+from typing import Any, Optional, Type
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+_ADAPTERS_CACHE_SIZE = 128
+_ENVELOPE_FIELD = "value"
+
+_OBJECT_PATH = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_ARRAY_PATH = re.compile(r"(?P<key>[A-Za-z_][A-Za-z0-9_]*)\[\*\]")
+
+
+def validate_json_by_path(
+    content: bytes, cls: Type[Any], path: Optional[str], many: bool
+) -> Any:
+    """
+    Validate response bytes by a top-level `key` (many=False) or `key[*]` (many=True) path
+    directly into `cls` / `list[cls]` with a cached pydantic TypeAdapter.
+
+    Raises LookupError if the path or type is not supported by typed extraction,
+    and pydantic.ValidationError if the body doesn't fit the envelope.
+    """
+    key = _envelope_key(path, many)
+    if key is None or not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise LookupError(f"Typed extraction is not supported for {cls} by path: {path}")
+
+    envelope = _envelope_adapter(cls, key, many).validate_json(content)
+    return getattr(envelope, _ENVELOPE_FIELD)
+
+
+def _envelope_key(path: Optional[str], many: bool) -> Optional[str]:
+    if path is None:
+        return None
+    if many:
+        match = _ARRAY_PATH.fullmatch(path)
+        return match.group("key") if match else None
+    return path if _OBJECT_PATH.fullmatch(path) else None
+
+
+@lru_cache(maxsize=_ADAPTERS_CACHE_SIZE)
+def _envelope_adapter(cls: Type[BaseModel], key: str, many: bool) -> TypeAdapter:
+    value_type = list[cls] if many else cls
+    envelope = create_model(
+        f"{cls.__name__}{'List' if many else ''}Envelope",
+        __config__=ConfigDict(arbitrary_types_allowed=True),
+        **{_ENVELOPE_FIELD: (value_type, Field(alias=key))},
+    )
+    return TypeAdapter(envelope)
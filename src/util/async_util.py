@@ -0,0 +1,45 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from typing import Any, TypeVar
+
+from src.model.bulk_result import BulkItemResult, BulkResult
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code (fixtures, hooks, tests).
+
+    Raises RuntimeError if called from a thread with an already running event loop -
+    await the coroutine directly there.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    coro.close()
+    raise RuntimeError("run_sync() can't be called from a running event loop")
+
+
+async def gather_bounded(
+    items: Iterable[T],
+    action: Callable[[T], Awaitable[R]],
+    max_concurrency: int,
+) -> BulkResult[T, R]:
+    """
+    Run `action` for every item with at most `max_concurrency` actions in flight.
+    Errors are collected per item and don't cancel other actions.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run(item: T) -> BulkItemResult[T, R]:
+        async with semaphore:
+            try:
+                return BulkItemResult(item=item, value=await action(item))
+            except Exception as ex:
+                return BulkItemResult(item=item, error=ex)
+
+    return BulkResult(results=list(await asyncio.gather(*(_run(i) for i in items))))
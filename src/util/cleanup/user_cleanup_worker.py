@@ -0,0 +1,214 @@
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional
+
+import httpx
+
+from src.config.config import CFG
+from src.model.user import User
+from src.service.user_api_service import UserApiService
+from src.util.allure.allure_scope import suppress_allure
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+
+_POLL_INTERVAL = 0.5
+_RETRY_DELAY = 1.0
+_CONTEXT_NAME = "USER_CLEANUP"
+
+
+@dataclass
+class UserCleanupMetrics:
+    enqueued: int = 0
+    deleted: int = 0
+    retried: int = 0
+    failed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    total_drain_latency: float = 0.0
+    max_drain_latency: float = 0.0
+
+    @property
+    def avg_drain_latency(self) -> float:
+        return self.total_drain_latency / self.deleted if self.deleted else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"enqueued={self.enqueued}, "
+            f"deleted={self.deleted}, "
+            f"retried={self.retried}, "
+            f"failed={self.failed}, "
+            f"queue_depth={self.queue_depth}, "
+            f"max_queue_depth={self.max_queue_depth}, "
+            f"avg_drain_latency={self.avg_drain_latency:.3f}s, "
+            f"max_drain_latency={self.max_drain_latency:.3f}s"
+            ")"
+        )
+
+
+@dataclass
+class _CleanupTask:
+    user: User
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempt: int = 0
+    not_before: float = 0.0
+
+
+class UserCleanupWorker:
+    """
+    Process-wide background worker, which deletes users from backend.
+
+    Test teardown only enqueues users, the worker thread drains the queue with bulk
+    deletions (up to BULK_API_WORKERS requests in flight) and retries failed ones
+    USER_CLEANUP_RETRIES times on transport errors. `flush()` waits for the queue to drain
+    and returns leftovers.
+    """
+
+    _instance: Optional["UserCleanupWorker"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._queue = queue.Queue()
+                    instance._condition = threading.Condition()
+                    instance._pending = 0
+                    instance._leftovers = []
+                    instance._metrics = UserCleanupMetrics()
+                    instance._thread = None
+                    instance._user_service = UserApiService()
+                    cls._instance = instance
+        return cls._instance
+
+    def enqueue(self, users: Iterable[User]) -> None:
+        tasks = [_CleanupTask(user) for user in users]
+        if not tasks:
+            return
+
+        with self._condition:
+            self._pending += len(tasks)
+            self._metrics.enqueued += len(tasks)
+            self._metrics.max_queue_depth = max(
+                self._metrics.max_queue_depth, self._pending
+            )
+            self.__ensure_started()
+
+        for task in tasks:
+            self._queue.put(task)
+
+    def queue_depth(self) -> int:
+        with self._condition:
+            return self._pending
+
+    def metrics(self) -> UserCleanupMetrics:
+        with self._condition:
+            metrics = UserCleanupMetrics(**vars(self._metrics))
+            metrics.queue_depth = self._pending
+            return metrics
+
+    def flush(self, timeout: Optional[float] = None) -> List[User]:
+        """
+        Wait until all enqueued users are processed.
+        Returns users which were not deleted (retries exhausted or timeout reached).
+        """
+        timeout = CFG.user_cleanup_flush_timeout if timeout is None else timeout
+        with self._condition:
+            drained = self._condition.wait_for(lambda: self._pending == 0, timeout)
+            leftovers, self._leftovers = self._leftovers, []
+
+        if not drained:
+            leftovers.extend(self.__drain_queue())
+            logging.warning(
+                f"User cleanup queue was not drained in [{timeout}] second(s)"
+            )
+
+        logging.info(f"User cleanup: {self.metrics()}")
+        return leftovers
+
+    def __ensure_started(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self.__run, name="user-cleanup-worker", daemon=True
+            )
+            self._thread.start()
+
+    def __run(self) -> None:
+        # Users of finished tests: deletions run in the worker own context, not in GLOBAL
+        with suppress_allure(), ThreadSafeTestThreadsStore.test_context(_CONTEXT_NAME):
+            while True:
+                tasks = self.__take_batch()
+                now = time.monotonic()
+                ready = [task for task in tasks if task.not_before <= now]
+                for task in tasks:
+                    if task.not_before > now:
+                        self._queue.put(task)
+
+                if ready:
+                    self.__delete(ready)
+                elif tasks:
+                    time.sleep(min(_POLL_INTERVAL, min(t.not_before for t in tasks) - now))
+
+    def __take_batch(self) -> List[_CleanupTask]:
+        tasks = [self._queue.get()]
+        while True:
+            try:
+                tasks.append(self._queue.get_nowait())
+            except queue.Empty:
+                return tasks
+
+    def __delete(self, tasks: List[_CleanupTask]) -> None:
+        try:
+            results = self._user_service.delete_users([task.user for task in tasks]).results
+            errors = [result.error for result in results]
+        except Exception as ex:
+            errors = [ex] * len(tasks)
+
+        for task, error in zip(tasks, errors):
+            if error is None:
+                self.__done(task, deleted=True)
+            elif self.__is_retryable(error) and task.attempt + 1 < CFG.user_cleanup_retries:
+                task.attempt += 1
+                task.not_before = time.monotonic() + _RETRY_DELAY * task.attempt
+                with self._condition:
+                    self._metrics.retried += 1
+                self._queue.put(task)
+            else:
+                logging.info(f"Unable to delete user [{task.user.email}]: {error!r}")
+                self.__done(task, deleted=False)
+
+    @staticmethod
+    def __is_retryable(error: BaseException) -> bool:
+        # Failed checks (e.g. user is already deleted by test) won't pass on retry
+        return isinstance(error, httpx.HTTPError)
+
+    def __done(self, task: _CleanupTask, deleted: bool) -> None:
+        with self._condition:
+            self._pending -= 1
+            if deleted:
+                latency = time.monotonic() - task.enqueued_at
+                self._metrics.deleted += 1
+                self._metrics.total_drain_latency += latency
+                self._metrics.max_drain_latency = max(
+                    self._metrics.max_drain_latency, latency
+                )
+            else:
+                self._metrics.failed += 1
+                self._leftovers.append(task.user)
+            self._condition.notify_all()
+
+    def __drain_queue(self) -> List[User]:
+        users = []
+        while True:
+            try:
+                users.append(self._queue.get_nowait().user)
+            except queue.Empty:
+                break
+
+        with self._condition:
+            self._pending -= len(users)
+            self._metrics.failed += len(users)
+        return users
@@ -1,27 +1,119 @@
 import inspect
 import logging
-from contextlib import contextmanager
+import re
+from contextlib import contextmanager, nullcontext
 from functools import wraps
-from typing import Callable, TypeVar, Optional, Generator
-
-import allure
+from string import Formatter
+from typing import Any, Callable, TypeVar, Optional, Generator
 
+from src.config.config import CFG
 from src.model.enum.meta.log_level import LogLvl
+from src.util.allure import allure_scope
+from src.util.profiler.step_profiler import StepProfiler
 
 
 T = TypeVar("T")
 
+_LOGGER = logging.getLogger()
+_PROFILER = StepProfiler()
+
+_FIELD_ROOT_PATTERN = re.compile(r"^[^.\[]*")
+_VARIADIC_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_MISSING = object()
+
 
 class SafeDict(dict):
     def __missing__(self, key: str) -> str:
         return f"{{{key}}}"
 
 
+class _MessageFormatter:
+    """
+    Step message template, compiled once per decorated function.
+
+    Only names used in placeholders are resolved on call: module constants (UPPER_CASE)
+    are taken from function globals, arguments - by their position in the signature.
+    """
+
+    def __init__(self, message: str, func: Callable[..., Any]):
+        self._message = message
+        self._globals = getattr(func, "__globals__", {})
+        try:
+            fields = [field for _, field, _, _ in Formatter().parse(message) if field]
+        except ValueError:
+            fields = []
+        self._names = tuple(
+            dict.fromkeys(_FIELD_ROOT_PATTERN.match(field).group() for field in fields)
+        )
+
+        self._signature = inspect.signature(func)
+        params = list(self._signature.parameters.values())
+        self._bind_each_call = any(
+            param.kind in _VARIADIC_KINDS and param.name in self._names for param in params
+        )
+        positions = {
+            param.name: position
+            for position, param in enumerate(params)
+            if param.kind in _POSITIONAL_KINDS
+        }
+        defaults = {
+            param.name: param.default
+            for param in params
+            if param.default is not inspect.Parameter.empty
+        }
+        # (name, is module constant candidate, position in args, default)
+        self._fields = tuple(
+            (name, name.isupper(), positions.get(name, -1), defaults.get(name, _MISSING))
+            for name in self._names
+        )
+
+    def format(self, args: tuple, kwargs: dict) -> str:
+        if not self._fields:
+            return self._message
+
+        arguments = self.__bind(args, kwargs) if self._bind_each_call else None
+        context = SafeDict()
+        for name, is_constant, position, default in self._fields:
+            if is_constant and name in self._globals:
+                value = self._globals[name]
+                if not callable(value):
+                    context[name] = value
+                    continue
+
+            if arguments is not None:
+                if name in arguments:
+                    context[name] = arguments[name]
+            elif name in kwargs:
+                context[name] = kwargs[name]
+            elif 0 <= position < len(args):
+                context[name] = args[position]
+            elif default is not _MISSING:
+                context[name] = default
+
+        try:
+            return self._message.format_map(context)
+        except Exception as exc:
+            return f"{self._message} [format_error: {exc.__class__.__name__}: {exc}]"
+
+    def __bind(self, args: tuple, kwargs: dict) -> dict[str, Any]:
+        bound_args = self._signature.bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+        return bound_args.arguments
+
+
 class StepLogger:
 
     def __init__(self, default_level: int = LogLvl.INFO):
         self.default_level = default_level
 
+    @staticmethod
+    def is_enabled(level: LogLvl) -> bool:
+        return level.code >= CFG.log_lvl.code
+
     def log(
         self,
         message: str,
@@ -29,65 +121,71 @@ class StepLogger:
     ) -> Callable[..., T] | Generator[None, None, None]:
 
         level = log_level or self.default_level
+        level_code = level.code
+        enabled = self.is_enabled(level)
 
         @contextmanager
         def _context_manager():
-            logging.log(level.code, message)
-            with allure.step(message):
+            _log(level_code, message)
+            with allure_scope.step(message), _PROFILER.span(message):
                 yield
 
         def _decorator(func: Callable[..., T]) -> Callable[..., T]:
+            # Steps below LOG_LVL are neither logged nor reported to Allure
+            if not enabled:
+                return func
+
+            formatter = _MessageFormatter(message, func)
+
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs) -> T:
+                    formatted_message = formatter.format(args, kwargs)
+                    _log(level_code, formatted_message)
+                    with (
+                        allure_scope.step(formatted_message),
+                        _PROFILER.span(formatted_message, message),
+                    ):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
 
             @wraps(func)
             def wrapper(*args, **kwargs) -> T:
-                bound_args = inspect.signature(func).bind_partial(*args, **kwargs)
-                bound_args.apply_defaults()
-
-                context = SafeDict(bound_args.arguments)
-
-                self_obj = context.get("self")
-                if self_obj is not None:
-                    context.update(
-                        {
-                            f"self.{attr}": value
-                            for attr, value in vars(self_obj).items()
-                        }
-                    )
-
-                module = inspect.getmodule(func)
-                if module is not None:
-                    module_constants = {
-                        name: value
-                        for name, value in module.__dict__.items()
-                        if name.isupper() and not callable(value)
-                    }
-                    context.update(module_constants)
-
-                try:
-                    formatted_message = message.format_map(context)
-                except Exception as exc:
-                    formatted_message = (
-                        f"{message} [format_error: {exc.__class__.__name__}: {exc}]"
-                    )
-
-                logging.log(level.code, formatted_message)
-                with allure.step(formatted_message):
+                formatted_message = formatter.format(args, kwargs)
+                _log(level_code, formatted_message)
+                with (
+                    allure_scope.step(formatted_message),
+                    _PROFILER.span(formatted_message, message),
+                ):
                     return func(*args, **kwargs)
 
             return wrapper
 
         class _LogWrapper:
             def __enter__(self):
-                self._ctx = _context_manager()
+                self._ctx = _context_manager() if enabled else nullcontext()
                 return self._ctx.__enter__()
 
             def __exit__(self, exc_type, exc_val, exc_tb):
                 return self._ctx.__exit__(exc_type, exc_val, exc_tb)
 
+            async def __aenter__(self):
+                return self.__enter__()
+
+            async def __aexit__(self, exc_type, exc_val, exc_tb):
+                return self.__exit__(exc_type, exc_val, exc_tb)
+
             def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
                 return _decorator(func)
 
         return _LogWrapper()
 
 
+def _log(level_code: int, message: str) -> None:
+    if _LOGGER.isEnabledFor(level_code):
+        _LOGGER.log(level_code, message)
+
+
 step_log = StepLogger()
@@ -0,0 +1,39 @@
+import os
+from contextlib import contextmanager
+from typing import Generator
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def file_lock(abs_path_to_lock_file: str) -> Generator[None, None, None]:
+    """
+    Inter-process exclusive lock (e.g. between pytest-xdist workers).
+    Blocks until the lock is acquired. Lock file is created if not exists and kept after release.
+    :param abs_path_to_lock_file: absolute path to the lock file.
+        Example: "/home/$USER/dev/python/automation_exercise/.cache/catalog.lock"
+    """
+    os.makedirs(os.path.dirname(abs_path_to_lock_file), exist_ok=True)
+    with open(abs_path_to_lock_file, "a+b") as file:
+        if os.name == "nt":
+            file.seek(0)
+            # LK_LOCK retries for ~10 seconds, so keep trying until acquired
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
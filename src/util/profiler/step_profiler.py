@@ -0,0 +1,281 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import ContextManager, Generator, Optional
+
+from src.config.config import CFG
+from src.util import system_util
+from src.util.allure.allure_scope import is_allure_suppressed
+
+_NULL_CONTEXT = nullcontext()
+_SAFE_FILE_NAME_PATTERN = re.compile(r"[^\w.\-]+")
+_SUMMARY_PREFIX = "summary_"
+
+_DEPTH: ContextVar[int] = ContextVar("step_profiler_depth", default=0)
+
+
+@dataclass(frozen=True)
+class _Span:
+    name: str
+    template: str
+    category: str
+    lane: int
+    depth: int
+    start_ns: int
+    end_ns: int
+
+
+@dataclass
+class _TestProfile:
+    nodeid: str
+    started_ns: int = field(default_factory=time.perf_counter_ns)
+    spans: list[_Span] = field(default_factory=list)
+    lanes: dict[int, str] = field(default_factory=dict)
+
+
+@dataclass
+class StepStat:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+
+
+class StepProfiler:
+    """
+    Opt-in (STEP_PROFILER=true) wall time profiler of steps, fixtures and HTTP requests.
+
+    Every test is written to `step-profile/<worker>/` as Chrome trace (`chrome://tracing`, Perfetto)
+    and speedscope (https://www.speedscope.app) JSON. Steps are aggregated by message template:
+    each worker writes `summary_<worker>.json`, the controller merges them into `summary.json`.
+    Steps of background workers (allure suppressed) are not recorded.
+    """
+
+    _instance: Optional["StepProfiler"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._profile = None
+                    instance._stats = {}
+                    instance._storage_lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return CFG.step_profiler
+
+    @staticmethod
+    def results_dir() -> str:
+        return system_util.get_path_in_root("step-profile")
+
+    def span(
+        self, name: str, template: Optional[str] = None, category: str = "step"
+    ) -> ContextManager:
+        if not CFG.step_profiler or self._profile is None or is_allure_suppressed():
+            return _NULL_CONTEXT
+        return self.__record(name, template or name, category)
+
+    def start_test(self, nodeid: str) -> None:
+        if self.is_enabled():
+            self._profile = _TestProfile(nodeid)
+
+    def finish_test(self, worker_id: str) -> None:
+        profile, self._profile = self._profile, None
+        if profile is None:
+            return
+
+        with self._storage_lock:
+            for span in profile.spans:
+                duration_ms = (span.end_ns - span.start_ns) / 1e6
+                self._stats.setdefault(
+                    (span.category, span.template), StepStat()
+                ).add(duration_ms)
+
+        folder = os.path.join(self.results_dir(), worker_id)
+        os.makedirs(folder, exist_ok=True)
+        file_name = _SAFE_FILE_NAME_PATTERN.sub("_", profile.nodeid).strip("_")[:200]
+        _write_json(
+            os.path.join(folder, f"{file_name}.trace.json"), _to_chrome_trace(profile)
+        )
+        _write_json(
+            os.path.join(folder, f"{file_name}.speedscope.json"), _to_speedscope(profile)
+        )
+
+    def write_worker_summary(self, worker_id: str) -> None:
+        with self._storage_lock:
+            stats = [
+                {"category": category, "template": template, **vars(stat)}
+                for (category, template), stat in self._stats.items()
+            ]
+        if stats:
+            os.makedirs(self.results_dir(), exist_ok=True)
+            _write_json(
+                os.path.join(self.results_dir(), f"{_SUMMARY_PREFIX}{worker_id}.json"), stats
+            )
+
+    def write_run_summary(self) -> list[dict]:
+        """Merge workers summaries into `summary.json`. Returns rows sorted by total time"""
+        folder = self.results_dir()
+        if not os.path.isdir(folder):
+            return []
+
+        merged: dict[tuple[str, str], StepStat] = {}
+        for file_name in os.listdir(folder):
+            if not (file_name.startswith(_SUMMARY_PREFIX) and file_name.endswith(".json")):
+                continue
+            with open(os.path.join(folder, file_name), "r", encoding="utf-8") as file:
+                for row in json.load(file):
+                    stat = merged.setdefault((row["category"], row["template"]), StepStat())
+                    stat.count += row["count"]
+                    stat.total_ms += row["total_ms"]
+                    stat.max_ms = max(stat.max_ms, row["max_ms"])
+
+        rows = sorted(
+            (
+                {
+                    "category": category,
+                    "template": template,
+                    "count": stat.count,
+                    "total_ms": round(stat.total_ms, 3),
+                    "avg_ms": round(stat.avg_ms, 3),
+                    "max_ms": round(stat.max_ms, 3),
+                }
+                for (category, template), stat in merged.items()
+            ),
+            key=lambda row: row["total_ms"],
+            reverse=True,
+        )
+        _write_json(os.path.join(folder, "summary.json"), rows)
+        return rows
+
+    @contextmanager
+    def __record(self, name: str, template: str, category: str) -> Generator[None, None, None]:
+        profile = self._profile
+        lane = self.__lane(profile)
+        depth = _DEPTH.get()
+        depth_token = _DEPTH.set(depth + 1)
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            _DEPTH.reset(depth_token)
+            profile.spans.append(
+                _Span(name, template, category, lane, depth, start_ns, end_ns)
+            )
+
+    @staticmethod
+    def __lane(profile: _TestProfile) -> int:
+        """
+        Spans of one lane are strictly nested. Concurrent asyncio tasks and threads
+        get their own lanes, so trace viewers don't mix their steps.
+        """
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            lane, title = id(task), f"{threading.current_thread().name}: {task.get_name()}"
+        else:
+            lane, title = threading.get_ident(), threading.current_thread().name
+        profile.lanes.setdefault(lane, title)
+        return lane
+
+
+def _to_chrome_trace(profile: _TestProfile) -> dict:
+    pid = os.getpid()
+    lane_ids = {lane: i for i, lane in enumerate(profile.lanes, start=1)}
+    events = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": lane_ids[lane],
+            "args": {"name": title},
+        }
+        for lane, title in profile.lanes.items()
+    ]
+    events += [
+        {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "pid": pid,
+            "tid": lane_ids[span.lane],
+            "ts": (span.start_ns - profile.started_ns) / 1000,
+            "dur": (span.end_ns - span.start_ns) / 1000,
+            "args": {"template": span.template},
+        }
+        for span in profile.spans
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"test": profile.nodeid}}
+
+
+def _to_speedscope(profile: _TestProfile) -> dict:
+    frames: dict[str, int] = {}
+    profiles = []
+    for lane, title in profile.lanes.items():
+        spans = sorted(
+            (span for span in profile.spans if span.lane == lane),
+            key=lambda span: (span.start_ns, span.depth),
+        )
+        if not spans:
+            continue
+
+        # Closing events are emitted before opening ones at the same time, inner before outer
+        events = []
+        for span in spans:
+            frame = frames.setdefault(span.name, len(frames))
+            events.append((span.start_ns - profile.started_ns, 1, span.depth, "O", frame))
+            events.append((span.end_ns - profile.started_ns, 0, -span.depth, "C", frame))
+        events.sort(key=lambda event: event[:3])
+
+        profiles.append(
+            {
+                "type": "evented",
+                "name": title,
+                "unit": "nanoseconds",
+                "startValue": events[0][0],
+                "endValue": events[-1][0],
+                "events": [
+                    {"type": kind, "frame": frame, "at": at}
+                    for at, _, _, kind, frame in events
+                ],
+            }
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": profile.nodeid,
+        "exporter": "automation-exercise step profiler",
+        "shared": {"frames": [{"name": name} for name in frames]},
+        "profiles": profiles,
+    }
+
+
+def _write_json(path: str, content) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(content, file, ensure_ascii=False)
+    except Exception as ex:
+        logging.warning(f"Unable to save step profile: {path}. Exception: {ex}")
@@ -0,0 +1,120 @@
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.config.config import CFG
+from src.util.screenshot.tile_hash import TileHashes
+
+
+@dataclass(frozen=True)
+class CachedBaseline:
+    pixels: np.ndarray
+    hashes: TileHashes
+
+
+@dataclass(frozen=True)
+class BaselineCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class BaselineCache:
+    """
+    Process-wide LRU cache of decoded screenshot baselines (read-only RGB arrays and tile hashes).
+
+    Entries are keyed by absolute path and validated by file mtime and size, so a baseline
+    changed on disk is decoded again. Total size of arrays is limited by
+    SCREENSHOT_BASELINE_CACHE_SIZE bytes (0 - cache is disabled), least recently used
+    baselines are evicted first.
+    """
+
+    _instance: Optional["BaselineCache"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._entries = OrderedDict()
+                    instance._size_bytes = 0
+                    instance._hits = 0
+                    instance._misses = 0
+                    instance._evictions = 0
+                    instance._storage_lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
+
+    def get(self, path: str) -> Optional[CachedBaseline]:
+        version = _file_version(path)
+        with self._storage_lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(path)
+                self._hits += 1
+                return entry[1]
+
+            if entry is not None:
+                self.__remove(path)
+            self._misses += 1
+            return None
+
+    def put(self, path: str, pixels: np.ndarray, hashes: TileHashes) -> CachedBaseline:
+        """Stores the baseline of the file current version. Returns stored (read-only) entry"""
+        pixels = np.asarray(pixels)
+        if pixels.flags.writeable:
+            pixels = pixels.copy()
+            pixels.flags.writeable = False
+        baseline = CachedBaseline(pixels, hashes)
+
+        limit = CFG.screenshot_baseline_cache_size
+        if pixels.nbytes > limit:
+            self.invalidate(path)
+            return baseline
+
+        version = _file_version(path)
+        with self._storage_lock:
+            if path in self._entries:
+                self.__remove(path)
+            self._entries[path] = (version, baseline)
+            self._size_bytes += pixels.nbytes
+            while self._size_bytes > limit:
+                self.__remove(next(iter(self._entries)))
+                self._evictions += 1
+        return baseline
+
+    def invalidate(self, path: str) -> None:
+        with self._storage_lock:
+            if path in self._entries:
+                self.__remove(path)
+
+    def stats(self) -> BaselineCacheStats:
+        with self._storage_lock:
+            return BaselineCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def __remove(self, path: str) -> None:
+        _, baseline = self._entries.pop(path)
+        self._size_bytes -= baseline.pixels.nbytes
+
+
+def _file_version(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
+from PIL import Image
+
+from src.util.screenshot.image_util import convert_to_rgb
+from src.util.screenshot.tile_hash import Box
+
+_BACKGROUND = 255
+_DIFF_COLOR = np.array([255, 0, 0], dtype=np.uint8)
+
+
+@dataclass(frozen=True)
+class ImageDiff:
+    mismatch_mask: np.ndarray
+    mismatch_count: int
+    colored_diff: Image.Image
+
+
+def diff_images(
+    expected: Image.Image | np.ndarray,
+    actual: Image.Image | np.ndarray,
+    regions: Optional[Iterable[Box]] = None,
+) -> ImageDiff:
+    """
+    Pixel diff of two images in a single vectorised pass over uint8 arrays.
+
+    Same result as the PIL pipeline (`ImageChops.difference` -> grayscale -> non-zero pixels):
+    a pixel differs if the grayscale value of the channels difference is above 0. Images of
+    different sizes are compared on the max-sized white canvas without padding copies:
+    the part of an image outside of the other one is compared with white.
+    Colored diff is the expected image on the canvas with differing pixels painted red.
+    Images may be passed as RGB arrays (H x W x 3 uint8), e.g. cached baselines.
+
+    `regions` - boxes of the overlap to compare (e.g. tiles with different hashes),
+    the rest of the overlap is known to be identical. None - compare everything.
+    """
+    expected_pixels = to_rgb_pixels(expected)
+    actual_pixels = to_rgb_pixels(actual)
+
+    height = max(expected_pixels.shape[0], actual_pixels.shape[0])
+    width = max(expected_pixels.shape[1], actual_pixels.shape[1])
+    mask = np.zeros((height, width), dtype=bool)
+
+    overlap_height = min(expected_pixels.shape[0], actual_pixels.shape[0])
+    overlap_width = min(expected_pixels.shape[1], actual_pixels.shape[1])
+    if regions is None:
+        regions = [(0, 0, overlap_height, overlap_width)]
+    for top, left, bottom, right in regions:
+        bottom, right = min(bottom, overlap_height), min(right, overlap_width)
+        mask[top:bottom, left:right] = _mismatch(
+            expected_pixels[top:bottom, left:right],
+            actual_pixels[top:bottom, left:right],
+        )
+    for pixels in (expected_pixels, actual_pixels):
+        # Right and bottom parts outside of the overlap are compared with the white canvas
+        if pixels.shape[1] > overlap_width:
+            mask[: pixels.shape[0], overlap_width : pixels.shape[1]] = _mismatch(
+                pixels[:, overlap_width:], _BACKGROUND
+            )
+        if pixels.shape[0] > overlap_height:
+            mask[overlap_height : pixels.shape[0], :overlap_width] = _mismatch(
+                pixels[overlap_height:, :overlap_width], _BACKGROUND
+            )
+
+    if expected_pixels.shape[:2] == (height, width):
+        colored = expected_pixels.copy()
+    else:
+        colored = np.full((height, width, 3), _BACKGROUND, dtype=np.uint8)
+        colored[: expected_pixels.shape[0], : expected_pixels.shape[1]] = expected_pixels
+    colored[mask] = _DIFF_COLOR
+
+    return ImageDiff(
+        mismatch_mask=mask,
+        mismatch_count=int(np.count_nonzero(mask)),
+        colored_diff=Image.fromarray(colored),
+    )
+
+
+def to_rgb_pixels(image: Image.Image | np.ndarray) -> np.ndarray:
+    if isinstance(image, np.ndarray):
+        return image
+    return np.asarray(convert_to_rgb(image))
+
+
+def _mismatch(first: np.ndarray, second: np.ndarray | int) -> np.ndarray:
+    # |a - b| without signed upcast: max(a, b) - min(a, b) stays in uint8
+    channels_diff = np.maximum(first, second)
+    channels_diff -= np.minimum(first, second)
+
+    # PIL grayscale: L = (R*19595 + G*38470 + B*7471 + 0x8000) >> 16, the pixel differs if L > 0.
+    # For channel differences it is exactly: G > 0, or 3*min(R, 2) + min(B, 5) >= 5
+    # (R >= 2, B >= 5, or R == 1 and B >= 2), computed in uint8 without overflow.
+    red, green, blue = channels_diff[..., 0], channels_diff[..., 1], channels_diff[..., 2]
+    mismatch = green != 0
+    mismatch |= np.minimum(red, 2) * 3 + np.minimum(blue, 5) >= 5
+    return mismatch
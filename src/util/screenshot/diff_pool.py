@@ -0,0 +1,67 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from src.config.config import CFG
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+
+
+@dataclass(frozen=True)
+class PendingScreenshotCheck:
+    title: str
+    path_to_screenshot: str
+    future: Future
+
+
+class ScreenshotDiffPool:
+    """
+    Opt-in (SCREENSHOT_DIFF_WORKERS > 0) process pool of screenshot comparisons,
+    one per xdist worker.
+
+    Submitted comparisons are kept per test: the test continues driving the browser,
+    verdicts are collected with `pop()` at the end of the test or at an explicit sync point
+    (see `screenshot_util.check_pending_screenshots`).
+    """
+
+    _instance: Optional["ScreenshotDiffPool"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._executor = None
+                    instance._pending = {}
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return CFG.screenshot_diff_workers > 0
+
+    def submit(
+        self, title: str, path_to_screenshot: str, compare: Callable, *args
+    ) -> Future:
+        """`compare` and its arguments are pickled: it must be a module level function"""
+        test_name = ThreadSafeTestThreadsStore().current_thread_test_name()
+        with self._lock:
+            if self._executor is None:
+                # spawn: forking a process with driver, allure and HTTP threads is not safe
+                self._executor = ProcessPoolExecutor(
+                    max_workers=CFG.screenshot_diff_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                atexit.register(self._executor.shutdown, cancel_futures=True)
+            future = self._executor.submit(compare, *args)
+            self._pending.setdefault(test_name, []).append(
+                PendingScreenshotCheck(title, path_to_screenshot, future)
+            )
+        return future
+
+    def pop(self, test_name: str) -> list[PendingScreenshotCheck]:
+        with self._lock:
+            return self._pending.pop(test_name, [])
@@ -0,0 +1,213 @@
+import base64
+import io
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from PIL import Image
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from src.config.config import CFG
+from src.util.screenshot import image_util
+
+_MAX_CACHED_SESSIONS = 32
+_DPR_BY_SESSION: OrderedDict[str, float] = OrderedDict()
+_DPR_LOCK = threading.Lock()
+
+_SCROLL_AND_SETTLE_SCRIPT = """
+const [elements, done] = arguments;
+const top = Math.min(...elements.map(element => element.getBoundingClientRect().top));
+if (top < 0 || top >= window.innerHeight) {
+    window.scrollBy(0, top);
+}
+// Two frames: scroll is applied and the page is painted
+requestAnimationFrame(() => requestAnimationFrame(() => done(null)));
+"""
+_LAYOUT_SCRIPT = """
+return {
+    dpr: window.devicePixelRatio || 1,
+    viewport: [window.innerWidth, window.innerHeight],
+    rects: arguments[0].map(element => {
+        const rect = element.getBoundingClientRect();
+        return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+    }),
+    scroll: [window.scrollX, window.scrollY],
+};
+"""
+# Rect changes below this (CSS px) are rounding, not a layout change
+_RECT_TOLERANCE = 0.5
+_PAGE_RECT_SCRIPT = """
+const rect = arguments[0].getBoundingClientRect();
+return [rect.left + window.scrollX, rect.top + window.scrollY, rect.width, rect.height];
+"""
+
+
+def capture_element(driver: WebDriver, web_element: WebElement) -> Image.Image:
+    """
+    Screenshot of the element pixels only, in device pixels (ELEMENT_SCREENSHOT_MODE):
+        - element: WebDriver element screenshot, the browser scrolls and applies DPR;
+        - cdp: Chrome DevTools `Page.captureScreenshot` of the element clip region,
+            falls back to `element` if the driver has no CDP (e.g. Firefox, remote Chrome);
+        - crop: viewport screenshot cropped in Python (DPR is requested once per session).
+    """
+    match CFG.element_screenshot_mode:
+        case "cdp" if hasattr(driver, "execute_cdp_cmd"):
+            png = _capture_cdp_clip(driver, web_element)
+        case "crop":
+            return _capture_viewport_crop(driver, web_element)
+        case _:
+            png = web_element.screenshot_as_png
+    return Image.open(io.BytesIO(png))
+
+
+def capture_regions(driver: WebDriver, web_elements: list[WebElement]) -> list[Image.Image]:
+    """
+    Screenshots of several elements taken from one frame, in device pixels.
+
+    Elements are scrolled to and the page is settled before rects are measured. Only the union
+    of element rects is captured (Chrome DevTools clip, beyond the viewport only if the union
+    doesn't fit in it), other drivers capture the viewport. Rects are measured again after
+    the capture: elements which moved (or are out of the captured viewport) are captured
+    one by one.
+    """
+    if not web_elements:
+        return []
+
+    driver.execute_async_script(_SCROLL_AND_SETTLE_SCRIPT, web_elements)
+    layout = driver.execute_script(_LAYOUT_SCRIPT, web_elements)
+    dpr = float(layout["dpr"])
+    scroll_x, scroll_y = layout["scroll"]
+    union = _union(layout["rects"])
+
+    clip_png = _capture_cdp_union(driver, union, layout["viewport"], (scroll_x, scroll_y))
+    if clip_png is not None:
+        frame = Image.open(io.BytesIO(clip_png))
+        origin_x, origin_y = union[0], union[1]
+    else:
+        frame = Image.open(io.BytesIO(driver.get_screenshot_as_png()))
+        origin_x, origin_y = scroll_x, scroll_y
+
+    rects_after = driver.execute_script(_LAYOUT_SCRIPT, web_elements)["rects"]
+
+    screenshots = []
+    for web_element, rect, rect_after in zip(web_elements, layout["rects"], rects_after):
+        left, top, width, height = rect
+        box = (
+            int((left - origin_x) * dpr),
+            int((top - origin_y) * dpr),
+            int((left - origin_x) * dpr) + int(width * dpr),
+            int((top - origin_y) * dpr) + int(height * dpr),
+        )
+        if (
+            not _same_rect(rect, rect_after)
+            or box[0] < 0
+            or box[1] < 0
+            or box[2] > frame.width
+            or box[3] > frame.height
+        ):
+            screenshots.append(capture_element(driver, web_element))
+        else:
+            screenshots.append(frame.crop(box))
+    return screenshots
+
+
+def device_pixel_ratio(driver: WebDriver) -> float:
+    """Cached per browser session, the window is not moved between screens during tests"""
+    session_id = driver.session_id
+    with _DPR_LOCK:
+        dpr = _DPR_BY_SESSION.get(session_id)
+        if dpr is not None:
+            _DPR_BY_SESSION.move_to_end(session_id)
+            return dpr
+
+    dpr = float(driver.execute_script("return window.devicePixelRatio;") or 1)
+    with _DPR_LOCK:
+        _DPR_BY_SESSION[session_id] = dpr
+        while len(_DPR_BY_SESSION) > _MAX_CACHED_SESSIONS:
+            _DPR_BY_SESSION.popitem(last=False)
+    return dpr
+
+
+def _capture_cdp_clip(driver: WebDriver, web_element: WebElement) -> bytes:
+    x, y, width, height = driver.execute_script(_PAGE_RECT_SCRIPT, web_element)
+    try:
+        result = driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {
+                "format": "png",
+                "captureBeyondViewport": True,
+                "clip": {"x": x, "y": y, "width": width, "height": height, "scale": 1},
+            },
+        )
+    except Exception as ex:
+        logging.warning(f"Unable to capture element by CDP, WebDriver screenshot is used: {ex}")
+        return web_element.screenshot_as_png
+    return base64.b64decode(result["data"])
+
+
+def _capture_cdp_union(
+    driver: WebDriver,
+    union: tuple[float, float, float, float],
+    viewport: tuple[float, float],
+    scroll: tuple[float, float],
+) -> Optional[bytes]:
+    """Clip of the union rect (page coordinates). None if the driver has no CDP"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+
+    left, top, right, bottom = union
+    in_viewport = (
+        left >= scroll[0]
+        and top >= scroll[1]
+        and right <= scroll[0] + viewport[0]
+        and bottom <= scroll[1] + viewport[1]
+    )
+    try:
+        result = driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {
+                "format": "png",
+                # Capturing beyond the viewport resizes the page, avoided when possible
+                "captureBeyondViewport": not in_viewport,
+                "clip": {
+                    "x": left,
+                    "y": top,
+                    "width": right - left,
+                    "height": bottom - top,
+                    "scale": 1,
+                },
+            },
+        )
+    except Exception as ex:
+        logging.warning(f"Unable to capture elements by CDP, viewport screenshot is used: {ex}")
+        return None
+    return base64.b64decode(result["data"])
+
+
+def _union(rects: list[list[float]]) -> tuple[float, float, float, float]:
+    """(left, top, right, bottom) of the rects (left, top, width, height)"""
+    return (
+        min(left for left, _, _, _ in rects),
+        min(top for _, top, _, _ in rects),
+        max(left + width for left, _, width, _ in rects),
+        max(top + height for _, top, _, height in rects),
+    )
+
+
+def _same_rect(first: list[float], second: list[float]) -> bool:
+    return all(abs(a - b) <= _RECT_TOLERANCE for a, b in zip(first, second))
+
+
+def _capture_viewport_crop(driver: WebDriver, web_element: WebElement) -> Image.Image:
+    location = web_element.location_once_scrolled_into_view
+    size = web_element.size
+    dpr = device_pixel_ratio(driver)
+
+    image = Image.open(io.BytesIO(driver.get_screenshot_as_png()))
+    return image_util.crop_image(
+        image=image,
+        location={"x": int(location["x"] * dpr), "y": int(location["y"] * dpr)},
+        size={"width": int(int(size["width"]) * dpr), "height": int(int(size["height"]) * dpr)},
+    )
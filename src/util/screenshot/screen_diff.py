@@ -1,31 +1,43 @@
+from dataclasses import dataclass, replace
+from typing import Iterable, Optional
+
+import numpy as np
 from PIL import Image
 
 from src.util.allure.allure_util import AllureUtil
-from src.util.screenshot import image_util
+from src.util.allure.attachment_writer import BodySupplier
+from src.util.screenshot.diff_engine import diff_images, to_rgb_pixels
 from src.util.screenshot.screen_diff_table import DiffTable, DiffTableRow
+from src.util.screenshot.tile_hash import Box
 
 _MAX_PERCENT_OF_TOLERANCE = 0.2
 _MIN_RATIO_DIFF = 1.0 - _MAX_PERCENT_OF_TOLERANCE
 _MAX_RATIO_DIFF = 1.0 + _MAX_PERCENT_OF_TOLERANCE
 
 
+def check_percent_of_tolerance(percent_of_tolerance: float) -> None:
+    if not (0.0 <= percent_of_tolerance <= _MAX_PERCENT_OF_TOLERANCE):
+        raise ValueError(
+            f"Illegal percent of tolerance value. "
+            f"Allowed between [0, {_MAX_PERCENT_OF_TOLERANCE}]"
+        )
+
+
 class ScreenDiffResult:
 
     def __init__(
         self,
-        expected: Image.Image,
-        actual: Image.Image,
+        expected: Image.Image | np.ndarray,
+        actual: Image.Image | np.ndarray,
         percent_of_tolerance: float = 0.0,
+        regions: Optional[Iterable[Box]] = None,
     ):
-        if not (0.0 <= percent_of_tolerance <= _MAX_PERCENT_OF_TOLERANCE):
-            raise ValueError(
-                f"Illegal percent of tolerance value. "
-                f"Allowed between [0, {_MAX_PERCENT_OF_TOLERANCE}]"
-            )
+        check_percent_of_tolerance(percent_of_tolerance)
 
         self.__expected = expected
         self.__actual = actual
         self.__percent_of_tolerance = percent_of_tolerance
+        self.__regions = regions
         self.__has_diff = self.__calculate_diff()
 
     @property
@@ -33,18 +45,17 @@ class ScreenDiffResult:
         return self.__has_diff
 
     def __calculate_diff(self) -> bool:
-        expected_image_pixels = self.__expected.width * self.__expected.height
-        actual_image_pixels = self.__actual.width * self.__actual.height
-        n_exp_img, n_act_img = image_util.normalize_images(
-            self.__expected, self.__actual
-        )
-        diff_image = image_util.get_diff_image(n_exp_img, n_act_img)
-        self.__colored_diff_image = image_util.colored_diff_image(n_exp_img, diff_image)
+        expected_pixels = to_rgb_pixels(self.__expected)
+        actual_pixels = to_rgb_pixels(self.__actual)
+        expected_image_pixels = expected_pixels.shape[0] * expected_pixels.shape[1]
+        actual_image_pixels = actual_pixels.shape[0] * actual_pixels.shape[1]
+        image_diff = diff_images(expected_pixels, actual_pixels, self.__regions)
+        self.__colored_diff_image = image_diff.colored_diff
 
         self.__expected_diff_size = int(
             round(expected_image_pixels * self.__percent_of_tolerance)
         )
-        self.__actual_diff_size = image_util.calculate_diff_pixels(diff_image)
+        self.__actual_diff_size = image_diff.mismatch_count
         self.__actual_diff_percent = self.__actual_diff_size / expected_image_pixels
         size_ratio = expected_image_pixels / actual_image_pixels
         invalid_resolution = (
@@ -69,8 +80,45 @@ class ScreenDiffResult:
 
         return invalid_resolution or has_diff
 
-    def attach_diff_to_allure(self):
-        AllureUtil.attach_screen_diff(
-            self.__expected, self.__actual, self.__colored_diff_image
+    def verdict(self) -> "ScreenshotVerdict":
+        return ScreenshotVerdict(
+            has_diff=self.__has_diff,
+            diff_table=self.__diff_table,
+            diff_content=lambda: AllureUtil.screen_diff_content(
+                _to_image(self.__expected),
+                _to_image(self.__actual),
+                self.__colored_diff_image,
+            ),
         )
-        AllureUtil.attach_screen_diff_table(self.__diff_table)
+
+    def attach_diff_to_allure(self):
+        self.verdict().attach_to_allure()
+
+
+@dataclass(frozen=True)
+class ScreenshotVerdict:
+    """
+    Result of a screenshot comparison. No diff table - the capture is identical
+    to the baseline, nothing is attached. Diff content is built lazily on attach,
+    or in advance by the diff process.
+    """
+
+    has_diff: bool
+    diff_table: Optional[str] = None
+    diff_content: Optional[BodySupplier] = None
+
+    def resolved(self) -> "ScreenshotVerdict":
+        """Verdict with built diff content, can be passed between processes"""
+        if not callable(self.diff_content):
+            return self
+        return replace(self, diff_content=self.diff_content())
+
+    def attach_to_allure(self) -> None:
+        if self.diff_table is None:
+            return
+        AllureUtil.attach_screen_diff_content(self.diff_content)
+        AllureUtil.attach_screen_diff_table(self.diff_table)
+
+
+def _to_image(image: Image.Image | np.ndarray) -> Image.Image:
+    return Image.fromarray(image) if isinstance(image, np.ndarray) else image
@@ -1,15 +1,26 @@
-import io
+import logging
 import os
 import time
 
+import numpy as np
 from PIL import Image
 from selene import browser, Element
-from selenium.webdriver.remote.webdriver import WebDriver
 
 from src.config.config import CFG
+from src.model.screenshot_check import ScreenshotCheck
 from src.util import system_util
-from src.util.screenshot import image_util
-from src.util.screenshot.screen_diff import ScreenDiffResult
+from src.util.decorator.step_logger import step_log
+from src.util.screenshot import element_capture, image_util, tile_hash
+from src.util.screenshot.baseline_cache import BaselineCache
+from src.util.screenshot.diff_engine import to_rgb_pixels
+from src.util.screenshot.diff_pool import ScreenshotDiffPool
+from src.util.screenshot.screen_diff import (
+    ScreenDiffResult,
+    ScreenshotVerdict,
+    check_percent_of_tolerance,
+)
+from src.util.screenshot.tile_hash import TileHashes
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
 
 
 def take_element_screenshot(
@@ -17,24 +28,23 @@ def take_element_screenshot(
 ) -> Image.Image:
 
     web_element = element()
-    location = web_element.location_once_scrolled_into_view
+    # Scroll before waiting: lazy content and animations settle during the timeout
+    web_element.location_once_scrolled_into_view
 
     if hover:
         element.hover()
     if timeout > 0:
         time.sleep(timeout)
 
-    size = web_element.size
-    location, size = __transform_coordinates(browser.driver, location, size)
+    return element_capture.capture_element(browser.driver, web_element)
 
-    bytes_image = io.BytesIO(browser.driver.get_screenshot_as_png())
-    image = Image.open(bytes_image)
 
-    return image_util.crop_image(
-        image=image,
-        location=location,
-        size=size,
-    )
+def take_elements_screenshots(elements: list[Element], timeout: float) -> list[Image.Image]:
+    """Screenshots of all elements, cropped from one capture"""
+    web_elements = [element() for element in elements]
+    if timeout > 0:
+        time.sleep(timeout)
+    return element_capture.capture_regions(browser.driver, web_elements)
 
 
 def compare_and_save_screenshot(
@@ -45,40 +55,183 @@ def compare_and_save_screenshot(
     component_name: str = "Component",
 ) -> None:
 
+    check_percent_of_tolerance(percent_of_tolerance)
+    if ScreenshotDiffPool.is_enabled():
+        # Verdict is asserted after the test body, see check_pending_screenshots()
+        __submit(
+            component_name,
+            actual_screenshot,
+            path_to_screenshot,
+            percent_of_tolerance,
+            rewrite_screenshot,
+        )
+        return
+
+    verdict = compare_with_baseline(
+        actual_screenshot, path_to_screenshot, percent_of_tolerance, rewrite_screenshot
+    )
+    verdict.attach_to_allure()
+    if verdict.has_diff and not CFG.rewrite_all_screenshots:
+        raise AssertionError(f"{component_name} screenshot mismatch")
+
+
+def compare_and_save_screenshots(
+    checks: list[ScreenshotCheck], timeout: float, title: str = "Page"
+) -> None:
+    """
+    Batch of screenshot assertions from one capture.
+    Every region is compared in its own step, all mismatching regions are reported together.
+    """
+    for check in checks:
+        check_percent_of_tolerance(check.percent_of_tolerance)
+
+    screenshots = take_elements_screenshots([check.element for check in checks], timeout)
+
+    if ScreenshotDiffPool.is_enabled():
+        for check, screenshot in zip(checks, screenshots):
+            __submit(
+                check.title,
+                screenshot,
+                check.path_to_screenshot,
+                check.percent_of_tolerance,
+                check.rewrite_screenshot,
+            )
+        return
+
+    mismatches = []
+    for check, screenshot in zip(checks, screenshots):
+        with step_log.log(
+            f"Check [{check.title}] has expected screenshot: {check.path_to_screenshot}"
+        ):
+            verdict = compare_with_baseline(
+                screenshot,
+                check.path_to_screenshot,
+                check.percent_of_tolerance,
+                check.rewrite_screenshot,
+            )
+            verdict.attach_to_allure()
+            if verdict.has_diff:
+                mismatches.append(f"{check.title}: {check.path_to_screenshot}")
+
+    __raise_mismatches(title, mismatches, [], len(checks))
+
+
+def check_pending_screenshots(raise_on_mismatch: bool = True) -> None:
+    """
+    Sync point of SCREENSHOT_DIFF_WORKERS mode: waits for comparisons of the current test,
+    attaches their diffs and reports all mismatches in one assertion error.
+    Called after the test body (tests/conftest.py), a test may call it earlier.
+    """
+    test_name = ThreadSafeTestThreadsStore().current_thread_test_name()
+    pending = ScreenshotDiffPool().pop(test_name)
+    if not pending:
+        return
+
+    mismatches, errors = [], []
+    for check in pending:
+        with step_log.log(
+            f"Check [{check.title}] has expected screenshot: {check.path_to_screenshot}"
+        ):
+            try:
+                verdict = check.future.result()
+            except Exception as ex:
+                logging.error(
+                    f"Unable to compare screenshot [{check.path_to_screenshot}]: {ex!r}"
+                )
+                errors.append(f"{check.title}: {check.path_to_screenshot} ({ex!r})")
+                continue
+
+            verdict.attach_to_allure()
+            if verdict.has_diff:
+                mismatches.append(f"{check.title}: {check.path_to_screenshot}")
+
+    if raise_on_mismatch:
+        __raise_mismatches("Deferred", mismatches, errors, len(pending))
+
+
+def compare_with_baseline(
+    actual_screenshot: Image.Image | np.ndarray,
+    path_to_screenshot: str,
+    percent_of_tolerance: float,
+    rewrite_screenshot: bool,
+) -> ScreenshotVerdict:
+    """Compares the screenshot with its baseline and saves it if required. Nothing is attached"""
     abs_path = system_util.get_path_in_resources(path_to_screenshot)
     expected_not_exists = not os.path.exists(abs_path)
+    actual_pixels = to_rgb_pixels(actual_screenshot)
 
     if expected_not_exists:
-        image_util.create_blank_image(abs_path, actual_screenshot.size)
+        height, width = actual_pixels.shape[:2]
+        image_util.create_blank_image(abs_path, (width, height))
+
+    # Pixel-identical capture: the baseline is not decoded, no diff artifacts
+    actual_hashes = TileHashes.of(actual_pixels)
+    baseline = BaselineCache().get(abs_path)
+    expected_hashes = (
+        baseline.hashes if baseline else tile_hash.load_baseline_hashes(abs_path)
+    )
+    if expected_hashes is not None and expected_hashes == actual_hashes:
+        return ScreenshotVerdict(has_diff=False)
+
+    if baseline is None:
+        expected_pixels = to_rgb_pixels(Image.open(abs_path, formats=["PNG"]))
+        if expected_hashes is None:
+            expected_hashes = TileHashes.of(expected_pixels)
+            tile_hash.save_baseline_hashes(abs_path, expected_hashes)
+        baseline = BaselineCache().put(abs_path, expected_pixels, expected_hashes)
 
-    expected_screenshot = Image.open(abs_path, formats=["PNG"])
     screen_diff = ScreenDiffResult(
-        expected=expected_screenshot,
-        actual=actual_screenshot,
+        expected=baseline.pixels,
+        actual=actual_pixels,
         percent_of_tolerance=percent_of_tolerance,
+        regions=baseline.hashes.mismatching_tiles(actual_hashes),
     )
 
     if expected_not_exists or CFG.rewrite_all_screenshots or rewrite_screenshot:
+        if isinstance(actual_screenshot, np.ndarray):
+            actual_screenshot = Image.fromarray(actual_screenshot)
         actual_screenshot.save(abs_path, save_all=True)
+        tile_hash.save_baseline_hashes(abs_path, actual_hashes)
+        BaselineCache().put(abs_path, actual_pixels, actual_hashes)
 
-    screen_diff.attach_diff_to_allure()
+    return screen_diff.verdict()
+
+
+def __submit(
+    title: str,
+    actual_screenshot: Image.Image,
+    path_to_screenshot: str,
+    percent_of_tolerance: float,
+    rewrite_screenshot: bool,
+) -> None:
+    ScreenshotDiffPool().submit(
+        title,
+        path_to_screenshot,
+        __compare_in_process,
+        to_rgb_pixels(actual_screenshot),
+        path_to_screenshot,
+        percent_of_tolerance,
+        rewrite_screenshot,
+    )
 
-    if screen_diff.has_diff and not CFG.rewrite_all_screenshots:
-        raise AssertionError(f"{component_name} screenshot mismatch")
 
+def __compare_in_process(
+    actual_pixels: np.ndarray,
+    path_to_screenshot: str,
+    percent_of_tolerance: float,
+    rewrite_screenshot: bool,
+) -> ScreenshotVerdict:
+    """Runs in ScreenshotDiffPool process: PNG encoding of the diff is done there as well"""
+    return compare_with_baseline(
+        actual_pixels, path_to_screenshot, percent_of_tolerance, rewrite_screenshot
+    ).resolved()
 
-def __transform_coordinates(
-    driver: WebDriver,
-    location: dict[str, int],
-    size: dict[str, int],
-) -> tuple[dict[str, int], dict[str, int]]:
-    dpr: float = float(driver.execute_script("return window.devicePixelRatio;") or 1)
-    location = {
-        "x": int(int(location["x"] * dpr)),
-        "y": int(int(location["y"] * dpr)),
-    }
-    size = {
-        "width": int(int(size["width"]) * dpr),
-        "height": int(int(size["height"]) * dpr),
-    }
-    return location, size
+
+def __raise_mismatches(
+    title: str, mismatches: list[str], errors: list[str], total: int
+) -> None:
+    if errors or (mismatches and not CFG.rewrite_all_screenshots):
+        raise AssertionError(
+            f"{title} screenshots mismatch [{len(mismatches) + len(errors)} of {total}]:\n"
+            + "\n".join(f"  - {failure}" for failure in [*mismatches, *errors])
+        )
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+from src.util import system_util
+
+TILE_SIZE = 256
+_SIDECAR_SUFFIX = ".tiles.json"
+_PROJECT_DIR = system_util.get_path_in_root("")
+_SIDECAR_DIR = system_util.get_path_in_root(".cache/screenshot_tiles")
+_SIDECAR_VERSION = 1
+
+# (top, left, bottom, right)
+Box = tuple[int, int, int, int]
+
+
+@dataclass(frozen=True)
+class TileHashes:
+    width: int
+    height: int
+    tile_size: int
+    hashes: list[str]
+
+    @staticmethod
+    def of(pixels: np.ndarray, tile_size: int = TILE_SIZE) -> "TileHashes":
+        """Hashes of RGB pixels (H x W x 3 uint8) tiles, row by row"""
+        height, width = pixels.shape[:2]
+        return TileHashes(
+            width=width,
+            height=height,
+            tile_size=tile_size,
+            hashes=[
+                hashlib.blake2b(
+                    np.ascontiguousarray(pixels[top:bottom, left:right]).data,
+                    digest_size=16,
+                ).hexdigest()
+                for top, left, bottom, right in tile_boxes(width, height, tile_size)
+            ],
+        )
+
+    def mismatching_tiles(self, other: "TileHashes") -> Optional[list[Box]]:
+        """Boxes of differing tiles. None - sizes differ, images can't be compared by tiles"""
+        if (self.width, self.height, self.tile_size) != (
+            other.width,
+            other.height,
+            other.tile_size,
+        ):
+            return None
+        return [
+            box
+            for box, hash_, other_hash in zip(
+                tile_boxes(self.width, self.height, self.tile_size), self.hashes, other.hashes
+            )
+            if hash_ != other_hash
+        ]
+
+
+def tile_boxes(width: int, height: int, tile_size: int = TILE_SIZE) -> Iterator[Box]:
+    for top in range(0, height, tile_size):
+        for left in range(0, width, tile_size):
+            yield top, left, min(top + tile_size, height), min(left + tile_size, width)
+
+
+def load_baseline_hashes(baseline_path: str) -> Optional[TileHashes]:
+    """
+    Tile hashes of the baseline, kept out of the tracked resources in
+    `.cache/screenshot_tiles/<baseline path relative to the project>.tiles.json`.
+    None if the sidecar is absent or was made for other content of the baseline file.
+    """
+    try:
+        with open(_sidecar_path(baseline_path), "r", encoding="utf-8") as file:
+            sidecar = json.load(file)
+        if (
+            sidecar.get("version") != _SIDECAR_VERSION
+            or sidecar.get("baseline_digest") != _file_digest(baseline_path)
+        ):
+            return None
+        return TileHashes(**sidecar["tiles"])
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        logging.warning(f"Unable to read screenshot tile hashes of [{baseline_path}]: {ex}")
+        return None
+
+
+def save_baseline_hashes(baseline_path: str, hashes: TileHashes) -> None:
+    try:
+        sidecar_path = _sidecar_path(baseline_path)
+        os.makedirs(os.path.dirname(sidecar_path), exist_ok=True)
+        with open(sidecar_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": _SIDECAR_VERSION,
+                    "baseline_digest": _file_digest(baseline_path),
+                    "tiles": asdict(hashes),
+                },
+                file,
+            )
+    except Exception as ex:
+        logging.warning(f"Unable to save screenshot tile hashes of [{baseline_path}]: {ex}")
+
+
+def _sidecar_path(baseline_path: str) -> str:
+    relative_path = os.path.relpath(os.path.abspath(baseline_path), _PROJECT_DIR)
+    if relative_path.startswith(os.pardir):
+        # Baseline outside of the project: keyed by its absolute path
+        relative_path = os.path.join(
+            "external",
+            hashlib.sha256(os.path.abspath(baseline_path).encode()).hexdigest()[:16],
+            os.path.basename(baseline_path),
+        )
+    return os.path.join(_SIDECAR_DIR, relative_path + _SIDECAR_SUFFIX)
+
+
+def _file_digest(path: str) -> str:
+    """Reading the PNG is much cheaper than decoding it"""
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
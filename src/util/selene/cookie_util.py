@@ -1,3 +1,4 @@
+from typing import Optional
 from urllib.parse import urlparse
 
 from selene import browser
@@ -25,6 +26,11 @@ class CookieUtil:
             }
         )
 
+    @staticmethod
+    def get_app_cookie(name: str) -> Optional[str]:
+        cookie = browser.driver.get_cookie(name)
+        return cookie["value"] if cookie else None
+
     @staticmethod
     def add_cookies_to_browser(cookies: dict) -> None:
         for name, value in cookies.items():
@@ -0,0 +1,162 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from src.config.config import CFG
+from src.model.auth_session import AuthSession
+from src.util import system_util
+from src.util.file_lock_util import file_lock
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+
+_CACHE_DIR = system_util.get_path_in_root(".cache")
+
+
+class ThreadSafeAuthSessionStore:
+    """
+    Authenticated sessions (csrf + sessionid) by credentials, valid for AUTH_SESSION_TTL seconds.
+
+    With AUTH_SESSION_CACHE_SHARED sessions are kept in `.cache/auth_sessions_<url hash>.json`
+    under a file lock, so xdist workers reuse one login. A session is leased by one test
+    at a time. Reused sessions are checked by the caller (see AuthApiService.sign_in).
+    Passwords are never stored, credentials are keyed by their sha256.
+    """
+
+    _instance: Optional["ThreadSafeAuthSessionStore"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._sessions = {}
+                    cls._instance._storage_lock = threading.RLock()
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return CFG.auth_session_ttl > 0
+
+    @staticmethod
+    def cache_path() -> str:
+        url_hash = hashlib.sha1(CFG.base_url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(_CACHE_DIR, f"auth_sessions_{url_hash}.json")
+
+    def get_session(self, email: str, password: str) -> Optional[AuthSession]:
+        """
+        Free valid session of the credentials, leased to the current test until `release()`.
+        A session used by another running test is never returned: the caller signs in again.
+        """
+        if not self.is_enabled():
+            return None
+
+        key = _key(email, password)
+        owner = _current_owner()
+        leased = []
+
+        def lease(sessions: dict[str, AuthSession]) -> None:
+            session = sessions.get(key)
+            if session is None:
+                return
+            if not session.is_valid(time.time()):
+                del sessions[key]
+                return
+            if session.owner and session.owner != owner:
+                return
+            sessions[key] = dataclasses.replace(session, owner=owner)
+            leased.append(sessions[key])
+
+        self._update(lease)
+        return leased[0] if leased else None
+
+    def add_session(self, password: str, session: AuthSession) -> None:
+        """Stores the new session, leased to the current test"""
+        if not self.is_enabled():
+            return
+
+        key = _key(session.email, password)
+        session = dataclasses.replace(session, owner=_current_owner())
+        self._update(lambda sessions: sessions.update({key: session}))
+
+    def release(self) -> None:
+        """Sessions of the current test become available for other tests"""
+        if not self.is_enabled():
+            return
+
+        owner = _current_owner()
+
+        def release_owned(sessions: dict[str, AuthSession]) -> None:
+            for key, session in sessions.items():
+                if session.owner == owner:
+                    sessions[key] = dataclasses.replace(session, owner="")
+
+        self._update(release_owned)
+
+    def invalidate_by_email(self, email: str) -> None:
+        self._invalidate(lambda session: session.email == email)
+
+    def invalidate_by_session_id(self, session_id: Optional[str]) -> None:
+        if session_id:
+            self._invalidate(lambda session: session.session_id == session_id)
+
+    def clear(self) -> None:
+        self._invalidate(lambda session: True)
+
+    def _invalidate(self, predicate) -> None:
+        def remove_matched(sessions: dict[str, AuthSession]) -> None:
+            for key in [k for k, s in sessions.items() if predicate(s)]:
+                del sessions[key]
+
+        if self.is_enabled():
+            self._update(remove_matched)
+
+    def _update(self, update) -> None:
+        """The shared file is re-read on every access: other workers may change it"""
+        with self._storage_lock:
+            if CFG.auth_session_cache_shared:
+                self._update_file(update)
+            else:
+                update(self._sessions)
+
+    def _update_file(self, update) -> None:
+        path = self.cache_path()
+        with file_lock(f"{path}.lock"):
+            sessions = self._read_file()
+            update(sessions)
+            now = time.time()
+            content = {
+                key: dataclasses.asdict(session)
+                for key, session in sessions.items()
+                if session.is_valid(now)
+            }
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as file:
+                    json.dump(content, file)
+                os.replace(tmp_path, path)
+            except Exception as ex:
+                logging.warning(f"Unable to save auth sessions: {path}. Exception: {ex}")
+
+    def _read_file(self) -> dict[str, AuthSession]:
+        path = self.cache_path()
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return {key: AuthSession(**value) for key, value in json.load(file).items()}
+        except Exception as ex:
+            logging.warning(f"Unable to read auth sessions: {path}. Exception: {ex}")
+            return {}
+
+
+def _current_owner() -> str:
+    return f"{os.getpid()}:{ThreadSafeTestThreadsStore().current_thread_test_name()}"
+
+
+def _key(email: str, password: str) -> str:
+    return hashlib.sha256(f"{email}\n{password}".encode("utf-8")).hexdigest()
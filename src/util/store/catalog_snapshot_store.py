@@ -0,0 +1,155 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from http import HTTPStatus
+from typing import Optional
+
+from pydantic import TypeAdapter
+
+from src.client.brand_api_client import BrandApiClient
+from src.client.core.condition.conditions import Conditions
+from src.client.product_api_client import ProductApiClient
+from src.config.config import CFG
+from src.model.dto.brand_response import BrandResponseDTO
+from src.model.dto.product.product_response import ProductResponseDTO
+from src.util import system_util
+from src.util.file_lock_util import file_lock
+
+_SNAPSHOT_DIR = system_util.get_path_in_root(".cache")
+_PRODUCTS_ADAPTER = TypeAdapter(list[ProductResponseDTO])
+_BRANDS_ADAPTER = TypeAdapter(list[BrandResponseDTO])
+
+
+class ThreadSafeCatalogSnapshotStore:
+    """
+    Products and brands lists, loaded lazily on first access.
+
+    Raw JSON is persisted to `.cache/catalog_<base api url hash>.json` together with its sha256,
+    and reused while younger than CATALOG_SNAPSHOT_TTL seconds. The snapshot is read and written
+    under a file lock, so only one xdist worker per TTL fetches the catalog from the API.
+    """
+
+    _instance: Optional["ThreadSafeCatalogSnapshotStore"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._payload = None
+                    cls._instance._storage_lock = threading.Lock()
+        return cls._instance
+
+    @staticmethod
+    def snapshot_path() -> str:
+        url_hash = hashlib.sha1(CFG.base_api_url.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(_SNAPSHOT_DIR, f"catalog_{url_hash}.json")
+
+    def get_products(self) -> list[ProductResponseDTO]:
+        return _PRODUCTS_ADAPTER.validate_python(self._get_payload()["products"])
+
+    def get_brands(self) -> list[BrandResponseDTO]:
+        return _BRANDS_ADAPTER.validate_python(self._get_payload()["brands"])
+
+    def invalidate(self) -> None:
+        """Drop loaded data and the snapshot file. Next access fetches the catalog from the API."""
+        path = self.snapshot_path()
+        with self._storage_lock:
+            self._payload = None
+            with file_lock(f"{path}.lock"):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def _get_payload(self) -> dict:
+        payload = self._payload
+        if payload is not None:
+            return payload
+
+        with self._storage_lock:
+            if self._payload is None:
+                self._payload = self._read_or_fetch()
+            return self._payload
+
+    def _read_or_fetch(self) -> dict:
+        if CFG.catalog_snapshot_ttl <= 0:
+            return self._fetch()
+
+        path = self.snapshot_path()
+        with file_lock(f"{path}.lock"):
+            payload = self._read(path)
+            if payload is None:
+                payload = self._fetch()
+                self._write(path, payload)
+            return payload
+
+    @staticmethod
+    def _fetch() -> dict:
+        products = (
+            ProductApiClient()
+            .send_get_all_products_request()
+            .check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_value("products")
+        )
+        brands = (
+            BrandApiClient()
+            .send_get_all_brands_request()
+            .check(
+                Conditions.status_code(HTTPStatus.OK),
+                Conditions.body_status_code(HTTPStatus.OK),
+            )
+            .extract()
+            .as_value("brands")
+        )
+        return {"products": products, "brands": brands}
+
+    @staticmethod
+    def _read(path: str) -> Optional[dict]:
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                snapshot = json.load(file)
+
+            age = time.time() - snapshot["created_at"]
+            if age > CFG.catalog_snapshot_ttl or age < 0:
+                logging.info(f"Catalog snapshot is expired: {path}")
+                return None
+            if snapshot["base_api_url"] != CFG.base_api_url:
+                return None
+            if snapshot["sha256"] != _hash(snapshot["payload"]):
+                logging.warning(f"Catalog snapshot is corrupted: {path}")
+                return None
+            return snapshot["payload"]
+        except Exception as ex:
+            logging.warning(f"Unable to read catalog snapshot: {path}. Exception: {ex}")
+            return None
+
+    @staticmethod
+    def _write(path: str, payload: dict) -> None:
+        snapshot = {
+            "created_at": time.time(),
+            "base_api_url": CFG.base_api_url,
+            "sha256": _hash(payload),
+            "payload": payload,
+        }
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(snapshot, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as ex:
+            logging.warning(f"Unable to save catalog snapshot: {path}. Exception: {ex}")
+
+
+def _hash(payload: dict) -> str:
+    content = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
@@ -1,14 +1,26 @@
+import copy
 import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from http.cookiejar import CookieJar
-from typing import Iterable, Dict, Optional
+from typing import Iterable, Dict, Generator, Optional
 
-from httpx import Cookies, Response
+from httpx import Cookies
 from httpx._types import CookieTypes
 
 from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
 
+_BOUND_JAR: ContextVar[Optional[CookieJar]] = ContextVar("bound_cookie_jar", default=None)
+
 
 class ThreadSafeCookieStore:
+    """
+    Per-test cookie jars.
+
+    The jar of the test is bound to the httpx clients of the test (see RestClient), so cookies
+    from responses and redirects land in it directly. Store methods are views over the jar.
+    """
+
     _instance: Optional["ThreadSafeCookieStore"] = None
     _lock = threading.Lock()
 
@@ -23,91 +35,101 @@ class ThreadSafeCookieStore:
     def _get_test_id(self) -> str:
         return ThreadSafeTestThreadsStore().current_thread_test_name()
 
-    def _ensure_test_bucket(self, test_id: str):
-        if test_id not in self._cookie_store:
-            self._cookie_store[test_id] = {}
+    def _find_jar(self) -> Optional[CookieJar]:
+        bound = _BOUND_JAR.get()
+        return bound if bound is not None else self._cookie_store.get(self._get_test_id())
 
-    def get_cookie(self, name: str) -> Optional[str]:
+    def get_jar(self) -> CookieJar:
+        """Cookie jar of the current test. Created on first access and kept for the whole test"""
+        bound = _BOUND_JAR.get()
+        if bound is not None:
+            return bound
         test_id = self._get_test_id()
-        bucket = self._cookie_store.get(test_id, {})
-        return bucket.get(name)
+        jar = self._cookie_store.get(test_id)
+        if jar is None:
+            with self._lock:
+                jar = self._cookie_store.setdefault(test_id, CookieJar())
+        return jar
+
+    @contextmanager
+    def use_jar_snapshot(self) -> Generator[CookieJar, None, None]:
+        """
+        Bind a copy of the test jar to the current context (and tasks created in it).
+        Concurrent requests send the cookies of the test, but their responses don't update
+        the test jar.
+        """
+        snapshot = CookieJar()
+        for cookie in self.get_jar():
+            snapshot.set_cookie(copy.copy(cookie))
+        token = _BOUND_JAR.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            _BOUND_JAR.reset(token)
+
+    def get_cookie(self, name: str) -> Optional[str]:
+        return self.get_test_cookies().get(name)
 
     def get_cookies(self, title: str, *titles: str) -> Dict[str, str]:
-        bucket = self._cookie_store.get(self._get_test_id(), {})
-        return {t: value for t, value in bucket.items() if t in {title, *titles}}
+        all_titles = {title, *titles}
+        return {t: value for t, value in self.get_test_cookies().items() if t in all_titles}
 
     def get_test_cookies(self) -> Dict[str, str]:
-        return dict(self._cookie_store.get(self._get_test_id(), {}))
+        return _as_dict(self._find_jar())
 
     def get_all_tests_cookies(self) -> Dict[str, Dict[str, str]]:
-        return {tid: dict(cookies) for tid, cookies in self._cookie_store.items()}
+        return {tid: _as_dict(jar) for tid, jar in list(self._cookie_store.items())}
 
     def add_or_update_cookie(self, name: str, value: str):
-        test_id = self._get_test_id()
-        with self._lock:
-            self._ensure_test_bucket(test_id)
-            self._cookie_store[test_id][name] = value
+        _set_cookie(self.get_jar(), name, value)
 
     def add_or_update_cookies(self, cookies: Dict[str, str]):
-        test_id = self._get_test_id()
-        with self._lock:
-            self._ensure_test_bucket(test_id)
-            for name, value in cookies.items():
-                self._cookie_store[test_id][name] = value
-
-    def update_from_response(self, response: Response):
+        jar = self.get_jar()
+        for name, value in cookies.items():
+            _set_cookie(jar, name, value)
 
-        def update(test_id: str, cookie_jar: CookieJar):
-            for c in cookie_jar:
-                self._cookie_store[test_id][c.name] = c.value
-
-        test_id = self._get_test_id()
-        with self._lock:
-            self._ensure_test_bucket(test_id)
+    def update_cookies(self, cookies: CookieTypes):
+        jar = self.get_jar()
 
-            # Save cookies if response has redirects
-            if response.history:
-                for h in response.history:
-                    if h.cookies:
-                        update(test_id, h.cookies.jar)
+        if isinstance(cookies, Cookies) or isinstance(cookies, dict):
+            for name, value in cookies.items():
+                _set_cookie(jar, name, value)
 
-            # Save final cookies
-            if response.cookies:
-                update(test_id, response.cookies.jar)
+        elif isinstance(cookies, CookieJar):
+            for c in cookies:
+                jar.set_cookie(c)
 
-    def update_cookies(self, cookies: CookieTypes):
-        test_id = self._get_test_id()
-        with self._lock:
-            self._ensure_test_bucket(test_id)
-
-            if isinstance(cookies, Cookies) or isinstance(cookies, dict):
-                for name, value in cookies.items():
-                    self._cookie_store[test_id][name] = value
-
-            elif isinstance(cookies, CookieJar):
-                for c in cookies:
-                    self._cookie_store[test_id][c.name] = c.value
-
-            elif isinstance(cookies, list):
-                for item in cookies:
-                    if not (isinstance(item, tuple) and len(item) == 2):
-                        raise ValueError(f"Unsupported list item: {item}")
-                    name, value = item
-                    self._cookie_store[test_id][name] = value
-            else:
-                raise TypeError(f"Unsupported cookies type: {type(cookies)}")
+        elif isinstance(cookies, list):
+            for item in cookies:
+                if not (isinstance(item, tuple) and len(item) == 2):
+                    raise ValueError(f"Unsupported list item: {item}")
+                name, value = item
+                _set_cookie(jar, name, value)
+        else:
+            raise TypeError(f"Unsupported cookies type: {type(cookies)}")
 
     def remove_cookies(self, names: Iterable[str]):
-        test_id = self._get_test_id()
-        with self._lock:
-            if test_id in self._cookie_store:
-                for name in names:
-                    self._cookie_store[test_id].pop(name, None)
+        jar = self._find_jar()
+        if jar is None:
+            return
+        names = set(names)
+        for c in [c for c in jar if c.name in names]:
+            jar.clear(c.domain, c.path, c.name)
 
     def clear_test_cookies(self):
-        with self._lock:
-            self._cookie_store[self._get_test_id()] = {}
+        # Keep the jar instance: it is shared with the test httpx clients
+        self.get_jar().clear()
+
+
+def _as_dict(jar: Optional[CookieJar]) -> Dict[str, str]:
+    return {c.name: c.value for c in jar} if jar is not None else {}
+
 
-    def export_as_httpx_cookies(self) -> Cookies:
-        cookie_dict = self._cookie_store.get(self._get_test_id(), {})
-        return Cookies(cookie_dict)
+def _set_cookie(jar: CookieJar, name: str, value: str) -> None:
+    """Replace value of existing cookies with the same name, otherwise add a host-less cookie"""
+    cookies = Cookies(jar)
+    existing = [c for c in jar if c.name == name]
+    if not existing:
+        cookies.set(name, value)
+    for c in existing:
+        cookies.set(name, value, domain=c.domain, path=c.path)
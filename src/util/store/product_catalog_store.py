@@ -0,0 +1,104 @@
+import threading
+from collections.abc import Callable, Iterable
+from types import MappingProxyType
+from typing import Optional
+
+from src.model.dto.product.product_response import ProductResponseDTO
+from src.model.enum.user_type import UserType
+
+
+class ProductCatalog:
+    """Immutable snapshot of `/productsList` with hash indexes by id, title, brand and category"""
+
+    def __init__(self, products: Iterable[ProductResponseDTO]):
+        self._products: tuple[ProductResponseDTO, ...] = tuple(products)
+
+        positions: dict[int, int] = {}
+        by_title: dict[str, ProductResponseDTO] = {}
+        by_brand: dict[str, list[ProductResponseDTO]] = {}
+        by_category: dict[tuple[UserType, str], list[ProductResponseDTO]] = {}
+
+        for position, product in enumerate(self._products):
+            positions.setdefault(product.id, position)
+            by_title.setdefault(product.name, product)
+            by_brand.setdefault(product.brand, []).append(product)
+            if product.category is not None:
+                key = (product.category.usertype.usertype, product.category.category)
+                by_category.setdefault(key, []).append(product)
+
+        self._positions = MappingProxyType(positions)
+        self._by_title = MappingProxyType(by_title)
+        self._by_brand = MappingProxyType({k: tuple(v) for k, v in by_brand.items()})
+        self._by_category = MappingProxyType(
+            {k: tuple(v) for k, v in by_category.items()}
+        )
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def all(self) -> tuple[ProductResponseDTO, ...]:
+        return self._products
+
+    def by_id(self, product_id: int) -> Optional[ProductResponseDTO]:
+        position = self._positions.get(product_id)
+        return None if position is None else self._products[position]
+
+    def by_ids(self, product_ids: Iterable[int]) -> tuple[ProductResponseDTO, ...]:
+        """Products with given ids in catalog order. Unknown ids are skipped."""
+        positions = {
+            self._positions[product_id]
+            for product_id in product_ids
+            if product_id in self._positions
+        }
+        return tuple(self._products[position] for position in sorted(positions))
+
+    def by_title(self, title: str) -> Optional[ProductResponseDTO]:
+        return self._by_title.get(title)
+
+    def by_brand(self, brand: str) -> tuple[ProductResponseDTO, ...]:
+        return self._by_brand.get(brand, ())
+
+    def by_category(
+        self, user_type: UserType, category: str
+    ) -> tuple[ProductResponseDTO, ...]:
+        return self._by_category.get((user_type, category), ())
+
+
+class ThreadSafeProductCatalogStore:
+    """Session-wide product catalog. Loaded on first access, reloaded after invalidate()."""
+
+    _instance: Optional["ThreadSafeProductCatalogStore"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._catalog = None
+                    cls._instance._storage_lock = threading.Lock()
+        return cls._instance
+
+    def get_catalog(
+        self, loader: Callable[[], Iterable[ProductResponseDTO]]
+    ) -> ProductCatalog:
+        catalog = self._catalog
+        if catalog is not None:
+            return catalog
+
+        with self._storage_lock:
+            if self._catalog is None:
+                self._catalog = ProductCatalog(loader())
+            return self._catalog
+
+    def refresh(
+        self, loader: Callable[[], Iterable[ProductResponseDTO]]
+    ) -> ProductCatalog:
+        catalog = ProductCatalog(loader())
+        with self._storage_lock:
+            self._catalog = catalog
+        return catalog
+
+    def invalidate(self) -> None:
+        with self._storage_lock:
+            self._catalog = None
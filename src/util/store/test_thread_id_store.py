@@ -1,49 +1,71 @@
+import contextvars
+import functools
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from typing import Callable, Generator, Optional, ParamSpec, TypeVar
 
 _GLOBAL_THREAD_TEST_NAME_KEY = "GLOBAL"
 
+_current_test_name: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_test_name", default=_GLOBAL_THREAD_TEST_NAME_KEY
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 class ThreadSafeTestThreadsStore:
-    """Thread-safe test threads storage"""
+    """
+    Current test name, kept in a ContextVar.
+
+    Lookup is lock-free. asyncio tasks inherit the name automatically, new threads start
+    in "GLOBAL" context. Work done in a pool for the test is submitted via `bind_context()`
+    (AttachmentWriter), long-lived workers serving all tests run in their own named context
+    via `test_context()` (UserPool, UserCleanupWorker).
+    """
 
     _instance = None
     _lock = threading.Lock()
-    _test_threads_store: dict[str, list[int]] = {}
-    _storage_lock = threading.RLock()
 
     def __new__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
 
-    def add_current_thread_to_test(self, test_name: str):
-        with self._storage_lock:
-            # REMOVE
-            if test_name == "":
-                print("EMPTY")
-            # END
-
-            if self._test_threads_store.get(test_name) is None:
-                self._test_threads_store[test_name] = []
-            thread_id = threading.get_ident()
-            if thread_id not in self._test_threads_store.keys():
-                self._test_threads_store[test_name].append(thread_id)
+    def add_current_thread_to_test(self, test_name: str) -> None:
+        """Bind current thread (context) to the test"""
+        _current_test_name.set(test_name or _GLOBAL_THREAD_TEST_NAME_KEY)
 
     def current_thread_test_name(self) -> Optional[str]:
-        thread_id = threading.get_ident()
-        with self._storage_lock:
-            for test_name, thread_ids in self._test_threads_store.items():
-                if (
-                    thread_id in thread_ids
-                    and test_name != _GLOBAL_THREAD_TEST_NAME_KEY
-                ):
-                    return test_name
-
-            return _GLOBAL_THREAD_TEST_NAME_KEY
+        return _current_test_name.get()
 
     def clear_test_threads(self, test_name: str) -> None:
-        with self._storage_lock:
-            if test_name in self._test_threads_store:
-                del self._test_threads_store[test_name]
+        if _current_test_name.get() == test_name:
+            _current_test_name.set(_GLOBAL_THREAD_TEST_NAME_KEY)
+
+    @staticmethod
+    @contextmanager
+    def test_context(test_name: str) -> Generator[None, None, None]:
+        """Bind the block to the test and restore the previous test name on exit"""
+        token = _current_test_name.set(test_name)
+        try:
+            yield
+        finally:
+            _current_test_name.reset(token)
+
+    @staticmethod
+    def bind_context(func: Callable[P, R]) -> Callable[P, R]:
+        """
+        Returns `func` bound to a copy of the current context.
+        Example: `executor.submit(ThreadSafeTestThreadsStore.bind_context(download), url)`
+        """
+        context = contextvars.copy_context()
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # A context can't be entered twice at once, so every call runs in its own copy
+            return context.copy().run(func, *args, **kwargs)
+
+        return wrapper
@@ -2,8 +2,10 @@ import logging
 import threading
 from typing import List, Optional
 
+from src.config.config import CFG
 from src.model.user import User
 from src.service.user_api_service import UserApiService
+from src.util.cleanup.user_cleanup_worker import UserCleanupWorker
 from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
 
 GLOBAL_USERS_KEY = "GLOBAL_USERS"
@@ -71,45 +73,56 @@ class ThreadSafeUserStore:
             return False
 
     def remove_test_users(self) -> None:
+        """
+        Removes current test users.
+        With USER_CLEANUP_ASYNC users are only enqueued for deletion.
+        """
         with self._storage_lock:
-            self._remove_users_from_backend(self.get_users())
-            if self._get_key() in self._users_store:
-                del self._users_store[self._get_key()]
+            users = list(self._users_store.pop(self._get_key(), {}).values())
+
+        if CFG.user_cleanup_async:
+            UserCleanupWorker().enqueue(users)
+        else:
+            self._remove_users_from_backend(users)
 
     def remove_all_tests_users(self) -> None:
+        """Removes all remaining users and waits until the background cleanup queue is drained."""
+        with self._storage_lock:
+            users = self.get_all_users_as_list()
+            self._users_store.clear()
+
+        if CFG.user_cleanup_async:
+            worker = UserCleanupWorker()
+            worker.enqueue(users)
+            self._report_not_removed_users(worker.flush())
+        else:
+            self._remove_users_from_backend(users)
+
+    def get_not_removed_users(self) -> List[User]:
         with self._storage_lock:
-            self._remove_users_from_backend(self.get_all_users_as_list())
-            try:
-                self._users_store.clear()
-            except KeyError:
-                logging.info(
-                    f"Failed to delete users. Thread key = [{self._get_key()}] not exists."
-                )
+            return list(self._not_removed_users)
 
     def _remove_users_from_backend(self, users: list[User]):
+        """Deletes users concurrently. Storage lock is not held while requests are in flight."""
+        if not users:
+            return
 
-        if users:
+        result = self._user_service.delete_users(users)
+        self._report_not_removed_users([item.item for item in result.failed])
 
-            for user in users:
+    def _report_not_removed_users(self, not_removed_users: list[User]) -> None:
+        if not not_removed_users:
+            return
 
-                try:
-                    self._user_service.delete_user(user.email, user.test_data.password)
-                except Exception:
-                    with self._storage_lock:
-                        self._not_removed_users.append(user)
-
-            with self._storage_lock:
-                if self._not_removed_users:
-                    users_credentials_text = [
-                        (
-                            f"Email = {user.email}, "
-                            f"password = [{user.password}], "
-                            f"test_data_password = [{user.test_data.password}]"
-                        )
-                        for user in self._not_removed_users
-                    ]
-
-                    logging.warning(
-                        "Failed to remove user(s):\n"
-                        + "\n".join(users_credentials_text)
-                    )
+        with self._storage_lock:
+            self._not_removed_users.extend(not_removed_users)
+
+        users_credentials_text = [
+            (
+                f"Email = {user.email}, "
+                f"password = [{user.password}], "
+                f"test_data_password = [{user.test_data.password}]"
+            )
+            for user in not_removed_users
+        ]
+        logging.warning("Failed to remove user(s):\n" + "\n".join(users_credentials_text))
@@ -1,6 +1,7 @@
 import copy
 import string
 from datetime import date, timedelta
+from functools import lru_cache
 from random import randint, choice
 from typing import List, Optional
 
@@ -8,6 +9,8 @@ from faker import Faker
 
 from src.config.config import CFG
 from src.ex.exception import ProductNotFoundError
+from src.mapper.brand_mapper import BrandMapper
+from src.mapper.product_mapper import ProductMapper
 from src.model.brand import Brand
 from src.model.card import CardInfo
 from src.model.contact import ContactInfo
@@ -19,9 +22,12 @@ from src.model.product_items_info import ProductItemsInfo
 from src.model.review import ReviewInfo
 from src.model.test_data import TestData
 from src.model.user import User
-from src.service.brand_api_service import BrandApiService
-from src.service.product_api_service import ProductApiService
 from src.util import system_util, collection_util
+from src.util.store.catalog_snapshot_store import ThreadSafeCatalogSnapshotStore
+from src.util.store.product_catalog_store import (
+    ProductCatalog,
+    ThreadSafeProductCatalogStore,
+)
 
 _FAKE = Faker()
 
@@ -49,16 +55,42 @@ _USER_TYPES_CATEGORIES = {
     UserType.KIDS: ["Dress", "Tops & Shirts"],
 }
 
-_BRANDS = BrandApiService().get_all_brands()
 
-_PRODUCT_SERVICE = ProductApiService()
-_PRODUCTS = _PRODUCT_SERVICE.get_all_products()
-_EXPECTED_PRODUCT = [
-    product for product in _PRODUCTS if product.id == CFG.expected_product_id
-][0]
-_EXPECTED_PRODUCTS = [
-    product for product in _PRODUCTS if product.id in CFG.expected_products_ids
-]
+def _brands() -> List[Brand]:
+    # Not cached here: the snapshot store keeps the payload until the catalog is invalidated
+    return [
+        BrandMapper.to_brand(brand)
+        for brand in ThreadSafeCatalogSnapshotStore().get_brands()
+    ]
+
+
+def _catalog() -> ProductCatalog:
+    return ThreadSafeProductCatalogStore().get_catalog(
+        ThreadSafeCatalogSnapshotStore().get_products
+    )
+
+
+@lru_cache(maxsize=1)
+def _catalog_products(catalog: ProductCatalog) -> List[Product]:
+    """Keyed by the catalog instance: a refreshed or invalidated catalog is mapped again"""
+    return ProductMapper.to_products(catalog.all())
+
+
+def _products() -> List[Product]:
+    return _catalog_products(_catalog())
+
+
+def _expected_product() -> Product:
+    product = _catalog().by_id(CFG.expected_product_id)
+    if product is None:
+        raise ProductNotFoundError(
+            f"Expected product with id = [{CFG.expected_product_id}] not found"
+        )
+    return ProductMapper.to_product(product)
+
+
+def _expected_products() -> List[Product]:
+    return ProductMapper.to_products(_catalog().by_ids(CFG.expected_products_ids))
 
 
 class DataGenerator:
@@ -260,30 +292,30 @@ class DataGenerator:
 
     @staticmethod
     def random_brand() -> Brand:
-        return choice(_BRANDS)
+        return choice(_brands())
 
     @staticmethod
     def random_brand_title() -> str:
-        return choice(_BRANDS).title
+        return choice(_brands()).title
 
     @staticmethod
     def brands() -> List[Brand]:
-        return _BRANDS
+        return _brands()
 
     @staticmethod
     def brand_titles() -> List[str]:
-        return [brand.title for brand in _BRANDS]
+        return [brand.title for brand in _brands()]
 
     @staticmethod
     def product(product_title: str) -> Product:
-        product = [p for p in _PRODUCTS if p.title == product_title][0]
+        product = [p for p in _products() if p.title == product_title][0]
         if not product:
             raise ProductNotFoundError(f"Not found product by title: {product_title}")
         return product
 
     @staticmethod
     def random_product():
-        return copy.deepcopy(choice(_PRODUCTS))
+        return copy.deepcopy(choice(_products()))
 
     @staticmethod
     def random_products(count: Optional[int] = None) -> List[Product]:
@@ -293,7 +325,7 @@ class DataGenerator:
             raise ValueError("Count must be greater than 0")
         else:
             products_count = count
-        return collection_util.get_random_unique_values(_PRODUCTS, products_count)
+        return collection_util.get_random_unique_values(_products(), products_count)
 
     @staticmethod
     def random_product_items_info(
@@ -320,7 +352,7 @@ class DataGenerator:
         recommended_product_title = choice(_RECOMMENDED_PRODUCTS)
         recommended_product = [
             product
-            for product in _PRODUCTS
+            for product in _products()
             if product.title == recommended_product_title
         ][0]
         return copy.deepcopy(recommended_product)
@@ -331,7 +363,7 @@ class DataGenerator:
 
     @staticmethod
     def expected_product() -> Product:
-        return copy.deepcopy(_EXPECTED_PRODUCT)
+        return copy.deepcopy(_expected_product())
 
     @staticmethod
     def expected_products_items_info() -> ProductItemsInfo:
@@ -343,7 +375,7 @@ class DataGenerator:
 
     @staticmethod
     def expected_products() -> List[Product]:
-        return copy.deepcopy(_EXPECTED_PRODUCTS)
+        return copy.deepcopy(_expected_products())
 
     @staticmethod
     def random_review() -> ReviewInfo:
@@ -0,0 +1,139 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import List, Optional
+
+from src.config.config import CFG
+from src.model.user import User
+from src.service.user_api_service import UserApiService
+from src.util.allure.allure_scope import suppress_allure
+from src.util.decorator.step_logger import step_log
+from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
+from src.util.test.data_generator import DataGenerator
+
+_REFILL_RETRY_DELAY = 1.0
+_CONTEXT_NAME = "USER_POOL"
+
+
+class UserPool:
+    """
+    Process-wide (one per xdist worker) pool of pre-created random users.
+
+    A background thread keeps USER_POOL_SIZE users ready, `lease()` hands one out without
+    any request. Leased users belong to the test: add them to ThreadSafeUserStore, so they
+    are deleted after the test. With USER_POOL_SIZE=0 `lease()` creates a user synchronously.
+    """
+
+    _instance: Optional["UserPool"] = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._available = deque()
+                    instance._condition = threading.Condition()
+                    instance._refill_needed = threading.Event()
+                    instance._stopped = False
+                    instance._thread = None
+                    instance._user_service = UserApiService()
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return CFG.user_pool_size > 0
+
+    def start(self) -> None:
+        """Starts background refill. Called on first lease, or earlier to prewarm the pool."""
+        if not self.is_enabled():
+            return
+
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped = False
+                self._thread = threading.Thread(
+                    target=self.__run, name="user-pool-refill", daemon=True
+                )
+                self._thread.start()
+        self._refill_needed.set()
+
+    def lease(self) -> User:
+        if self.is_enabled():
+            self.start()
+            with self._condition:
+                user = self._available.popleft() if self._available else None
+            self._refill_needed.set()
+
+            if user is not None:
+                with step_log.log(f"Lease user from pool: {user.email}"):
+                    return user
+
+        return self._user_service.create_user(DataGenerator.random_user())
+
+    def available(self) -> int:
+        with self._condition:
+            return len(self._available)
+
+    def wait_until_filled(self, timeout: float) -> bool:
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self._available) >= CFG.user_pool_size, timeout
+            )
+
+    def shutdown(self) -> List[User]:
+        """
+        Stops refilling and returns not leased users. They still exist on backend.
+        Waits for the refill in progress (bounded by HTTP timeouts): users it creates are
+        returned too, otherwise they would never be deleted.
+        """
+        with self._condition:
+            self._stopped = True
+            thread = self._thread
+        self._refill_needed.set()
+        if thread is not None:
+            thread.join()
+
+        with self._condition:
+            users = list(self._available)
+            self._available.clear()
+            return users
+
+    def __run(self) -> None:
+        # Own context: cookies of pool requests don't mix with session fixtures (GLOBAL)
+        with suppress_allure(), ThreadSafeTestThreadsStore.test_context(_CONTEXT_NAME):
+            while True:
+                self._refill_needed.wait()
+                self._refill_needed.clear()
+
+                with self._condition:
+                    if self._stopped:
+                        return
+                    deficit = CFG.user_pool_size - len(self._available)
+                if deficit <= 0:
+                    continue
+
+                try:
+                    result = self._user_service.create_users(
+                        [DataGenerator.random_user() for _ in range(deficit)]
+                    )
+                    created = [item.value for item in result.succeeded]
+                    errors = [item.error for item in result.failed]
+                except Exception as ex:
+                    created, errors = [], [ex]
+
+                with self._condition:
+                    # Kept even if stopped meanwhile: shutdown() returns them after join
+                    self._available.extend(created)
+                    self._condition.notify_all()
+                    if self._stopped:
+                        return
+
+                if errors:
+                    logging.warning(
+                        f"Failed to create [{len(errors)}] pool user(s): {errors[0]!r}"
+                    )
+                    time.sleep(_REFILL_RETRY_DELAY)
+                    self._refill_needed.set()
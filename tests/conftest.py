@@ -1,21 +1,30 @@
+import logging
 import os
+import shutil
 
 import allure
 import pytest
 
+from src.client.core.exchange_buffer import ExchangeBuffer, to_har
 from src.config.config import CFG
 from src.model.enum.github_issue_type import IssueType
 from src.service.github_api_service import GithubApiService
-from src.service.user_api_service import UserApiService
 from src.util import system_util
 from src.util.allure.allure_util import AllureUtil
+from src.util.allure.attachment_writer import AttachmentWriter
 from src.util.decorator.step_logger import step_log
+from src.util.profiler.step_profiler import StepProfiler
+from src.util.screenshot import screenshot_util
+from src.util.screenshot.baseline_cache import BaselineCache
+from src.util.store.auth_session_store import ThreadSafeAuthSessionStore
 from src.util.store.issue_store import ThreadSafeIssuesStore
 from src.util.store.test_thread_id_store import ThreadSafeTestThreadsStore
 from src.util.store.user_store import ThreadSafeUserStore
-from src.util.test.data_generator import DataGenerator
+from src.util.test.user_pool import UserPool
 
 _GLOBAL = "GLOBAL"
+_WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "master")
+_TEST_FAILED_KEY = pytest.StashKey[bool]()
 
 
 # ------------------------------
@@ -49,6 +58,98 @@ def pytest_collection_modifyitems(session, config, items):
             store.set_issue_state(issue_id, status)
 
 
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    # Controller (or the only process without xdist) clears results of the previous run
+    if StepProfiler.is_enabled() and _WORKER_ID == "master":
+        shutil.rmtree(StepProfiler.results_dir(), ignore_errors=True)
+
+
+def pytest_sessionfinish(session):
+    AttachmentWriter().flush()
+
+    baseline_cache_stats = BaselineCache().stats()
+    if baseline_cache_stats.hits or baseline_cache_stats.misses:
+        logging.info(f"Screenshot baseline cache: {baseline_cache_stats}")
+
+    profiler = StepProfiler()
+    if not profiler.is_enabled():
+        return
+
+    profiler.write_worker_summary(_WORKER_ID)
+    if _WORKER_ID == "master":
+        rows = profiler.write_run_summary()[: CFG.step_profiler_top]
+        logging.info(
+            "Slowest steps (total ms | count | avg ms | max ms):\n%s",
+            "\n".join(
+                f"{row['total_ms']:>12.1f} | {row['count']:>6} | {row['avg_ms']:>9.1f} | "
+                f"{row['max_ms']:>9.1f} | {row['category']}: {row['template']}"
+                for row in rows
+            ),
+        )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    if report.failed:
+        item.stash[_TEST_FAILED_KEY] = True
+    return report
+
+
+# trylast: runs inside allure wrapper, so attachments are written before the test result
+@pytest.hookimpl(wrapper=True, trylast=True)
+def pytest_runtest_protocol(item, nextitem):
+    StepProfiler().start_test(item.nodeid)
+    try:
+        return (yield)
+    finally:
+        _attach_http_exchanges(item)
+        AttachmentWriter().flush()
+        StepProfiler().finish_test(_WORKER_ID)
+
+
+def _attach_http_exchanges(item) -> None:
+    """API_ALLURE_ATTACH_MODE=on_failure: buffered exchanges of the test as a single HAR file"""
+    exchanges = ExchangeBuffer().pop(item.name)
+    if not exchanges or CFG.allure_attach_test_artifacts == "none":
+        return
+    if CFG.allure_attach_test_artifacts == "failed" and not item.stash.get(_TEST_FAILED_KEY, False):
+        return
+
+    AttachmentWriter().attach(
+        body=lambda: to_har(exchanges, CFG.api_log_max_body_size),
+        name=f"HTTP exchanges (last {len(exchanges)})",
+        attachment_type="application/json",
+        extension="har",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with StepProfiler().span(f"Setup fixture [{fixturedef.argname}]", category="fixture"):
+        return (yield)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    with StepProfiler().span("Test body", category="test"):
+        try:
+            result = yield
+        except BaseException:
+            # Diffs of deferred screenshot checks are attached, the test error is reported as is
+            screenshot_util.check_pending_screenshots(raise_on_mismatch=False)
+            raise
+        screenshot_util.check_pending_screenshots()
+        return result
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with StepProfiler().span("Teardown fixtures", category="fixture"):
+        return (yield)
+
+
 def pytest_runtest_setup(item):
     test_func = getattr(item, "function", None)
     if not test_func:
@@ -76,10 +177,16 @@ def pytest_runtest_setup(item):
 # -------------------------------
 @pytest.fixture(autouse=True, scope="session")
 @allure.title("All test fixtures")
-def all_tests_fixtures():
+def all_tests_fixtures(request):
 
     ThreadSafeTestThreadsStore().add_current_thread_to_test(_GLOBAL)
 
+    # ---------------------------------------------------------------------
+    # PREWARM USER POOL IF ANY TEST NEEDS RANDOM USER
+    # ---------------------------------------------------------------------
+    if any("create_user" in item.fixturenames for item in request.session.items):
+        UserPool().start()
+
     if os.getenv("ENV", "local") in ["local", "docker"]:
 
         # ---------------------------------------------------------------------
@@ -117,6 +224,7 @@ def all_tests_fixtures():
     # REMOVE USERS AFTER ALL TESTS
     # ---------------------------------------------------------------------
     with step_log.log("Remove users from backend after all tests"):
+        ThreadSafeUserStore().add_users(*UserPool().shutdown())
         ThreadSafeUserStore().remove_all_tests_users()
 
 
@@ -135,6 +243,11 @@ def each_test_fixtures(request):
     with step_log.log("Remove current test users from backend"):
         ThreadSafeUserStore().remove_test_users()
 
+    # ---------------------------------------------------------------------
+    # RELEASE CACHED AUTH SESSIONS FOR OTHER TESTS
+    # ---------------------------------------------------------------------
+    ThreadSafeAuthSessionStore().release()
+
     # ---------------------------------------------------------------------
     # CLEAR TEST THREADS IDENTITIES
     # ---------------------------------------------------------------------
@@ -145,10 +258,7 @@ def each_test_fixtures(request):
 @allure.title("Create random user by api")
 def create_user(request):
 
-    # Data
-    user = DataGenerator().random_user()
-
     # Precondition
-    user = UserApiService().create_user(user)
+    user = UserPool().lease()
     ThreadSafeUserStore().add_user(user)
     return user